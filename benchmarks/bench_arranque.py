@@ -0,0 +1,93 @@
+import argparse
+import compileall
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# módulos que el núcleo no debe arrastrar al importarse
+PROHIBIDOS = ("typing", "threading", "argparse", "numpy", "sqlite3", "asyncio", "json")
+
+def construir_instantanea(ruta: str, estudiantes: int, cursos: int, por_curso: int, evaluaciones: int):
+    from plataforma import Estudiante, Plataforma, Profesor
+    rnd = random.Random(3)
+    pl = Plataforma()
+    n_profesores = max(1, cursos // 4)
+    for p in range(n_profesores):
+        pl.registrar_usuario(Profesor(f"p{p}", f"Profesor {p}", f"p{p}@uni.edu", f"Dep{p % 10}"))
+    for e in range(estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e:06d}"))
+    inscrito = None
+    for c in range(cursos):
+        codigo = f"CUR{c}"
+        pl.crear_curso(f"Curso {c}", codigo, f"p{c % n_profesores}")
+        ids = [f"e{e}" for e in rnd.sample(range(estudiantes), min(por_curso, estudiantes))]
+        for estudiante_id in ids:
+            pl.inscribir_estudiante(codigo, estudiante_id)
+        for _ in range(evaluaciones):
+            ev = pl.crear_evaluacion(codigo, rnd.choice(("examen", "tarea")), "Eval", 100)
+            for estudiante_id in ids:
+                pl.registrar_calificacion(codigo, ev.id, estudiante_id, rnd.uniform(0, 100))
+        inscrito = (codigo, ids[0])
+    pl.guardar(ruta)
+    return inscrito
+
+def medir(comando, repeticiones: int) -> list:
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        subprocess.run(comando, cwd=RAIZ, check=True, stdout=subprocess.DEVNULL)
+        tiempos.append((time.perf_counter() - t0) * 1000)
+    return tiempos
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo de arranque: importación del paquete y consultas de un solo uso")
+    parser.add_argument("--estudiantes", type=int, default=5000)
+    parser.add_argument("--cursos", type=int, default=100)
+    parser.add_argument("--por-curso", type=int, default=100)
+    parser.add_argument("--evaluaciones", type=int, default=10)
+    parser.add_argument("--repeticiones", type=int, default=15)
+    parser.add_argument("--limite-ms", type=float, help="sale con 1 si la consulta de un solo uso supera este costo sobre el intérprete vacío")
+    args = parser.parse_args()
+
+    # con PYTHONDONTWRITEBYTECODE los hijos recompilarían en cada corrida
+    compileall.compile_dir(os.path.join(RAIZ, "plataforma"), quiet=1)
+    compileall.compile_file(os.path.join(RAIZ, "versionfinal.py"), quiet=1)
+    fallas = 0
+    salida = subprocess.run([sys.executable, "-c", f"import sys, plataforma; print(' '.join(m for m in {PROHIBIDOS!r} if m in sys.modules))"],
+                            cwd=RAIZ, check=True, capture_output=True, text=True).stdout.split()
+    if salida:
+        print("importar plataforma carga:", ", ".join(salida))
+        fallas += 1
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "plataforma.pltf")
+        codigo, estudiante_id = construir_instantanea(ruta, args.estudiantes, args.cursos, args.por_curso, args.evaluaciones)
+        casos = [
+            ("intérprete vacío", [sys.executable, "-c", "pass"]),
+            ("import plataforma", [sys.executable, "-c", "import plataforma"]),
+            ("import versionfinal", [sys.executable, "-c", "import versionfinal"]),
+            ("promedio (carga parcial)", [sys.executable, "-m", "plataforma", "--instantanea", ruta, "promedio", codigo, estudiante_id]),
+            ("expediente (carga completa)", [sys.executable, "-m", "plataforma", "--instantanea", ruta, "expediente", estudiante_id]),
+        ]
+        resultados = {nombre: medir(comando, args.repeticiones) for nombre, comando in casos}
+
+    base = statistics.median(resultados["intérprete vacío"])
+    print(f"{'caso':30s} {'mediana ms':>11s} {'mínimo ms':>10s} {'sobre base':>11s}")
+    for nombre, tiempos in resultados.items():
+        mediana = statistics.median(tiempos)
+        print(f"{nombre:30s} {mediana:>11.1f} {min(tiempos):>10.1f} {mediana - base:>+11.1f}")
+    extra = statistics.median(resultados["promedio (carga parcial)"]) - base
+    if args.limite_ms is not None and extra > args.limite_ms:
+        print(f"la consulta de un solo uso cuesta {extra:.1f} ms sobre el intérprete (límite {args.limite_ms:.1f} ms)")
+        fallas += 1
+    sys.exit(1 if fallas else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Plataforma
+from plataforma import csv_plataforma as cp
+
+def generar(directorio: str, estudiantes: int, cursos: int, evaluaciones: int, densidad: float, semilla: int = 1):
+    rnd = random.Random(semilla)
+    with open(os.path.join(directorio, "usuarios.csv"), "w", newline="", encoding="utf-8") as f:
+        f.write(",".join(cp.ENCABEZADO_USUARIOS) + "\n")
+        for p in range(max(1, cursos // 4)):
+            f.write(f"profesor,p{p},Profesor {p},p{p}@uni.edu,,Dep{p % 10}\n")
+        for e in range(estudiantes):
+            f.write(f"estudiante,e{e},Estudiante {e},e{e}@uni.edu,C{e:06d},\n")
+    n_prof = max(1, cursos // 4)
+    inscritos = {}
+    with open(os.path.join(directorio, "cursos.csv"), "w", newline="", encoding="utf-8") as fc, \
+         open(os.path.join(directorio, "inscripciones.csv"), "w", newline="", encoding="utf-8") as fi:
+        fc.write(",".join(cp.ENCABEZADO_CURSOS) + "\n")
+        fi.write(",".join(cp.ENCABEZADO_INSCRIPCIONES) + "\n")
+        por_curso = max(1, estudiantes * 5 // cursos)
+        for c in range(cursos):
+            fc.write(f"CUR{c},Curso {c},p{c % n_prof}\n")
+            inscritos[c] = rnd.sample(range(estudiantes), min(por_curso, estudiantes))
+            for e in inscritos[c]:
+                fi.write(f"CUR{c},e{e}\n")
+    id_eval = 0
+    with open(os.path.join(directorio, "evaluaciones.csv"), "w", newline="", encoding="utf-8") as fe, \
+         open(os.path.join(directorio, "calificaciones.csv"), "w", newline="", encoding="utf-8") as fg:
+        fe.write(",".join(cp.ENCABEZADO_EVALUACIONES) + "\n")
+        fg.write(",".join(cp.ENCABEZADO_CALIFICACIONES) + "\n")
+        for c in range(cursos):
+            for _ in range(evaluaciones):
+                id_eval += 1
+                tipo = rnd.choice(("examen", "tarea"))
+                fe.write(f"{id_eval},CUR{c},{tipo},Eval {id_eval},100,{rnd.choice((1, 2, 3))}\n")
+                for e in inscritos[c]:
+                    if rnd.random() < densidad:
+                        fg.write(f"CUR{c},{id_eval},e{e},{rnd.uniform(0, 100):.2f}\n")
+
+def contar_filas(ruta: str) -> int:
+    with open(ruta, encoding="utf-8") as f:
+        return sum(1 for _ in f) - 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Rendimiento de importación CSV (filas/s)")
+    parser.add_argument("--estudiantes", type=int, default=20000)
+    parser.add_argument("--cursos", type=int, default=400)
+    parser.add_argument("--evaluaciones", type=int, default=10)
+    parser.add_argument("--densidad", type=float, default=0.9)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        generar(directorio, args.estudiantes, args.cursos, args.evaluaciones, args.densidad)
+        pl = Plataforma()
+        ids_evaluacion = {}
+        pasos = [
+            ("usuarios.csv", lambda ruta: cp.importar_usuarios(pl, ruta)),
+            ("cursos.csv", lambda ruta: cp.importar_cursos(pl, ruta)),
+            ("inscripciones.csv", lambda ruta: cp.importar_inscripciones(pl, ruta)),
+            ("evaluaciones.csv", lambda ruta: cp.importar_evaluaciones(pl, ruta, ids_evaluacion)),
+            ("calificaciones.csv", lambda ruta: cp.importar_calificaciones(pl, ruta, ids_evaluacion)),
+        ]
+        total_filas = 0
+        total_tiempo = 0.0
+        for nombre, importar in pasos:
+            ruta = os.path.join(directorio, nombre)
+            filas = contar_filas(ruta)
+            t0 = time.perf_counter()
+            errores = importar(ruta)
+            dt = time.perf_counter() - t0
+            total_filas += filas
+            total_tiempo += dt
+            print(f"{nombre:20s} {filas:>10d} filas {dt:8.3f} s {filas / dt:>12.0f} filas/s errores={len(errores)}")
+        print(f"{'total':20s} {total_filas:>10d} filas {total_tiempo:8.3f} s {total_filas / total_tiempo:>12.0f} filas/s")
+
+        t0 = time.perf_counter()
+        escritas = cp.exportar_plataforma(pl, os.path.join(directorio, "export"))
+        dt = time.perf_counter() - t0
+        n = sum(escritas.values())
+        print(f"{'exportación':20s} {n:>10d} filas {dt:8.3f} s {n / dt:>12.0f} filas/s")
+
+if __name__ == "__main__":
+    main()
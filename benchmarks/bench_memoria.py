@@ -0,0 +1,81 @@
+import argparse
+import gc
+import os
+import random
+import subprocess
+import sys
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def medir(raiz: str, estudiantes: int, cursos: int, por_curso: int, evaluaciones: int, opciones: dict):
+    # versionfinal existe en todas las versiones del árbol: con --raiz apuntando
+    # a otro checkout (git worktree) se mide el código de antes con el mismo guion
+    sys.path.insert(0, raiz)
+    from versionfinal import Estudiante, Plataforma, Profesor
+    rnd = random.Random(11)
+    gc.collect()
+    tracemalloc.start()
+    pl = Plataforma(**opciones)
+    pl.registrar_usuario(Profesor("p", "Profesor", "p@uni.edu", "Dep"))
+    inicio = tracemalloc.get_traced_memory()[0]
+    for e in range(estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e:06d}"))
+    tras_estudiantes = tracemalloc.get_traced_memory()[0]
+
+    for c in range(cursos):
+        codigo = f"CUR{c}"
+        pl.crear_curso(f"Curso {c}", codigo, "p")
+        for e in rnd.sample(range(estudiantes), por_curso):
+            pl.inscribir_estudiante(codigo, f"e{e}")
+    ids = []
+    for c in range(cursos):
+        for _ in range(evaluaciones):
+            ids.append((f"CUR{c}", pl.crear_evaluacion(f"CUR{c}", rnd.choice(("examen", "tarea")), "Eval", 100).id))
+    tras_estructura = tracemalloc.get_traced_memory()[0]
+
+    n_calificaciones = 0
+    for codigo, id_eval in ids:
+        for est in pl.cursos[codigo].estudiantes:
+            # un id nuevo en cada llamada, como llega desde CSV o del servicio
+            pl.registrar_calificacion(codigo, id_eval, "e" + est.id[1:], rnd.randrange(100) + 0.5)
+            n_calificaciones += 1
+    # los acumuladores de promedio forman parte del costo de cada calificación
+    tras_calificaciones = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        'bytes_por_estudiante': (tras_estudiantes - inicio) / estudiantes,
+        'bytes_por_calificacion': (tras_calificaciones - tras_estructura) / n_calificaciones,
+        'calificaciones': n_calificaciones,
+        'total_mb': (tras_calificaciones - inicio) / 2 ** 20,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria por estudiante y por calificación (tracemalloc)")
+    parser.add_argument("--estudiantes", type=int, default=40000)
+    parser.add_argument("--cursos", type=int, default=400)
+    parser.add_argument("--por-curso", type=int, default=100)
+    parser.add_argument("--evaluaciones", type=int, default=10)
+    parser.add_argument("--modo", choices=("normal", "compacto"), help="mide solo este modo en el proceso actual")
+    parser.add_argument("--antes", metavar="RAIZ", help="checkout anterior a medir también, en modo normal")
+    parser.add_argument("--raiz", default=RAIZ, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.modo is None:
+        # cada medición en su propio proceso: el allocator no arrastra
+        # memoria de una a otra
+        mediciones = [("antes", args.antes, "normal")] if args.antes else []
+        mediciones += [("normal", RAIZ, "normal"), ("compacto", RAIZ, "compacto")]
+        for etiqueta, raiz, modo in mediciones:
+            print(f"{etiqueta:>9s}: ", end="", flush=True)
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--modo", modo, "--raiz", raiz,
+                            "--estudiantes", str(args.estudiantes), "--cursos", str(args.cursos),
+                            "--por-curso", str(args.por_curso), "--evaluaciones", str(args.evaluaciones)], check=True)
+        return
+    # solo el modo compacto pasa opciones: el código de antes no las conoce
+    opciones = {'compacto': True} if args.modo == "compacto" else {}
+    r = medir(args.raiz, args.estudiantes, args.cursos, args.por_curso, args.evaluaciones, opciones)
+    print(f"{r['bytes_por_estudiante']:7.1f} B/estudiante  {r['bytes_por_calificacion']:6.1f} B/calificación  "
+          f"({r['calificaciones']} calificaciones, {r['total_mb']:.1f} MB)")
+
+if __name__ == "__main__":
+    main()
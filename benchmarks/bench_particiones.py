@@ -0,0 +1,80 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+from plataforma.particiones import PlataformaParticionada
+
+def poblar(pl, args, particionada: bool):
+    # varios periodos con los mismos estudiantes; el último es el actual
+    rnd = random.Random(7)
+    for p in range(args.cursos):
+        pl.registrar_usuario(Profesor(f"p{p}", f"Profesor {p}", f"p{p}@uni.edu", f"Dep{p % 10}"))
+    for e in range(args.estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e:06d}"))
+    actuales = []
+    for t in range(args.periodos):
+        periodo = f"P{t}"
+        if particionada:
+            pl.abrir_periodo(periodo)
+            if t:
+                # el periodo anterior se cierra al abrir el siguiente
+                pl.congelar(f"P{t - 1}")
+        for c in range(args.cursos):
+            codigo = f"{periodo}-CUR{c}"
+            pl.crear_curso(f"Curso {c}", codigo, f"p{c}")
+            ids = [f"e{e}" for e in rnd.sample(range(args.estudiantes), args.por_curso)]
+            for estudiante_id in ids:
+                pl.inscribir_estudiante(codigo, estudiante_id)
+            for _ in range(args.evaluaciones):
+                ev = pl.crear_evaluacion(codigo, "tarea", "Eval", 100)
+                pl.registrar_calificaciones_lote(codigo, ev.id, [(i, rnd.uniform(0, 100)) for i in ids])
+                if t == args.periodos - 1:
+                    actuales.append((codigo, ev.id, ids))
+    return actuales
+
+def medir(nombre: str, crear, args):
+    gc.collect()
+    tracemalloc.start()
+    pl = crear()
+    actuales = poblar(pl, args, isinstance(pl, PlataformaParticionada))
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rnd = random.Random(1)
+    escrituras = [(codigo, id_eval, rnd.choice(ids), rnd.uniform(0, 100)) for codigo, id_eval, ids in rnd.choices(actuales, k=args.operaciones)]
+    t0 = time.perf_counter()
+    for codigo, id_eval, estudiante_id, puntos in escrituras:
+        pl.registrar_calificacion(codigo, id_eval, estudiante_id, puntos)
+    escritura_us = (time.perf_counter() - t0) / len(escrituras) * 1e6
+    consultas = [f"e{rnd.randrange(args.estudiantes)}" for _ in range(args.expedientes)]
+    t0 = time.perf_counter()
+    for estudiante_id in consultas:
+        pl.obtener_expediente(estudiante_id)
+    expediente_us = (time.perf_counter() - t0) / len(consultas) * 1e6
+    print(f"{nombre:14s} {memoria / 2 ** 20:10.1f} MB {escritura_us:12.2f} µs/calificación {expediente_us:12.1f} µs/expediente")
+
+def main():
+    parser = argparse.ArgumentParser(description="Plataforma única frente a particionada por periodo con periodos viejos congelados")
+    parser.add_argument("--periodos", type=int, default=6)
+    parser.add_argument("--estudiantes", type=int, default=5000)
+    parser.add_argument("--cursos", type=int, default=40, help="cursos por periodo")
+    parser.add_argument("--por-curso", type=int, default=100)
+    parser.add_argument("--evaluaciones", type=int, default=8)
+    parser.add_argument("--operaciones", type=int, default=50000, help="calificaciones del periodo actual a medir")
+    parser.add_argument("--expedientes", type=int, default=2000)
+    parser.add_argument("--max-abiertas", type=int, default=2)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directorio:
+        medir("única", Plataforma, args)
+        medir("particionada", lambda: PlataformaParticionada(directorio=directorio, max_abiertas=args.max_abiertas), args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+
+OPERACIONES = ("inscribir_estudiante", "crear_evaluacion", "registrar_calificacion", "obtener_promedio_estudiante_en_curso",
+               "reporte_estudiantes_promedio_bajo", "listar_profesores", "listar_cursos")
+
+def medir_periodo(args, semilla: int) -> dict:
+    # Arma un periodo sintético desde cero y mide cada operación sobre él;
+    # devuelve operación -> (cantidad de llamadas, segundos).
+    rnd = random.Random(semilla)
+    pl = Plataforma(instrumentar=args.instrumentar)
+    n_profesores = max(1, args.cursos // 4)
+    for p in range(n_profesores):
+        pl.registrar_usuario(Profesor(f"p{p}", f"Profesor {p}", f"p{p}@uni.edu", f"Dep{p % 10}"))
+    for e in range(args.estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e:06d}"))
+    codigos = [f"CUR{c}" for c in range(args.cursos)]
+    for c, codigo in enumerate(codigos):
+        pl.crear_curso(f"Curso {c}", codigo, f"p{c % n_profesores}", motor=args.motor)
+    por_curso = min(args.por_curso, args.estudiantes)
+    inscripciones = [(codigo, f"e{e}") for codigo in codigos for e in rnd.sample(range(args.estudiantes), por_curso)]
+    tiempos = {}
+
+    t0 = time.perf_counter()
+    for codigo, estudiante_id in inscripciones:
+        pl.inscribir_estudiante(codigo, estudiante_id)
+    tiempos["inscribir_estudiante"] = (len(inscripciones), time.perf_counter() - t0)
+
+    tipos = [rnd.choice(("examen", "tarea")) for _ in range(args.cursos * args.evaluaciones)]
+    pesos = [rnd.choice((1, 2, 3)) for _ in tipos]
+    evaluaciones = []
+    t0 = time.perf_counter()
+    for i, (tipo, peso) in enumerate(zip(tipos, pesos)):
+        codigo = codigos[i // args.evaluaciones]
+        evaluaciones.append((codigo, pl.crear_evaluacion(codigo, tipo, "Eval", 100, peso=peso).id))
+    tiempos["crear_evaluacion"] = (len(evaluaciones), time.perf_counter() - t0)
+
+    inscritos = {}
+    for codigo, estudiante_id in inscripciones:
+        inscritos.setdefault(codigo, []).append(estudiante_id)
+    calificaciones = [(codigo, id_eval, estudiante_id, rnd.uniform(0, 100))
+                      for codigo, id_eval in evaluaciones for estudiante_id in inscritos[codigo] if rnd.random() < args.densidad]
+    t0 = time.perf_counter()
+    for codigo, id_eval, estudiante_id, puntos in calificaciones:
+        pl.registrar_calificacion(codigo, id_eval, estudiante_id, puntos)
+    tiempos["registrar_calificacion"] = (len(calificaciones), time.perf_counter() - t0)
+
+    consultas = [rnd.choice(inscripciones) for _ in range(args.consultas)]
+    t0 = time.perf_counter()
+    for codigo, estudiante_id in consultas:
+        pl.obtener_promedio_estudiante_en_curso(codigo, estudiante_id)
+    tiempos["obtener_promedio_estudiante_en_curso"] = (len(consultas), time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for codigo in codigos:
+        pl.reporte_estudiantes_promedio_bajo(codigo, 60.0)
+    tiempos["reporte_estudiantes_promedio_bajo"] = (len(codigos), time.perf_counter() - t0)
+
+    for nombre, funcion in (("listar_profesores", pl.listar_profesores), ("listar_cursos", pl.listar_cursos)):
+        t0 = time.perf_counter()
+        for _ in range(args.listados):
+            funcion()
+        tiempos[nombre] = (args.listados, time.perf_counter() - t0)
+    return tiempos
+
+def ejecutar(args) -> dict:
+    muestras = {op: [] for op in OPERACIONES}
+    cantidades = {}
+    for _ in range(args.repeticiones):
+        for op, (n, segundos) in medir_periodo(args, args.semilla).items():
+            cantidades[op] = n
+            muestras[op].append(segundos / n * 1e6 if n else 0.0)
+    try:
+        import numpy
+        version_numpy = numpy.__version__
+    except ImportError:
+        version_numpy = None
+    return {
+        'version': 1,
+        'parametros': {'estudiantes': args.estudiantes, 'cursos': args.cursos, 'por_curso': args.por_curso,
+                       'evaluaciones': args.evaluaciones, 'densidad': args.densidad, 'motor': args.motor,
+                       'consultas': args.consultas, 'listados': args.listados, 'repeticiones': args.repeticiones,
+                       'semilla': args.semilla, 'instrumentar': args.instrumentar},
+        'entorno': {'python': platform.python_version(), 'implementacion': platform.python_implementation(),
+                    'sistema': platform.platform(), 'cpus': os.cpu_count(), 'numpy': version_numpy},
+        'resultados': {op: {'n': cantidades[op], 'mejor_us': min(muestras[op]), 'mediana_us': statistics.median(muestras[op])}
+                       for op in OPERACIONES},
+    }
+
+def imprimir(resultado: dict):
+    print(f"{'operación':38s} {'llamadas':>10s} {'mejor µs':>12s} {'mediana µs':>12s}")
+    for op, r in resultado['resultados'].items():
+        print(f"{op:38s} {r['n']:>10d} {r['mejor_us']:>12.3f} {r['mediana_us']:>12.3f}")
+
+def comparar(ruta_base: str, ruta_nueva: str, tolerancia: float) -> int:
+    with open(ruta_base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(ruta_nueva, encoding="utf-8") as f:
+        nueva = json.load(f)
+    if base['parametros'] != nueva['parametros']:
+        print("aviso: las corridas usan parámetros distintos; la comparación no es directa")
+    regresiones = 0
+    print(f"{'operación':38s} {'base µs':>12s} {'nueva µs':>12s} {'razón':>8s}")
+    for op, r in nueva['resultados'].items():
+        anterior = base['resultados'].get(op)
+        if anterior is None:
+            print(f"{op:38s} {'-':>12s} {r['mejor_us']:>12.3f} {'nueva':>8s}")
+            continue
+        razon = r['mejor_us'] / anterior['mejor_us'] if anterior['mejor_us'] else float("inf")
+        marca = ""
+        if razon > 1 + tolerancia:
+            marca = "  REGRESIÓN"
+            regresiones += 1
+        elif razon < 1 - tolerancia:
+            marca = "  mejora"
+        print(f"{op:38s} {anterior['mejor_us']:>12.3f} {r['mejor_us']:>12.3f} {razon:>7.2f}x{marca}")
+    print(f"{regresiones} regresiones (tolerancia {tolerancia:.0%})")
+    return 1 if regresiones else 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de las operaciones de Plataforma")
+    parser.add_argument("--estudiantes", type=int, default=5000)
+    parser.add_argument("--cursos", type=int, default=100)
+    parser.add_argument("--por-curso", type=int, default=100, help="estudiantes inscritos por curso")
+    parser.add_argument("--evaluaciones", type=int, default=10, help="evaluaciones por curso")
+    parser.add_argument("--densidad", type=float, default=0.9, help="fracción de inscritos calificados por evaluación")
+    parser.add_argument("--motor", default="dict", choices=("dict", "numpy"))
+    parser.add_argument("--consultas", type=int, default=20000, help="consultas de promedio individuales")
+    parser.add_argument("--listados", type=int, default=200, help="llamadas a cada listado")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--instrumentar", action="store_true", help="mide con las métricas de Plataforma activadas")
+    parser.add_argument("--salida", help="guarda los resultados en este archivo JSON")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "NUEVA"), help="compara dos corridas guardadas y sale con 1 si hay regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.10, help="aumento relativo permitido antes de marcar regresión")
+    args = parser.parse_args()
+
+    if args.comparar:
+        sys.exit(comparar(args.comparar[0], args.comparar[1], args.tolerancia))
+    resultado = ejecutar(args)
+    imprimir(resultado)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+
+def construir(cursos: int, estudiantes: int, por_curso: int, evaluaciones: int, motor: str, semilla: int = 7) -> Plataforma:
+    rnd = random.Random(semilla)
+    pl = Plataforma()
+    pl.registrar_usuario(Profesor("p", "Profesor", "p@uni.edu", "Dep"))
+    for e in range(estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e}"))
+    for c in range(cursos):
+        codigo = f"CUR{c}"
+        pl.crear_curso(f"Curso {c}", codigo, "p", motor=motor)
+        inscritos = [f"e{e}" for e in rnd.sample(range(estudiantes), por_curso)]
+        for est in inscritos:
+            pl.inscribir_estudiante(codigo, est)
+        for _ in range(evaluaciones):
+            ev = pl.crear_evaluacion(codigo, rnd.choice(("examen", "tarea")), "Eval", 100, peso=rnd.choice((1, 2, 3)))
+            pl.registrar_calificaciones_lote(codigo, ev.id, [(est, rnd.uniform(0, 100)) for est in inscritos])
+    return pl
+
+def main():
+    parser = argparse.ArgumentParser(description="Reporte global de promedios bajos: serie vs. procesos")
+    parser.add_argument("--cursos", type=int, default=2000)
+    parser.add_argument("--estudiantes", type=int, default=20000)
+    parser.add_argument("--por-curso", type=int, default=150)
+    parser.add_argument("--evaluaciones", type=int, default=10)
+    parser.add_argument("--motor", default="dict", choices=("dict", "numpy"))
+    parser.add_argument("--umbral", type=float, default=60.0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    pl = construir(args.cursos, args.estudiantes, args.por_curso, args.evaluaciones, args.motor)
+    print(f"plataforma construida en {time.perf_counter() - t0:.2f} s ({args.cursos} cursos, motor {args.motor})")
+
+    def medir(funcion):
+        mejor = float("inf")
+        for _ in range(args.repeticiones):
+            t = time.perf_counter()
+            resultado = funcion()
+            mejor = min(mejor, time.perf_counter() - t)
+        return mejor, resultado
+
+    serie, esperado = medir(lambda: {c: pl.reporte_estudiantes_promedio_bajo(c, args.umbral) for c in pl.cursos})
+    print(f"{'serie':>12s} {serie:8.3f} s")
+    cpus = os.cpu_count() or 1
+    procesos = sorted({p for p in (2, 4, 8, 16, cpus) if p <= cpus})
+    for p in procesos:
+        dt, resultado = medir(lambda: pl.reporte_global_promedio_bajo(args.umbral, procesos=p))
+        assert resultado == esperado, "El reporte paralelo difiere del serial"
+        print(f"{p:>3d} procesos {dt:8.3f} s  aceleración {serie / dt:5.2f}x")
+
+if __name__ == "__main__":
+    main()
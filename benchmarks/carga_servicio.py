@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+async def _llamar(lector, escritor, solicitudes):
+    for s in solicitudes:
+        escritor.write(json.dumps(s).encode("utf-8") + b"\n")
+    await escritor.drain()
+    respuestas = []
+    for _ in solicitudes:
+        respuestas.append(json.loads(await lector.readline()))
+    return respuestas
+
+async def preparar(host, puerto, cursos, estudiantes, evaluaciones):
+    lector, escritor = await asyncio.open_connection(host, puerto, limit=1 << 22)
+    solicitudes = [{"id": 0, "op": "registrar_profesor", "args": {"id": "p", "nombre": "P", "correo": "p@uni.edu", "departamento": "D"}}]
+    solicitudes += [{"id": 0, "op": "registrar_estudiante", "args": {"id": f"e{e}", "nombre": f"E{e}", "correo": f"e{e}@uni.edu", "carnet": f"C{e}"}}
+                    for e in range(estudiantes)]
+    for c in range(cursos):
+        solicitudes.append({"id": 0, "op": "crear_curso", "args": {"nombre": f"Curso {c}", "codigo": f"CUR{c}", "profesor_id": "p"}})
+        solicitudes += [{"id": 0, "op": "inscribir_estudiante", "args": {"codigo_curso": f"CUR{c}", "estudiante_id": f"e{e}"}}
+                        for e in range(estudiantes)]
+        solicitudes += [{"id": 0, "op": "crear_evaluacion", "args": {"codigo_curso": f"CUR{c}", "tipo": "examen", "titulo": "E", "max_puntos": 100}}
+                        for _ in range(evaluaciones)]
+    respuestas = await _llamar(lector, escritor, solicitudes)
+    escritor.close()
+    ids = {}
+    for s, r in zip(solicitudes, respuestas):
+        if s["op"] == "crear_evaluacion":
+            ids.setdefault(s["args"]["codigo_curso"], []).append(r["resultado"]["id"])
+    return ids
+
+async def cliente(host, puerto, ids, estudiantes, total, ventana, proporcion_reportes, latencias, semilla):
+    rnd = random.Random(semilla)
+    lector, escritor = await asyncio.open_connection(host, puerto, limit=1 << 22)
+    enviados = {}
+    siguiente = 0
+    # mantiene como máximo `ventana` solicitudes en vuelo
+    en_vuelo = asyncio.Semaphore(ventana)
+
+    async def recibir():
+        for _ in range(total):
+            r = json.loads(await lector.readline())
+            latencias.append(time.perf_counter() - enviados.pop(r["id"]))
+            en_vuelo.release()
+
+    receptor = asyncio.create_task(recibir())
+    cursos = list(ids)
+    while siguiente < total:
+        await en_vuelo.acquire()
+        codigo = rnd.choice(cursos)
+        x = rnd.random()
+        if x < proporcion_reportes:
+            s = {"op": "reporte_promedio_bajo", "args": {"codigo_curso": codigo, "umbral": 60}}
+        elif x < 0.5:
+            s = {"op": "promedio", "args": {"codigo_curso": codigo, "estudiante_id": f"e{rnd.randrange(estudiantes)}"}}
+        else:
+            s = {"op": "registrar_calificacion", "args": {"codigo_curso": codigo, "id_eval": rnd.choice(ids[codigo]),
+                                                          "estudiante_id": f"e{rnd.randrange(estudiantes)}", "puntos": rnd.uniform(0, 100)}}
+        s["id"] = siguiente
+        enviados[siguiente] = time.perf_counter()
+        escritor.write(json.dumps(s).encode("utf-8") + b"\n")
+        siguiente += 1
+        await escritor.drain()
+    await escritor.drain()
+    await receptor
+    escritor.close()
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(p / 100.0 * len(valores)))]
+
+async def _principal(args):
+    ids = await preparar(args.host, args.puerto, args.cursos, args.estudiantes, args.evaluaciones)
+    latencias = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(cliente(args.host, args.puerto, ids, args.estudiantes, args.solicitudes, args.ventana,
+                                   args.reportes, latencias, i) for i in range(args.conexiones)))
+    dt = time.perf_counter() - t0
+    n = len(latencias)
+    print(f"{n} solicitudes, {args.conexiones} conexiones, ventana {args.ventana}")
+    print(f"{n / dt:.0f} solicitudes/s")
+    print(f"p50 {percentil(latencias, 50) * 1000:.3f} ms  p99 {percentil(latencias, 99) * 1000:.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga para plataforma.servicio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--lanzar", action="store_true", help="inicia un servicio local en un subproceso")
+    parser.add_argument("--conexiones", type=int, default=8)
+    parser.add_argument("--solicitudes", type=int, default=5000, help="por conexión")
+    parser.add_argument("--ventana", type=int, default=32, help="solicitudes en vuelo por conexión")
+    parser.add_argument("--reportes", type=float, default=0.01, help="fracción de reportes de promedio bajo")
+    parser.add_argument("--cursos", type=int, default=20)
+    parser.add_argument("--estudiantes", type=int, default=300)
+    parser.add_argument("--evaluaciones", type=int, default=8)
+    args = parser.parse_args()
+
+    proceso = None
+    if args.lanzar:
+        proceso = subprocess.Popen([sys.executable, "-m", "plataforma.servicio", "--host", args.host, "--puerto", str(args.puerto)],
+                                   stdout=subprocess.PIPE, text=True, cwd=RAIZ)
+        proceso.stdout.readline()
+    try:
+        asyncio.run(_principal(args))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+if __name__ == "__main__":
+    main()
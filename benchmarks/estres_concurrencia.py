@@ -0,0 +1,107 @@
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de estrés multihilo de Plataforma(concurrente=True)")
+    parser.add_argument("--cursos", type=int, default=8)
+    parser.add_argument("--estudiantes", type=int, default=200)
+    parser.add_argument("--evaluaciones", type=int, default=6)
+    parser.add_argument("--escritores", type=int, default=8)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--creadores", type=int, default=4)
+    args = parser.parse_args()
+
+    pl = Plataforma(concurrente=True)
+    pl.registrar_usuario(Profesor("p", "Profesor", "p@uni.edu", "Dep"))
+    for e in range(args.estudiantes):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e}"))
+    cursos = [f"CUR{c}" for c in range(args.cursos)]
+    for codigo in cursos:
+        pl.crear_curso(codigo, codigo, "p")
+
+    # inscripciones y evaluaciones concurrentes: los IDs no deben repetirse
+    ids_creados = []
+    candado_ids = threading.Lock()
+
+    def crear(indice):
+        propios = []
+        for codigo in cursos:
+            for e in range(indice, args.estudiantes, args.creadores):
+                pl.inscribir_estudiante(codigo, f"e{e}")
+            for _ in range(args.evaluaciones):
+                ev = pl.crear_evaluacion(codigo, random.choice(("examen", "tarea")), "Eval", 100, peso=random.choice((1, 2, 3)))
+                propios.append((codigo, ev.id))
+        with candado_ids:
+            ids_creados.extend(propios)
+
+    hilos = [threading.Thread(target=crear, args=(i,)) for i in range(args.creadores)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    ids = [i for _, i in ids_creados]
+    assert len(ids) == len(set(ids)), "IDs de evaluación duplicados"
+    assert pl.next_eval_id == len(ids) + 1, "Se perdieron asignaciones de ID"
+    for codigo in cursos:
+        assert len(pl.cursos[codigo].estudiantes) == args.estudiantes, "Inscripciones perdidas"
+
+    # cada escritor califica un subconjunto disjunto de (evaluación, estudiante)
+    tareas = [(codigo, id_eval, f"e{e}") for codigo, id_eval in ids_creados for e in range(args.estudiantes)]
+    random.shuffle(tareas)
+    esperado = {(id_eval, est): float(random.randrange(101)) for _, id_eval, est in tareas}
+    detener = threading.Event()
+    lecturas = [0] * args.lectores
+
+    def escribir(indice):
+        for codigo, id_eval, est in tareas[indice::args.escritores]:
+            pl.registrar_calificacion(codigo, id_eval, est, esperado[(id_eval, est)])
+
+    def leer(indice):
+        rnd = random.Random(indice)
+        while not detener.is_set():
+            codigo = rnd.choice(cursos)
+            pl.obtener_promedio_estudiante_en_curso(codigo, f"e{rnd.randrange(args.estudiantes)}")
+            pl.reporte_estudiantes_promedio_bajo(codigo, 50)
+            lecturas[indice] += 1
+
+    lectores = [threading.Thread(target=leer, args=(i,)) for i in range(args.lectores)]
+    escritores = [threading.Thread(target=escribir, args=(i,)) for i in range(args.escritores)]
+    t0 = time.perf_counter()
+    for h in lectores + escritores:
+        h.start()
+    for h in escritores:
+        h.join()
+    dt = time.perf_counter() - t0
+    detener.set()
+    for h in lectores:
+        h.join()
+
+    perdidas = 0
+    for codigo, id_eval in ids_creados:
+        ev = pl.cursos[codigo].obtener_evaluacion(id_eval)
+        for e in range(args.estudiantes):
+            if ev.calificaciones.get(f"e{e}") != esperado[(id_eval, f"e{e}")]:
+                perdidas += 1
+    assert perdidas == 0, f"{perdidas} calificaciones perdidas"
+    for codigo in cursos:
+        curso = pl.cursos[codigo]
+        for e in range(args.estudiantes):
+            suma_ponderada = suma_pesos = 0.0
+            for ev in curso.evaluaciones:
+                suma_ponderada += ev.obtener_porcentaje(f"e{e}") * ev.peso
+                suma_pesos += ev.peso
+            assert abs(curso.obtener_promedio_estudiante(f"e{e}") - suma_ponderada / suma_pesos) < 1e-9, "Promedio inconsistente"
+
+    print(f"{len(tareas)} calificaciones en {dt:.3f} s ({len(tareas) / dt:.0f}/s), {sum(lecturas)} lecturas concurrentes")
+    print(f"{len(ids)} evaluaciones sin IDs duplicados; sin calificaciones perdidas")
+
+if __name__ == "__main__":
+    main()
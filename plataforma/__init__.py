@@ -0,0 +1,5 @@
+# Paquete de la plataforma académica. El núcleo (modelo y Plataforma) se
+# importa siempre; los motores opcionales, la persistencia, el servicio y el
+# menú interactivo se cargan recién cuando se usan.
+from .modelo import Curso, Estudiante, Evaluacion, Examen, Profesor, Tarea, Usuario
+from .nucleo import Plataforma
@@ -0,0 +1,57 @@
+import sys
+
+from .nucleo import Plataforma
+
+# python -m plataforma [--instantanea RUTA] [comando ...]
+#
+# Sin comando abre el menú interactivo. Los comandos de un solo uso leen una
+# instantánea ya construida y cargan solo lo que necesitan; los argumentos se
+# leen a mano porque importar argparse cuesta más que todo el modelo.
+USO = """uso: python -m plataforma [--instantanea RUTA] [comando]
+comandos (requieren --instantanea):
+  promedio CURSO ESTUDIANTE   promedio del estudiante en el curso
+  reporte CURSO UMBRAL        estudiantes del curso con promedio bajo el umbral (%)
+  expediente ESTUDIANTE       cursos y promedio general del estudiante"""
+
+def _promedio(ruta: str, codigo: str, estudiante_id: str):
+    prom = Plataforma.cargar(ruta, cursos=[codigo]).obtener_promedio_estudiante_en_curso(codigo, estudiante_id)
+    print("Sin calificaciones registradas." if prom is None else f"Promedio: {round(prom, 2)}%")
+
+def _reporte(ruta: str, codigo: str, umbral: str):
+    rep = Plataforma.cargar(ruta, cursos=[codigo]).reporte_estudiantes_promedio_bajo(codigo, float(umbral))
+    if not rep:
+        print("Ningún estudiante debajo del umbral.")
+    for r in rep:
+        print(r)
+
+def _expediente(ruta: str, estudiante_id: str):
+    expediente = Plataforma.cargar(ruta).obtener_expediente(estudiante_id)
+    for c in expediente['cursos']:
+        print(f"{c['codigo']}: {c['nombre']} ({c['creditos']} créditos) promedio {c['promedio']}")
+    print(f"Promedio general: {expediente['promedio_general']}")
+
+COMANDOS = {"promedio": (_promedio, 2), "reporte": (_reporte, 2), "expediente": (_expediente, 1)}
+
+def main(argv=None) -> int:
+    args = sys.argv[1:] if argv is None else list(argv)
+    ruta = None
+    if args[:1] == ["--instantanea"] and len(args) >= 2:
+        ruta = args[1]
+        args = args[2:]
+    if not args:
+        from .cli import main as menu
+        menu(Plataforma.cargar(ruta) if ruta else None)
+        return 0
+    comando = COMANDOS.get(args[0])
+    if comando is None or ruta is None or len(args) - 1 != comando[1]:
+        print(USO, file=sys.stderr)
+        return 2
+    try:
+        comando[0](ruta, *args[1:])
+    except ValueError as e:
+        print("Error:", e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+from typing import Optional
+
+from .modelo import Estudiante, Profesor
+from .nucleo import Plataforma
+
+def main(pl: Optional[Plataforma] = None):
+    if pl is None:
+        pl = Plataforma()
+    while True:
+        print("\nMenú")
+        print("1. Registrar profesor")
+        print("2. Registrar estudiante")
+        print("3. Crear curso")
+        print("4. Inscribir estudiante en curso")
+        print("5. Crear evaluación")
+        print("6. Registrar calificación")
+        print("7. Ver promedio de estudiante")
+        print("8. Reporte de promedios bajos")
+        print("9. Salir")
+        print("10. Ver profesores registrados")
+        print("11. Ver cursos registrados")
+        op = input("Elige una opción: ")
+
+        try:
+            if op == "1":
+                idu = input("ID profesor: ")
+                nom = input("Nombre: ")
+                cor = input("Correo: ")
+                dep = input("Departamento: ")
+                pl.registrar_usuario(Profesor(idu, nom, cor, dep))
+                print("Profesor registrado.")
+            elif op == "2":
+                idu = input("ID estudiante: ")
+                nom = input("Nombre: ")
+                cor = input("Correo: ")
+                car = input("Carnet: ")
+                pl.registrar_usuario(Estudiante(idu, nom, cor, car))
+                print("Estudiante registrado.")
+            elif op == "3":
+                nom = input("Nombre curso: ")
+                cod = input("Código curso: ")
+                prof = input("ID profesor: ")
+                pl.crear_curso(nom, cod, prof)
+                print("Curso creado.")
+            elif op == "4":
+                cod = input("Código curso: ")
+                est = input("ID estudiante: ")
+                pl.inscribir_estudiante(cod, est)
+                print("Estudiante inscrito.")
+            elif op == "5":
+                cod = input("Código curso: ")
+                tipo = input("Tipo (examen/tarea): ")
+                tit = input("Título: ")
+                maxp = float(input("Puntos máximos: "))
+                peso = float(input("Peso: "))
+                ev = pl.crear_evaluacion(cod, tipo, tit, maxp, peso=peso)
+                print(f"Evaluación creada con ID {ev.id}")
+            elif op == "6":
+                cod = input("Código curso: ")
+                ide = int(input("ID evaluación: "))
+                est = input("ID estudiante: ")
+                pts = float(input("Puntos obtenidos: "))
+                pl.registrar_calificacion(cod, ide, est, pts)
+                print("Calificación registrada.")
+            elif op == "7":
+                cod = input("Código curso: ")
+                est = input("ID estudiante: ")
+                prom = pl.obtener_promedio_estudiante_en_curso(cod, est)
+                if prom is None:
+                    print("Sin calificaciones registradas.")
+                else:
+                    print(f"Promedio: {round(prom,2)}%")
+            elif op == "8":
+                cod = input("Código curso: ")
+                umb = float(input("Umbral (%): "))
+                rep = pl.reporte_estudiantes_promedio_bajo(cod, umb)
+                if not rep:
+                    print("Ningún estudiante debajo del umbral.")
+                else:
+                    for r in rep:
+                        print(r)
+            elif op == "9":
+                break
+            elif op == "10":
+                dep = input("Departamento (vacío para todos): ").strip() or None
+                pagina = pl.pagina_profesores(departamento=dep)
+                if not pagina['elementos']:
+                    print("No hay profesores registrados.")
+                while pagina['elementos']:
+                    for p in pagina['elementos']:
+                        print(f"ID: {p.id}, Nombre: {p.nombre}, Correo: {p.email}, Dep: {p.departamento}")
+                    if pagina['siguiente'] is None or input("Enter para ver más, q para volver: ").strip().lower() == "q":
+                        break
+                    pagina = pl.pagina_profesores(departamento=dep, cursor=pagina['siguiente'])
+            elif op == "11":
+                prof_id = input("ID del profesor (vacío para todos): ").strip() or None
+                pagina = pl.pagina_cursos(profesor_id=prof_id)
+                if not pagina['elementos']:
+                    print("No hay cursos registrados.")
+                while pagina['elementos']:
+                    for c in pagina['elementos']:
+                        print(f"Código: {c.codigo}, Nombre: {c.nombre}, Profesor: {c.profesor.nombre}")
+                    if pagina['siguiente'] is None or input("Enter para ver más, q para volver: ").strip().lower() == "q":
+                        break
+                    pagina = pl.pagina_cursos(profesor_id=prof_id, cursor=pagina['siguiente'])
+            else:
+                print("Opción inválida.")
+        except Exception as e:
+            print("Error:", e)
@@ -0,0 +1,52 @@
+import threading
+from contextlib import contextmanager
+
+class CandadoLectoresEscritor:
+    # Varios lectores a la vez o un solo escritor; un escritor en espera
+    # bloquea a los lectores nuevos para no quedar postergado indefinidamente.
+    def __init__(self):
+        self._condicion = threading.Condition(threading.Lock())
+        self._lectores = 0
+        self._escribiendo = False
+        self._escritores_esperando = 0
+
+    def adquirir_lectura(self):
+        with self._condicion:
+            while self._escribiendo or self._escritores_esperando:
+                self._condicion.wait()
+            self._lectores += 1
+
+    def liberar_lectura(self):
+        with self._condicion:
+            self._lectores -= 1
+            if self._lectores == 0:
+                self._condicion.notify_all()
+
+    def adquirir_escritura(self):
+        with self._condicion:
+            self._escritores_esperando += 1
+            while self._escribiendo or self._lectores:
+                self._condicion.wait()
+            self._escritores_esperando -= 1
+            self._escribiendo = True
+
+    def liberar_escritura(self):
+        with self._condicion:
+            self._escribiendo = False
+            self._condicion.notify_all()
+
+    @contextmanager
+    def lectura(self):
+        self.adquirir_lectura()
+        try:
+            yield
+        finally:
+            self.liberar_lectura()
+
+    @contextmanager
+    def escritura(self):
+        self.adquirir_escritura()
+        try:
+            yield
+        finally:
+            self.liberar_escritura()
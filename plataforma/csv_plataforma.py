@@ -0,0 +1,234 @@
+import csv
+import os
+from itertools import groupby
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .modelo import Estudiante, Profesor, Usuario
+from .nucleo import Plataforma
+
+ENCABEZADO_USUARIOS = ["tipo", "id", "nombre", "correo", "carnet", "departamento"]
+ENCABEZADO_CURSOS = ["codigo", "nombre", "profesor_id", "creditos"]
+ENCABEZADO_CURSOS_V1 = ["codigo", "nombre", "profesor_id"]
+ENCABEZADO_INSCRIPCIONES = ["codigo_curso", "estudiante_id"]
+ENCABEZADO_EVALUACIONES = ["id", "codigo_curso", "tipo", "titulo", "max_puntos", "peso"]
+ENCABEZADO_CALIFICACIONES = ["codigo_curso", "id_eval", "estudiante_id", "puntos"]
+
+def _leer_filas(ruta: str, *encabezados: List[str]) -> Iterator[Tuple[int, List[str]]]:
+    with open(ruta, newline="", encoding="utf-8") as f:
+        lector = csv.reader(f)
+        primera = next(lector, None)
+        if primera is None:
+            return
+        if primera not in encabezados:
+            raise ValueError(f"Encabezado inválido en {ruta}")
+        for fila in lector:
+            if fila:
+                yield lector.line_num, fila
+
+def _escribir_filas(ruta: str, encabezado: List[str], filas) -> int:
+    n = 0
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(encabezado)
+        for fila in filas:
+            escritor.writerow(fila)
+            n += 1
+    return n
+
+# Lectores: generadores que no cargan el archivo completo. Con una lista de
+# errores, las filas mal formadas se anotan ahí y se saltan; sin ella, abortan.
+
+def _columnas(fila: List[str], *cantidades: int):
+    if len(fila) not in cantidades:
+        raise ValueError("Fila inválida: cantidad de columnas incorrecta")
+
+def _numero(convertir, texto: str):
+    try:
+        return convertir(texto)
+    except ValueError:
+        raise ValueError(f"Valor numérico inválido: {texto!r}") from None
+
+def _leer(ruta: str, encabezados, convertir, columna_id: int, errores: Optional[List[Dict]]) -> Iterator[Tuple]:
+    for linea, fila in _leer_filas(ruta, *encabezados):
+        try:
+            valores = convertir(fila)
+        except ValueError as e:
+            if errores is None:
+                raise ValueError(f"{e} en línea {linea}") from None
+            errores.append({'fila': linea, 'id': fila[columna_id] if len(fila) > columna_id else None, 'error': str(e)})
+            continue
+        yield (linea,) + valores
+
+def _usuario(fila: List[str]) -> Tuple[Usuario]:
+    _columnas(fila, 6)
+    tipo, idu, nombre, correo, carnet, departamento = fila
+    if tipo == "profesor":
+        return (Profesor(idu, nombre, correo, departamento),)
+    if tipo == "estudiante":
+        return (Estudiante(idu, nombre, correo, carnet),)
+    if tipo == "usuario":
+        return (Usuario(idu, nombre, correo),)
+    raise ValueError("Tipo de usuario desconocido")
+
+def _curso(fila: List[str]) -> Tuple[str, str, str, float]:
+    _columnas(fila, 3, 4)
+    codigo, nombre, profesor_id, *creditos = fila
+    return codigo, nombre, profesor_id, _numero(float, creditos[0]) if creditos else 1.0
+
+def _inscripcion(fila: List[str]) -> Tuple[str, str]:
+    _columnas(fila, 2)
+    return tuple(fila)
+
+def _evaluacion(fila: List[str]) -> Tuple[int, str, str, str, float, float]:
+    _columnas(fila, 6)
+    id_eval, codigo_curso, tipo, titulo, max_puntos, peso = fila
+    return _numero(int, id_eval), codigo_curso, tipo, titulo, _numero(float, max_puntos), _numero(float, peso)
+
+def _calificacion(fila: List[str]) -> Tuple[str, int, str, str]:
+    _columnas(fila, 4)
+    codigo_curso, id_eval, estudiante_id, puntos = fila
+    return codigo_curso, _numero(int, id_eval), estudiante_id, puntos
+
+def leer_usuarios(ruta: str, errores: Optional[List[Dict]] = None) -> Iterator[Tuple[int, Usuario]]:
+    return _leer(ruta, (ENCABEZADO_USUARIOS,), _usuario, 1, errores)
+
+def leer_cursos(ruta: str, errores: Optional[List[Dict]] = None) -> Iterator[Tuple[int, str, str, str, float]]:
+    return _leer(ruta, (ENCABEZADO_CURSOS, ENCABEZADO_CURSOS_V1), _curso, 0, errores)
+
+def leer_inscripciones(ruta: str, errores: Optional[List[Dict]] = None) -> Iterator[Tuple[int, str, str]]:
+    return _leer(ruta, (ENCABEZADO_INSCRIPCIONES,), _inscripcion, 1, errores)
+
+def leer_evaluaciones(ruta: str, errores: Optional[List[Dict]] = None) -> Iterator[Tuple[int, int, str, str, str, float, float]]:
+    return _leer(ruta, (ENCABEZADO_EVALUACIONES,), _evaluacion, 0, errores)
+
+def leer_calificaciones(ruta: str, errores: Optional[List[Dict]] = None) -> Iterator[Tuple[int, str, int, str, str]]:
+    return _leer(ruta, (ENCABEZADO_CALIFICACIONES,), _calificacion, 2, errores)
+
+# Importación: cada fila pasa por las validaciones de Plataforma
+
+def importar_usuarios(pl: Plataforma, ruta: str) -> List[Dict]:
+    errores = []
+    for linea, usuario in leer_usuarios(ruta, errores):
+        try:
+            pl.registrar_usuario(usuario)
+        except ValueError as e:
+            errores.append({'fila': linea, 'id': usuario.id, 'error': str(e)})
+    return errores
+
+def importar_cursos(pl: Plataforma, ruta: str) -> List[Dict]:
+    errores = []
+    for linea, codigo, nombre, profesor_id, creditos in leer_cursos(ruta, errores):
+        try:
+            pl.crear_curso(nombre, codigo, profesor_id, creditos=creditos)
+        except ValueError as e:
+            errores.append({'fila': linea, 'id': codigo, 'error': str(e)})
+    return errores
+
+def importar_inscripciones(pl: Plataforma, ruta: str) -> List[Dict]:
+    errores = []
+    for linea, codigo_curso, estudiante_id in leer_inscripciones(ruta, errores):
+        try:
+            pl.inscribir_estudiante(codigo_curso, estudiante_id)
+        except ValueError as e:
+            errores.append({'fila': linea, 'id': estudiante_id, 'error': str(e)})
+    return errores
+
+def importar_evaluaciones(pl: Plataforma, ruta: str, ids_evaluacion: Dict[int, int]) -> List[Dict]:
+    # la plataforma asigna IDs nuevos; ids_evaluacion traduce los del archivo
+    errores = []
+    for linea, id_eval, codigo_curso, tipo, titulo, max_puntos, peso in leer_evaluaciones(ruta, errores):
+        try:
+            ev = pl.crear_evaluacion(codigo_curso, tipo, titulo, max_puntos, peso=peso)
+        except ValueError as e:
+            errores.append({'fila': linea, 'id': id_eval, 'error': str(e)})
+            continue
+        ids_evaluacion[id_eval] = ev.id
+    return errores
+
+def importar_calificaciones(pl: Plataforma, ruta: str, ids_evaluacion: Dict[int, int] = None, tamano_lote: int = 10000) -> List[Dict]:
+    errores = []
+
+    def aplicar(codigo_curso, id_eval, lote):
+        try:
+            errores_lote = pl.registrar_calificaciones_lote(codigo_curso, id_eval, [(e, p) for _, e, p in lote])
+        except ValueError as e:
+            errores.extend({'fila': linea, 'id': est, 'error': str(e)} for linea, est, _ in lote)
+            return
+        if not errores_lote:
+            return
+        malas = {err['fila'] for err in errores_lote}
+        for err in errores_lote:
+            errores.append({'fila': lote[err['fila']][0], 'id': err['id'], 'error': err['error']})
+        pl.registrar_calificaciones_lote(codigo_curso, id_eval, [(e, p) for i, (_, e, p) in enumerate(lote) if i not in malas])
+
+    filas = leer_calificaciones(ruta, errores)
+    for (codigo_curso, id_eval), grupo in groupby(filas, key=lambda f: (f[1], f[2])):
+        if ids_evaluacion is not None:
+            if id_eval not in ids_evaluacion:
+                errores.extend({'fila': f[0], 'id': f[3], 'error': "Evaluación no encontrada en el curso"} for f in grupo)
+                continue
+            id_eval = ids_evaluacion[id_eval]
+        lote = []
+        for linea, _, _, estudiante_id, puntos in grupo:
+            lote.append((linea, estudiante_id, puntos))
+            if len(lote) >= tamano_lote:
+                aplicar(codigo_curso, id_eval, lote)
+                lote = []
+        if lote:
+            aplicar(codigo_curso, id_eval, lote)
+    return errores
+
+# Exportación
+
+def escribir_usuarios(pl: Plataforma, ruta: str) -> int:
+    def filas():
+        for u in pl.usuarios.values():
+            if isinstance(u, Profesor):
+                yield ("profesor", u.id, u.nombre, u.email, "", u.departamento)
+            elif isinstance(u, Estudiante):
+                yield ("estudiante", u.id, u.nombre, u.email, u.carnet, "")
+            else:
+                yield ("usuario", u.id, u.nombre, u.email, "", "")
+    return _escribir_filas(ruta, ENCABEZADO_USUARIOS, filas())
+
+def escribir_cursos(pl: Plataforma, ruta: str) -> int:
+    filas = ((c.codigo, c.nombre, c.profesor.id, repr(c.creditos)) for c in pl.cursos.values())
+    return _escribir_filas(ruta, ENCABEZADO_CURSOS, filas)
+
+def escribir_inscripciones(pl: Plataforma, ruta: str) -> int:
+    filas = ((c.codigo, e.id) for c in pl.cursos.values() for e in c._estudiantes.values())
+    return _escribir_filas(ruta, ENCABEZADO_INSCRIPCIONES, filas)
+
+def escribir_evaluaciones(pl: Plataforma, ruta: str) -> int:
+    filas = ((ev.id, c.codigo, getattr(ev, "tipo", "evaluacion"), ev.titulo, repr(ev.max_puntos), repr(ev.peso))
+             for c in pl.cursos.values() for ev in c._evaluaciones.values())
+    return _escribir_filas(ruta, ENCABEZADO_EVALUACIONES, filas)
+
+def escribir_calificaciones(pl: Plataforma, ruta: str) -> int:
+    filas = ((c.codigo, ev.id, est, repr(puntos))
+             for c in pl.cursos.values() for ev in c._evaluaciones.values()
+             for est, puntos in ev.calificaciones.items())
+    return _escribir_filas(ruta, ENCABEZADO_CALIFICACIONES, filas)
+
+ARCHIVOS = ("usuarios.csv", "cursos.csv", "inscripciones.csv", "evaluaciones.csv", "calificaciones.csv")
+
+def exportar_plataforma(pl: Plataforma, directorio: str) -> Dict[str, int]:
+    os.makedirs(directorio, exist_ok=True)
+    escritores = (escribir_usuarios, escribir_cursos, escribir_inscripciones, escribir_evaluaciones, escribir_calificaciones)
+    return {nombre: escribir(pl, os.path.join(directorio, nombre)) for nombre, escribir in zip(ARCHIVOS, escritores)}
+
+def importar_plataforma(pl: Plataforma, directorio: str) -> List[Dict]:
+    ids_evaluacion: Dict[int, int] = {}
+    pasos = (
+        importar_usuarios,
+        importar_cursos,
+        importar_inscripciones,
+        lambda pl, ruta: importar_evaluaciones(pl, ruta, ids_evaluacion),
+        lambda pl, ruta: importar_calificaciones(pl, ruta, ids_evaluacion),
+    )
+    errores = []
+    for nombre, importar in zip(ARCHIVOS, pasos):
+        for error in importar(pl, os.path.join(directorio, nombre)):
+            error['archivo'] = nombre
+            errores.append(error)
+    return errores
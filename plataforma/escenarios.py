@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Simulación "qué pasaría si" sobre un curso: cada escenario cambia pesos
+# (por evaluación o por tipo) y/o descarta las N notas más bajas de un tipo.
+# Se leen las calificaciones una sola vez y nunca se modifica el curso.
+
+class Escenario:
+    def __init__(self, nombre: str = "", pesos: Optional[Dict[int, float]] = None, pesos_tipo: Optional[Dict[str, float]] = None,
+                 descartar: Optional[Dict[str, int]] = None):
+        self.nombre = nombre
+        # las claves pueden venir como texto desde JSON
+        self.pesos = {int(k): float(v) for k, v in (pesos or {}).items()}
+        self.pesos_tipo = {str(k): float(v) for k, v in (pesos_tipo or {}).items()}
+        self.descartar = {str(k): int(v) for k, v in (descartar or {}).items()}
+        if any(p < 0 for p in self.pesos.values()) or any(p < 0 for p in self.pesos_tipo.values()):
+            raise ValueError("Los pesos deben ser >= 0")
+        if any(n < 0 for n in self.descartar.values()):
+            raise ValueError("La cantidad a descartar debe ser >= 0")
+
+    def _regla_descarte(self) -> Tuple[Tuple[str, int], ...]:
+        return tuple(sorted((t, n) for t, n in self.descartar.items() if n > 0))
+
+def _tipo(ev) -> str:
+    return getattr(ev, "tipo", "evaluacion")
+
+def _pesos(escenario: Escenario, evaluaciones: List) -> List[float]:
+    for id_eval in escenario.pesos:
+        if not any(ev.id == id_eval for ev in evaluaciones):
+            raise ValueError("Evaluación no encontrada en el curso")
+    return [escenario.pesos.get(ev.id, escenario.pesos_tipo.get(_tipo(ev), ev.peso)) for ev in evaluaciones]
+
+def _descartados(fila: Sequence[Optional[float]], columnas: List[int], n: int) -> List[int]:
+    # las n notas más bajas del tipo, pero nunca todas: al menos una cuenta;
+    # los empates se resuelven por orden de creación de la evaluación
+    calificadas = sorted((fila[j], j) for j in columnas if fila[j] is not None)
+    return [j for _, j in calificadas[:min(n, max(len(calificadas) - 1, 0))]]
+
+def _simular_python(n: int, columnas: List[Tuple[List[int], List[float]]], tipos: List[str], escenarios: List[Escenario],
+                    pesos: List[List[float]]) -> List[List[Optional[float]]]:
+    filas: List[List[Optional[float]]] = [[None] * len(tipos) for _ in range(n)]
+    for j, (indices, valores) in enumerate(columnas):
+        for i, pct in zip(indices, valores):
+            filas[i][j] = pct
+    columnas_tipo: Dict[str, List[int]] = {}
+    for j, t in enumerate(tipos):
+        columnas_tipo.setdefault(t, []).append(j)
+    resultado = []
+    for escenario, w in zip(escenarios, pesos):
+        regla = escenario._regla_descarte()
+        promedios = []
+        for fila in filas:
+            fuera = set()
+            for t, n in regla:
+                fuera.update(_descartados(fila, columnas_tipo.get(t, []), n))
+            suma_ponderada = suma_pesos = 0.0
+            for j, pct in enumerate(fila):
+                if pct is not None and j not in fuera:
+                    suma_ponderada += pct * w[j]
+                    suma_pesos += w[j]
+            promedios.append(suma_ponderada / suma_pesos if suma_pesos else None)
+        resultado.append(promedios)
+    return resultado
+
+def _simular_numpy(n: int, columnas: List[Tuple[List[int], List[float]]], tipos: List[str], escenarios: List[Escenario],
+                   pesos: List[List[float]]) -> List[List[Optional[float]]]:
+    import numpy as np
+    m = len(tipos)
+    pct = np.full((n, m), np.nan)
+    for j, (indices, valores) in enumerate(columnas):
+        pct[np.array(indices, dtype=np.intp), j] = valores
+    calificado = ~np.isnan(pct)
+    base = np.where(calificado, pct, 0.0)
+    tipos_arr = np.array(tipos, dtype=object)
+    # máscara de descarte por (tipo, n); solo depende de las notas, no de los pesos
+    mascaras: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def descarte(t: str, cantidad: int) -> np.ndarray:
+        clave = (t, cantidad)
+        if clave not in mascaras:
+            columnas = np.flatnonzero(tipos_arr == t)
+            mascara = np.zeros((n, m), dtype=bool)
+            if len(columnas):
+                sub = np.where(calificado[:, columnas], pct[:, columnas], np.inf)
+                orden = np.argsort(sub, axis=1, kind="stable")
+                rango = np.empty_like(orden)
+                np.put_along_axis(rango, orden, np.arange(len(columnas))[None, :].repeat(n, axis=0), axis=1)
+                cuenta = calificado[:, columnas].sum(axis=1)
+                limite = np.minimum(cantidad, np.maximum(cuenta - 1, 0))[:, None]
+                mascara[:, columnas] = rango < limite
+            mascaras[clave] = mascara
+        return mascaras[clave]
+
+    # los escenarios con la misma regla de descarte se resuelven juntos con
+    # un solo producto matricial (estudiantes x evaluaciones) @ (evaluaciones x escenarios)
+    grupos: Dict[Tuple, List[int]] = {}
+    for i, escenario in enumerate(escenarios):
+        grupos.setdefault(escenario._regla_descarte(), []).append(i)
+    resultado: List[Optional[List[Optional[float]]]] = [None] * len(escenarios)
+    for regla, indices in grupos.items():
+        cuenta = calificado
+        for t, cantidad in regla:
+            cuenta = cuenta & ~descarte(t, cantidad)
+        w = np.array([pesos[i] for i in indices], dtype=float).reshape(len(indices), m).T
+        suma_ponderada = np.where(cuenta, base, 0.0) @ w
+        suma_pesos = cuenta.astype(float) @ w
+        promedios = np.divide(suma_ponderada, suma_pesos, out=np.full_like(suma_ponderada, np.nan), where=suma_pesos != 0)
+        for k, i in enumerate(indices):
+            resultado[i] = [None if p != p else p for p in promedios[:, k].tolist()]
+    return resultado
+
+def simular(curso, escenarios: List[Escenario], umbral_porcentaje: Optional[float] = None, motor: Optional[str] = None) -> List[Dict]:
+    if motor is None:
+        try:
+            import numpy  # noqa: F401
+            motor = "numpy"
+        except ImportError:
+            motor = "python"
+    elif motor not in ("numpy", "python"):
+        raise ValueError("Motor de simulación desconocido")
+    evaluaciones = list(curso._evaluaciones.values())
+    estudiantes = list(curso._por_id.values())
+    pesos = [_pesos(e, evaluaciones) for e in escenarios]
+    tipos = [_tipo(ev) for ev in evaluaciones]
+    # una sola lectura de las calificaciones: por evaluación, las filas de
+    # los inscritos calificados y su porcentaje
+    posicion = {est.id: i for i, est in enumerate(estudiantes)}
+    columnas = []
+    for ev in evaluaciones:
+        escala = 100.0 / ev.max_puntos
+        indices, valores = [], []
+        for id_estudiante, puntos in ev.calificaciones.items():
+            i = posicion.get(id_estudiante)
+            if i is not None:
+                indices.append(i)
+                valores.append(puntos * escala)
+        columnas.append((indices, valores))
+    simulador = _simular_numpy if motor == "numpy" else _simular_python
+    resultado = []
+    for escenario, promedios in zip(escenarios, simulador(len(estudiantes), columnas, tipos, escenarios, pesos)):
+        salida = {'nombre': escenario.nombre, 'promedios': {est.id: p for est, p in zip(estudiantes, promedios)}}
+        if umbral_porcentaje is not None:
+            salida['promedio_bajo'] = [{'id': est.id, 'nombre': est.nombre, 'promedio': round(p, 2)}
+                                       for est, p in zip(estudiantes, promedios) if p is not None and p < umbral_porcentaje]
+        resultado.append(salida)
+    return resultado
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import ItemsView, MutableMapping
+
+from .modelo import Estudiante, Evaluacion, Examen, Profesor, Tarea, Usuario
+from .nucleo import Plataforma
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Optional
+
+# Formato (little endian):
+#   cabecera: magia, versión, reservado, offsets de cadenas, metadatos y calificaciones
+#   cadenas:  n, n + 1 offsets u32, bloque utf-8
+#   metadatos: usuarios, cursos (inscritos y evaluaciones), next_eval_id;
+#              la versión 2 agrega los créditos de cada curso
+#   calificaciones: por evaluación, n índices u32 (alineados a 8) y n float64
+MAGIA = b"PLTF"
+VERSION = 2
+CABECERA = struct.Struct("<4sHHQQQ")
+
+TIPO_USUARIO = {Profesor: 0, Estudiante: 1, Usuario: 2}
+TIPO_EVALUACION = {Evaluacion: 0, Examen: 1, Tarea: 2}
+CLASE_EVALUACION = {v: k for k, v in TIPO_EVALUACION.items()}
+MOTORES = ("dict", "numpy")
+
+USUARIO = struct.Struct("<BIIII")
+CURSO = struct.Struct("<IIIBIId")
+CURSO_V1 = struct.Struct("<IIIBII")
+EVALUACION = struct.Struct("<qBIddIQ")
+
+class _ItemsMapeados(ItemsView):
+    def __iter__(self):
+        m = self._mapping
+        if m._datos is None:
+            return zip(map(m._cadenas.__getitem__, m._indices), m._puntos)
+        return iter(m._datos.items())
+
+class CalificacionesMapeadas(MutableMapping):
+    # Columna de calificaciones respaldada por el archivo mapeado en memoria;
+    # se convierte en dict solo cuando hace falta buscar o modificar.
+    def __init__(self, cadenas: List[str], indices: memoryview, puntos: memoryview):
+        self._cadenas = cadenas
+        self._indices = indices
+        self._puntos = puntos
+        self._datos = None
+
+    def _materializar(self) -> Dict[str, float]:
+        if self._datos is None:
+            cadenas = self._cadenas
+            self._datos = {cadenas[i]: p for i, p in zip(self._indices, self._puntos)}
+            self._indices = self._puntos = None
+        return self._datos
+
+    def __getitem__(self, id_estudiante: str) -> float:
+        return self._materializar()[id_estudiante]
+
+    def __setitem__(self, id_estudiante: str, puntos: float):
+        self._materializar()[id_estudiante] = puntos
+
+    def __delitem__(self, id_estudiante: str):
+        del self._materializar()[id_estudiante]
+
+    def __iter__(self):
+        if self._datos is None:
+            return map(self._cadenas.__getitem__, self._indices)
+        return iter(self._datos)
+
+    def __len__(self) -> int:
+        if self._datos is None:
+            return len(self._indices)
+        return len(self._datos)
+
+    def items(self):
+        return _ItemsMapeados(self)
+
+class _CadenasPerezosas:
+    def __init__(self, bloque: memoryview, offsets: memoryview):
+        self._bloque = bloque
+        self._offsets = offsets
+        self._cache: Dict[int, str] = {}
+
+    def __getitem__(self, i: int) -> str:
+        texto = self._cache.get(i)
+        if texto is None:
+            texto = self._cache[i] = str(self._bloque[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+        return texto
+
+def _alinear(n: int) -> int:
+    return (n + 7) & ~7
+
+def guardar(pl: Plataforma, ruta: str):
+    cadenas: Dict[str, int] = {}
+
+    def idx(texto: str) -> int:
+        i = cadenas.get(texto)
+        if i is None:
+            i = cadenas[texto] = len(cadenas)
+        return i
+
+    # con concurrencia, cada curso se lee con su candado tomado
+    with pl._candado_registro:
+        usuarios = list(pl.usuarios.values())
+        cursos = list(pl.cursos.values())
+    meta = bytearray()
+    calif = bytearray()
+    meta += struct.pack("<I", len(usuarios))
+    for u in usuarios:
+        if isinstance(u, Estudiante):
+            tipo, extra = TIPO_USUARIO[Estudiante], u.carnet
+        elif isinstance(u, Profesor):
+            tipo, extra = TIPO_USUARIO[Profesor], u.departamento
+        else:
+            tipo, extra = TIPO_USUARIO[Usuario], ""
+        meta += USUARIO.pack(tipo, idx(u.id), idx(u.nombre), idx(u.email), idx(extra))
+    meta += struct.pack("<I", len(cursos))
+    for c in cursos:
+        with c._candado.lectura():
+            estudiantes = list(c._estudiantes.values())
+            evaluaciones = list(c._evaluaciones.values())
+            meta += CURSO.pack(idx(c.codigo), idx(c.nombre), idx(c.profesor.id), MOTORES.index(c.tipo_motor), len(estudiantes), len(evaluaciones), c.creditos)
+            meta += array("I", [idx(e.id) for e in estudiantes]).tobytes()
+            for ev in evaluaciones:
+                indices = array("I")
+                puntos = array("d")
+                for id_estudiante, p in ev.calificaciones.items():
+                    indices.append(idx(id_estudiante))
+                    puntos.append(p)
+                meta += EVALUACION.pack(ev.id, TIPO_EVALUACION.get(type(ev), 0), idx(ev.titulo), ev.max_puntos, ev.peso, len(puntos), len(calif))
+                calif += indices.tobytes()
+                calif += bytes(_alinear(len(calif)) - len(calif))
+                calif += puntos.tobytes()
+    meta += struct.pack("<Q", pl.next_eval_id)
+
+    codificadas = [t.encode("utf-8") for t in cadenas]
+    offsets = array("I", [0])
+    for b in codificadas:
+        offsets.append(offsets[-1] + len(b))
+    seccion_cadenas = struct.pack("<I", len(codificadas)) + offsets.tobytes() + b"".join(codificadas)
+
+    off_cadenas = CABECERA.size
+    off_meta = off_cadenas + len(seccion_cadenas)
+    off_calif = _alinear(off_meta + len(meta))
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as f:
+        f.write(CABECERA.pack(MAGIA, VERSION, 0, off_cadenas, off_meta, off_calif))
+        f.write(seccion_cadenas)
+        f.write(meta)
+        f.write(bytes(off_calif - off_meta - len(meta)))
+        f.write(calif)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporal, ruta)
+
+def _usuario(cadenas: List[str], tipo: int, i_id: int, i_nombre: int, i_correo: int, i_extra: int) -> Usuario:
+    if tipo == TIPO_USUARIO[Profesor]:
+        return Profesor(cadenas[i_id], cadenas[i_nombre], cadenas[i_correo], cadenas[i_extra])
+    if tipo == TIPO_USUARIO[Estudiante]:
+        return Estudiante(cadenas[i_id], cadenas[i_nombre], cadenas[i_correo], cadenas[i_extra])
+    return Usuario(cadenas[i_id], cadenas[i_nombre], cadenas[i_correo])
+
+def cargar(ruta: str, cls=Plataforma, cursos: Optional[Iterable[str]] = None, **opciones) -> Plataforma:
+    # Con `cursos` la carga es parcial: solo esos cursos, su profesor y sus
+    # inscritos; pensada para consultas de un solo uso desde la línea de comandos.
+    with open(ruta, "rb") as f:
+        datos = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    vista = memoryview(datos)
+    magia, version, _, off_cadenas, off_meta, off_calif = CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA:
+        raise ValueError("Archivo no es una instantánea de Plataforma")
+    if version not in (1, VERSION):
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+
+    (n_cadenas,) = struct.unpack_from("<I", datos, off_cadenas)
+    inicio = off_cadenas + 4
+    offsets = vista[inicio:inicio + 4 * (n_cadenas + 1)].cast("I")
+    bloque = inicio + 4 * (n_cadenas + 1)
+    if cursos is not None:
+        # la carga parcial toca pocas cadenas: se decodifican a demanda
+        cadenas = _CadenasPerezosas(vista[bloque:bloque + offsets[n_cadenas]], offsets)
+    else:
+        texto = bytes(vista[bloque:bloque + offsets[n_cadenas]]).decode("utf-8")
+        # los offsets son en bytes; si todo es ASCII coinciden con los caracteres
+        if len(texto) == offsets[n_cadenas]:
+            cadenas = [texto[offsets[i]:offsets[i + 1]] for i in range(n_cadenas)]
+        else:
+            crudo = bytes(vista[bloque:bloque + offsets[n_cadenas]])
+            cadenas = [crudo[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n_cadenas)]
+
+    pl = cls(**opciones)
+    pos = off_meta
+    (n_usuarios,) = struct.unpack_from("<I", datos, pos)
+    pos += 4
+    registros = USUARIO.iter_unpack(vista[pos:pos + n_usuarios * USUARIO.size])
+    pos += n_usuarios * USUARIO.size
+    if cursos is None:
+        for registro in registros:
+            pl.registrar_usuario(_usuario(cadenas, *registro))
+    else:
+        cursos = set(cursos)
+        pendientes = {r[1]: r for r in registros}
+
+        def registrar(i_id: int):
+            registro = pendientes.pop(i_id, None)
+            if registro is not None:
+                pl.registrar_usuario(_usuario(cadenas, *registro))
+
+    (n_cursos,) = struct.unpack_from("<I", datos, pos)
+    pos += 4
+    for _ in range(n_cursos):
+        if version == 1:
+            i_codigo, i_nombre, i_profesor, motor, n_inscritos, n_evaluaciones = CURSO_V1.unpack_from(datos, pos)
+            creditos = 1.0
+            pos += CURSO_V1.size
+        else:
+            i_codigo, i_nombre, i_profesor, motor, n_inscritos, n_evaluaciones, creditos = CURSO.unpack_from(datos, pos)
+            pos += CURSO.size
+        if cursos is not None:
+            if cadenas[i_codigo] not in cursos:
+                pos += 4 * n_inscritos + n_evaluaciones * EVALUACION.size
+                continue
+            registrar(i_profesor)
+            for i in vista[pos:pos + 4 * n_inscritos].cast("I"):
+                registrar(i)
+        curso = pl.crear_curso(cadenas[i_nombre], cadenas[i_codigo], cadenas[i_profesor], motor=MOTORES[motor], creditos=creditos)
+        curso._motor = None
+        inscritos = vista[pos:pos + 4 * n_inscritos].cast("I")
+        pos += 4 * n_inscritos
+        for _ in range(n_evaluaciones):
+            id_eval, tipo, i_titulo, max_puntos, peso, n, off = EVALUACION.unpack_from(datos, pos)
+            pos += EVALUACION.size
+            ev = CLASE_EVALUACION[tipo](id_eval, cadenas[i_titulo], max_puntos, peso=peso)
+            a = off_calif + off
+            b = off_calif + _alinear(off + 4 * n)
+            ev.calificaciones = CalificacionesMapeadas(cadenas, vista[a:a + 4 * n].cast("I"), vista[b:b + 8 * n].cast("d"))
+            curso.agregar_evaluacion(ev)
+            pl._evaluaciones[id_eval] = (curso, ev)
+        # se inscribe después de agregar las evaluaciones: sin inscritos no hay
+        # expedientes que invalidar y las columnas mapeadas no se recorren
+        for i in inscritos:
+            curso.inscribir(pl.usuarios[cadenas[i]])
+    (pl.next_eval_id,) = struct.unpack_from("<Q", datos, pos)
+    return pl
@@ -0,0 +1,161 @@
+import functools
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+# Métodos de Plataforma que se instrumentan al activar las métricas. Con la
+# instrumentación apagada no se envuelve nada: cero costo en cada llamada.
+OPERACIONES = ("registrar_usuario", "crear_curso", "inscribir_estudiante", "crear_evaluacion", "registrar_calificacion",
+               "registrar_calificaciones_lote", "obtener_promedio_estudiante_en_curso", "reporte_estudiantes_promedio_bajo",
+               "top_k", "bottom_k", "percentil", "rango_percentil", "rango_promedio", "estadisticas_curso",
+               "simular_escenarios", "obtener_expediente", "reporte_global_promedio_bajo", "listar_profesores",
+               "listar_cursos", "pagina_profesores", "pagina_cursos", "pagina_estudiantes", "pagina_estudiantes_curso",
+               "guardar", "compactar")
+
+# límites superiores de las cubetas de latencia, en nanosegundos
+LIMITES_NS = (1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000,
+              1_000_000, 2_500_000, 5_000_000, 10_000_000, 50_000_000, 250_000_000, 1_000_000_000)
+
+def _cuantil(cubetas: List[int], llamadas: int, q: float) -> Optional[float]:
+    # cota superior del cuantil según la cubeta en la que cae, en µs
+    if not llamadas:
+        return None
+    acumulado = 0
+    for limite, n in zip(LIMITES_NS, cubetas):
+        acumulado += n
+        if acumulado >= q * llamadas:
+            return limite / 1000.0
+    return float("inf")
+
+class MetricaOperacion:
+    def __init__(self, concurrente: bool = False):
+        self._candado = threading.Lock()
+        self.llamadas = 0
+        self.suma_ns = 0
+        self.cubetas = [0] * (len(LIMITES_NS) + 1)
+        self.errores: Dict[str, int] = {}
+        # sin hilos no hace falta pagar el candado en cada observación
+        self.observar = self._observar_con_candado if concurrente else self._observar
+
+    def _observar(self, ns: int):
+        self.llamadas += 1
+        self.suma_ns += ns
+        self.cubetas[bisect_left(LIMITES_NS, ns)] += 1
+
+    def _observar_con_candado(self, ns: int):
+        with self._candado:
+            self._observar(ns)
+
+    def error(self, mensaje: str):
+        with self._candado:
+            self.errores[mensaje] = self.errores.get(mensaje, 0) + 1
+
+    def resumen(self) -> Dict:
+        with self._candado:
+            cubetas = list(self.cubetas)
+            errores = dict(self.errores)
+            llamadas, suma_ns = self.llamadas, self.suma_ns
+        acumuladas = []
+        total = 0
+        for limite, n in zip(LIMITES_NS, cubetas):
+            total += n
+            acumuladas.append([limite / 1e9, total])
+        return {
+            'llamadas': llamadas,
+            'errores': errores,
+            'latencia_total_s': suma_ns / 1e9,
+            'latencia_media_us': suma_ns / llamadas / 1000.0 if llamadas else None,
+            'p50_us': _cuantil(cubetas, llamadas, 0.5),
+            'p99_us': _cuantil(cubetas, llamadas, 0.99),
+            'cubetas': acumuladas,
+        }
+
+class Metricas:
+    def __init__(self, concurrente: bool = False):
+        self.concurrente = concurrente
+        self.operaciones: Dict[str, MetricaOperacion] = {}
+
+    def activar_concurrencia(self):
+        for m in self.operaciones.values():
+            m.observar = m._observar_con_candado
+        self.concurrente = True
+
+    def instrumentar(self, pl):
+        # envuelve los métodos ligados de esta instancia; la clase no cambia
+        for nombre in OPERACIONES:
+            m = MetricaOperacion(self.concurrente)
+            self.operaciones[nombre] = m
+            setattr(pl, nombre, _envolver(getattr(pl, nombre), m))
+
+    def resumen(self) -> Dict[str, Dict]:
+        return {nombre: m.resumen() for nombre, m in self.operaciones.items()}
+
+def _envolver(metodo, m: MetricaOperacion):
+    reloj = time.perf_counter_ns
+
+    @functools.wraps(metodo)
+    def envuelto(*args, **kwargs):
+        t0 = reloj()
+        try:
+            return metodo(*args, **kwargs)
+        except ValueError as e:
+            m.error(str(e))
+            raise
+        finally:
+            m.observar(reloj() - t0)
+    return envuelto
+
+def tamanos(pl) -> Dict:
+    por_curso = {}
+    for codigo, curso in list(pl.cursos.items()):
+        with curso._candado.lectura():
+            por_curso[codigo] = {
+                'inscritos': len(curso._estudiantes),
+                'evaluaciones': len(curso._evaluaciones),
+                'calificaciones': sum(len(ev.calificaciones) for ev in curso._evaluaciones.values()),
+            }
+    return {
+        'usuarios': len(pl.usuarios),
+        'cursos': len(por_curso),
+        'evaluaciones': sum(c['evaluaciones'] for c in por_curso.values()),
+        'inscripciones': sum(c['inscritos'] for c in por_curso.values()),
+        'calificaciones': sum(c['calificaciones'] for c in por_curso.values()),
+        'por_curso': por_curso,
+    }
+
+def _etiqueta(valor: str) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _numero(valor: float) -> str:
+    return "+Inf" if valor == float("inf") else repr(valor)
+
+def prometheus(instantanea: Dict) -> str:
+    lineas: List[str] = []
+    operaciones = instantanea['operaciones']
+    if operaciones:
+        lineas += ["# HELP plataforma_operaciones_total Llamadas a cada operación de Plataforma.",
+                   "# TYPE plataforma_operaciones_total counter"]
+        for nombre, r in operaciones.items():
+            lineas.append(f'plataforma_operaciones_total{{operacion="{nombre}"}} {r["llamadas"]}')
+        lineas += ["# HELP plataforma_errores_total Errores de validación por operación y mensaje.",
+                   "# TYPE plataforma_errores_total counter"]
+        for nombre, r in operaciones.items():
+            for mensaje, n in r['errores'].items():
+                lineas.append(f'plataforma_errores_total{{operacion="{nombre}",mensaje="{_etiqueta(mensaje)}"}} {n}')
+        lineas += ["# HELP plataforma_latencia_segundos Latencia de cada operación de Plataforma.",
+                   "# TYPE plataforma_latencia_segundos histogram"]
+        for nombre, r in operaciones.items():
+            for limite, n in r['cubetas']:
+                lineas.append(f'plataforma_latencia_segundos_bucket{{operacion="{nombre}",le="{_numero(limite)}"}} {n}')
+            lineas.append(f'plataforma_latencia_segundos_bucket{{operacion="{nombre}",le="+Inf"}} {r["llamadas"]}')
+            lineas.append(f'plataforma_latencia_segundos_sum{{operacion="{nombre}"}} {_numero(r["latencia_total_s"])}')
+            lineas.append(f'plataforma_latencia_segundos_count{{operacion="{nombre}"}} {r["llamadas"]}')
+    t = instantanea['tamanos']
+    for clave in ("usuarios", "cursos", "evaluaciones", "inscripciones", "calificaciones"):
+        lineas += [f"# TYPE plataforma_{clave} gauge", f"plataforma_{clave} {t[clave]}"]
+    for clave in ("inscritos", "evaluaciones", "calificaciones"):
+        lineas.append(f"# TYPE plataforma_curso_{clave} gauge")
+        for codigo, c in t['por_curso'].items():
+            lineas.append(f'plataforma_curso_{clave}{{curso="{_etiqueta(codigo)}"}} {c[clave]}')
+    return "\n".join(lineas) + "\n"
@@ -0,0 +1,619 @@
+from __future__ import annotations
+
+from _thread import allocate_lock
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from math import ceil, floor, isnan, sqrt
+
+# typing solo lo leen los verificadores de tipos; importarlo al arrancar
+# cuesta más que el resto del modelo junto
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Usuario:
+    def __init__(self, id_usuario: str, nombre: str, correo: str):
+        self.id = id_usuario
+        self.nombre = nombre
+        self.email = correo
+
+    def __str__(self):
+        return f"{self.nombre} ({self.email})"
+
+class Estudiante(Usuario):
+    def __init__(self, id_usuario: str, nombre: str, correo: str, carnet: str):
+        super().__init__(id_usuario, nombre, correo)
+        self.carnet = carnet
+        self._cursos: Dict[str, 'Curso'] = {}
+        # caché del expediente: promedio por curso y resultado completo
+        self._promedios: Dict[str, Optional[float]] = {}
+        self._expediente: Optional[Dict] = None
+        self._version_expediente = 0
+
+    # vistas de solo lectura: se inscribe y retira a través del curso
+    @property
+    def cursos_inscritos(self) -> Tuple['Curso', ...]:
+        return tuple(self._cursos.values())
+
+    def esta_inscrito(self, codigo_curso: str) -> bool:
+        return codigo_curso in self._cursos
+
+    def inscribir_curso(self, curso: 'Curso'):
+        if curso.codigo in self._cursos:
+            raise ValueError("Estudiante ya inscrito en ese curso")
+        self._cursos[curso.codigo] = curso
+
+    def retirar_curso(self, curso: 'Curso'):
+        if self._cursos.pop(curso.codigo, None) is None:
+            raise ValueError("Estudiante no inscrito en ese curso")
+
+    def _invalidar_expediente(self, codigo_curso: Optional[str] = None):
+        # escritores de cursos distintos invalidan al mismo estudiante bajo
+        # candados de curso distintos; comparar y guardar exige uno común
+        with _CANDADO_EXPEDIENTES:
+            if codigo_curso is not None:
+                self._promedios.pop(codigo_curso, None)
+            self._expediente = None
+            self._version_expediente += 1
+
+    def _guardar_expediente(self, expediente: Dict, version: int):
+        with _CANDADO_EXPEDIENTES:
+            if self._version_expediente == version:
+                self._expediente = expediente
+
+class Profesor(Usuario):
+    def __init__(self, id_usuario: str, nombre: str, correo: str, departamento: str):
+        super().__init__(id_usuario, nombre, correo)
+        self.departamento = departamento
+
+class EstadisticasEvaluacion:
+    # Agregados en línea de una evaluación: media y varianza de Welford,
+    # mínimo/máximo e histograma de 10 tramos del 10% de max_puntos. Una
+    # calificación sobrescrita se retira antes de agregar la nueva.
+    __slots__ = ("max_puntos", "n", "media", "m2", "minimo", "maximo", "extremos_validos", "histograma")
+    TRAMOS = 10
+
+    def __init__(self, max_puntos: float, valores: Iterable[float] = ()):
+        self.max_puntos = max_puntos
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo: Optional[float] = None
+        self.maximo: Optional[float] = None
+        self.extremos_validos = True
+        self.histograma = [0] * self.TRAMOS
+        for x in valores:
+            self.agregar(x)
+
+    def _tramo(self, x: float) -> int:
+        return min(int(x / self.max_puntos * self.TRAMOS), self.TRAMOS - 1)
+
+    def agregar(self, x: float):
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (x - self.media)
+        self.histograma[self._tramo(x)] += 1
+        if self.extremos_validos:
+            if self.minimo is None or x < self.minimo:
+                self.minimo = x
+            if self.maximo is None or x > self.maximo:
+                self.maximo = x
+
+    def retirar(self, x: float):
+        self.histograma[self._tramo(x)] -= 1
+        if self.n == 1:
+            self.n = 0
+            self.media = self.m2 = 0.0
+            self.minimo = self.maximo = None
+            self.extremos_validos = True
+            return
+        media_anterior = self.media
+        self.n -= 1
+        self.media = (media_anterior * (self.n + 1) - x) / self.n
+        self.m2 = max(self.m2 - (x - media_anterior) * (x - self.media), 0.0)
+        # si se retira un extremo, el nuevo se busca recién al consultarlo
+        if x == self.minimo or x == self.maximo:
+            self.extremos_validos = False
+
+    def recalcular_extremos(self, valores: Iterable[float]):
+        valores = list(valores)
+        self.minimo = min(valores, default=None)
+        self.maximo = max(valores, default=None)
+        self.extremos_validos = True
+
+    def resumen(self) -> Dict:
+        return {
+            'n': self.n,
+            'media': round(self.media, 2) if self.n else None,
+            'minimo': self.minimo,
+            'maximo': self.maximo,
+            'desviacion': round(sqrt(self.m2 / self.n), 2) if self.n else None,
+            'histograma': list(self.histograma),
+        }
+
+class Evaluacion:
+    def __init__(self, id_eval: int, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs):
+        self.id = id_eval
+        self.titulo = titulo
+        self.max_puntos = float(max_puntos)
+        if self.max_puntos <= 0:
+            raise ValueError("max_puntos debe ser > 0")
+        self._peso = float(peso)
+        self.calificaciones: Dict[str, float] = {}
+        self._curso: Optional['Curso'] = None
+        # se arma con la primera consulta y luego se actualiza en O(1)
+        self._estadisticas: Optional[EstadisticasEvaluacion] = None
+
+    @property
+    def peso(self) -> float:
+        return self._peso
+
+    @peso.setter
+    def peso(self, valor: float):
+        anterior = self._peso
+        self._peso = float(valor)
+        if self._curso is not None:
+            self._curso._peso_cambiado(self, anterior)
+
+    def registrar_calificacion(self, id_estudiante: str, puntos: float):
+        puntos = float(puntos)
+        if puntos < 0 or puntos > self.max_puntos:
+            raise ValueError("Puntos fuera de rango")
+        anterior = self.calificaciones.get(id_estudiante)
+        self.calificaciones[id_estudiante] = puntos
+        estadisticas = self._estadisticas
+        if estadisticas is not None:
+            if anterior is not None:
+                estadisticas.retirar(anterior)
+            estadisticas.agregar(puntos)
+        if self._curso is not None:
+            self._curso._calificacion_registrada(self, id_estudiante, anterior, puntos)
+
+    def obtener_porcentaje(self, id_estudiante: str) -> Optional[float]:
+        if id_estudiante not in self.calificaciones:
+            return None
+        return (self.calificaciones[id_estudiante] / self.max_puntos) * 100.0
+
+    def estadisticas(self) -> Dict:
+        estadisticas = self._estadisticas
+        if estadisticas is None or not estadisticas.extremos_validos:
+            with _CANDADO_PEREZOSO:
+                if self._estadisticas is None:
+                    self._estadisticas = EstadisticasEvaluacion(self.max_puntos, (p for _, p in self.calificaciones.items()))
+                elif not self._estadisticas.extremos_validos:
+                    self._estadisticas.recalcular_extremos(p for _, p in self.calificaciones.items())
+                estadisticas = self._estadisticas
+        resumen = {'id': self.id, 'titulo': self.titulo, 'tipo': getattr(self, "tipo", "evaluacion"), 'max_puntos': self.max_puntos}
+        resumen.update(estadisticas.resumen())
+        return resumen
+
+class Examen(Evaluacion):
+    def __init__(self, id_eval: int, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs):
+        super().__init__(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        self.tipo = "examen"
+
+class Tarea(Evaluacion):
+    def __init__(self, id_eval: int, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs):
+        super().__init__(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        self.tipo = "tarea"
+
+class CalificacionesCompactas(MutableMapping):
+    # Columna de una evaluación en modo compacto: los puntos van en un
+    # array('d') indexado por el handle entero del estudiante en el curso
+    # (NaN = sin calificación), en lugar de un dict con claves de texto.
+    __slots__ = ("_curso", "_puntos")
+
+    def __init__(self, curso: 'Curso'):
+        self._curso = curso
+        self._puntos = array("d")
+
+    def __getitem__(self, id_estudiante: str) -> float:
+        handle = self._curso._handles.get(id_estudiante)
+        if handle is None or handle >= len(self._puntos) or isnan(self._puntos[handle]):
+            raise KeyError(id_estudiante)
+        return self._puntos[handle]
+
+    def __setitem__(self, id_estudiante: str, puntos: float):
+        handle = self._curso._handle(id_estudiante)
+        faltan = handle + 1 - len(self._puntos)
+        if faltan > 0:
+            self._puntos.extend(array("d", [float("nan")]) * faltan)
+        self._puntos[handle] = puntos
+
+    def __delitem__(self, id_estudiante: str):
+        handle = self._curso._handles.get(id_estudiante)
+        if handle is None or handle >= len(self._puntos) or isnan(self._puntos[handle]):
+            raise KeyError(id_estudiante)
+        self._puntos[handle] = float("nan")
+
+    def __iter__(self) -> Iterator[str]:
+        ids = self._curso._ids
+        return (ids[h] for h, p in enumerate(self._puntos) if p == p)
+
+    def __len__(self) -> int:
+        return sum(1 for p in self._puntos if p == p)
+
+class MotorDiccionario:
+    __slots__ = ("curso", "_acumulados", "_orden")
+
+    def __init__(self, curso: 'Curso'):
+        self.curso = curso
+        # id_estudiante -> [suma de pct * peso, suma de pesos, posición de la
+        # última evaluación sumada]. Las sumas se arman en el orden de las
+        # evaluaciones, igual que el cálculo directo, para dar el mismo valor
+        # sin importar el historial de ediciones.
+        self._acumulados: Dict[str, list] = {}
+        self._orden: Dict[int, int] = {}
+
+    def _acumular(self, id_estudiante: str, ponderada: float, peso: float, orden: int):
+        # solo agrega un término al final
+        acumulado = self._acumulados.get(id_estudiante)
+        if acumulado is None:
+            self._acumulados[id_estudiante] = [ponderada, peso, orden]
+            return
+        acumulado[0] += ponderada
+        acumulado[1] += peso
+        acumulado[2] = orden
+
+    def _recalcular(self, id_estudiante: str):
+        suma_ponderada = 0.0
+        suma_pesos = 0.0
+        ultima = -1
+        for orden, ev in enumerate(self.curso._evaluaciones.values()):
+            puntos = ev.calificaciones.get(id_estudiante)
+            if puntos is not None:
+                suma_ponderada += (puntos / ev.max_puntos) * 100.0 * ev.peso
+                suma_pesos += ev.peso
+                ultima = orden
+        self._acumulados[id_estudiante] = [suma_ponderada, suma_pesos, ultima]
+
+    def agregar_evaluacion(self, evaluacion: Evaluacion):
+        orden = self._orden[evaluacion.id] = len(self._orden)
+        for id_estudiante, puntos in evaluacion.calificaciones.items():
+            self._acumular(id_estudiante, (puntos / evaluacion.max_puntos) * 100.0 * evaluacion.peso, evaluacion.peso, orden)
+
+    def calificacion_registrada(self, evaluacion: Evaluacion, id_estudiante: str, anterior: Optional[float], puntos: float):
+        orden = self._orden[evaluacion.id]
+        acumulado = self._acumulados.get(id_estudiante)
+        if anterior is None and (acumulado is None or acumulado[2] < orden):
+            self._acumular(id_estudiante, (puntos / evaluacion.max_puntos) * 100.0 * evaluacion.peso, evaluacion.peso, orden)
+        else:
+            # sumar la diferencia dejaría un residuo de redondeo que depende
+            # del historial; se rehacen las sumas del estudiante
+            self._recalcular(id_estudiante)
+
+    def peso_cambiado(self, evaluacion: Evaluacion, anterior: float):
+        if evaluacion.peso == anterior:
+            return
+        for id_estudiante in evaluacion.calificaciones:
+            self._recalcular(id_estudiante)
+
+    def promedio(self, id_estudiante: str) -> Optional[float]:
+        acumulado = self._acumulados.get(id_estudiante)
+        if acumulado is None or acumulado[1] == 0:
+            return None
+        return acumulado[0] / acumulado[1]
+
+    def promedios(self, ids_estudiantes: List[str]) -> List[Optional[float]]:
+        return [self.promedio(id_estudiante) for id_estudiante in ids_estudiantes]
+
+def crear_motor(nombre: str, curso: 'Curso'):
+    if nombre == "dict":
+        return MotorDiccionario(curso)
+    if nombre == "numpy":
+        try:
+            from .motor_numpy import MotorMatriz
+        except ImportError:
+            raise ValueError("El motor numpy requiere tener NumPy instalado")
+        return MotorMatriz(curso)
+    raise ValueError("Motor de calificaciones desconocido")
+
+class _SinCandado:
+    # sustituto sin costo de CandadoLectoresEscritor / Lock en modo no concurrente
+    def lectura(self):
+        return self
+
+    def escritura(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+SIN_CANDADO = _SinCandado()
+# protege la construcción perezosa de motores e índices desde varios lectores;
+# es el mismo threading.Lock, sin pagar la importación de threading al arrancar
+_CANDADO_PEREZOSO = allocate_lock()
+# serializa la invalidación y el guardado del expediente de un estudiante
+_CANDADO_EXPEDIENTES = allocate_lock()
+
+# Paginación por cursor: los recorridos producen pares (cursor, elemento),
+# donde el cursor permite retomar justo después de ese elemento. En listas
+# de solo inserción el cursor es la posición; en los índices por nombre es
+# la clave (nombre, id), así que sigue siendo válido aunque haya altas o
+# bajas entre una página y la siguiente.
+
+def _clave_nombre(nombre: str) -> str:
+    return nombre.casefold()
+
+def _recorrer_lista(lista: List, cursor: Optional[int] = None) -> Iterator[Tuple[int, object]]:
+    i = cursor or 0
+    if i < 0:
+        raise ValueError("Cursor inválido")
+    while i < len(lista):
+        elemento = lista[i]
+        i += 1
+        yield i, elemento
+
+def _recorrer_nombres(indice: List[Tuple[str, str]], objetos: Dict[str, Usuario], prefijo: str = "",
+                      cursor: Optional[Tuple[str, str]] = None) -> Iterator[Tuple[Tuple[str, str], Usuario]]:
+    prefijo = _clave_nombre(prefijo)
+    if cursor is None:
+        desde, buscar = (prefijo,), bisect_left
+    else:
+        try:
+            clave, id_usuario = cursor
+        except (TypeError, ValueError):
+            raise ValueError("Cursor inválido")
+        desde, buscar = (clave, id_usuario), bisect_right
+    while True:
+        # se vuelve a ubicar en cada paso por si el índice cambió entre elementos
+        i = buscar(indice, desde)
+        if i == len(indice) or not indice[i][0].startswith(prefijo):
+            return
+        desde, buscar = indice[i], bisect_right
+        objeto = objetos.get(desde[1])
+        if objeto is not None:
+            yield desde, objeto
+
+def _paginar(pares: Iterator[Tuple[object, object]], limite: int) -> Dict:
+    if limite <= 0:
+        raise ValueError("El límite de página debe ser > 0")
+    elementos = []
+    siguiente = None
+    for cursor, elemento in pares:
+        if len(elementos) == limite:
+            return {'elementos': elementos, 'siguiente': siguiente}
+        elementos.append(elemento)
+        siguiente = cursor
+    return {'elementos': elementos, 'siguiente': None}
+
+class Curso:
+    def __init__(self, nombre: str, codigo: str, profesor: Profesor, motor: str = "dict", creditos: float = 1.0,
+                 compacto: bool = False):
+        self.nombre = nombre
+        self.codigo = codigo
+        self.profesor = profesor
+        self._creditos = float(creditos)
+        if self._creditos < 0:
+            raise ValueError("creditos debe ser >= 0")
+        self._estudiantes: Dict[str, Estudiante] = {}
+        self._por_id: Dict[str, Estudiante] = {}
+        self._evaluaciones: Dict[int, Evaluacion] = {}
+        self.tipo_motor = motor
+        self._motor = crear_motor(motor, self)
+        self._candado = SIN_CANDADO
+        # índice ordenado (promedio, id) de los inscritos; se arma con la
+        # primera consulta de ranking y luego se mantiene en cada escritura
+        self._ranking: Optional[List[Tuple[float, str]]] = None
+        self._en_ranking: Dict[str, float] = {}
+        # índice ordenado (nombre, id) de los inscritos, también perezoso
+        self._nombres: Optional[List[Tuple[str, str]]] = None
+        # modo compacto: cada estudiante calificado recibe un handle entero
+        # local al curso, compartido por todas sus evaluaciones
+        self.compacto = compacto
+        self._handles: Dict[str, int] = {}
+        self._ids: List[str] = []
+
+    # vistas de solo lectura: se modifican con inscribir/retirar y agregar_evaluacion
+    @property
+    def estudiantes(self) -> Tuple[Estudiante, ...]:
+        return tuple(self._estudiantes.values())
+
+    @property
+    def creditos(self) -> float:
+        return self._creditos
+
+    @creditos.setter
+    def creditos(self, valor: float):
+        valor = float(valor)
+        if valor < 0:
+            raise ValueError("creditos debe ser >= 0")
+        self._creditos = valor
+        for est in self._por_id.values():
+            est._invalidar_expediente()
+
+    @property
+    def evaluaciones(self) -> Tuple[Evaluacion, ...]:
+        return tuple(self._evaluaciones.values())
+
+    def esta_inscrito(self, carnet: str) -> bool:
+        return carnet in self._estudiantes
+
+    def inscribir(self, estudiante: Estudiante):
+        if estudiante.carnet in self._estudiantes:
+            raise ValueError("Estudiante ya inscrito en el curso")
+        estudiante.inscribir_curso(self)
+        self._estudiantes[estudiante.carnet] = estudiante
+        self._por_id[estudiante.id] = estudiante
+        estudiante._invalidar_expediente(self.codigo)
+        if self._ranking is not None:
+            self._reindexar(estudiante.id)
+        if self._nombres is not None:
+            insort(self._nombres, (_clave_nombre(estudiante.nombre), estudiante.id))
+
+    def retirar(self, estudiante: Estudiante):
+        if self._estudiantes.get(estudiante.carnet) is not estudiante:
+            raise ValueError("Estudiante no inscrito en el curso")
+        del self._estudiantes[estudiante.carnet]
+        del self._por_id[estudiante.id]
+        estudiante.retirar_curso(self)
+        estudiante._invalidar_expediente(self.codigo)
+        if self._ranking is not None:
+            self._reindexar(estudiante.id)
+        if self._nombres is not None:
+            clave = (_clave_nombre(estudiante.nombre), estudiante.id)
+            del self._nombres[bisect_left(self._nombres, clave)]
+
+    def agregar_evaluacion(self, evaluacion: Evaluacion):
+        if evaluacion.id in self._evaluaciones:
+            raise ValueError("Evaluación con ID duplicado en este curso")
+        if evaluacion._curso is not None:
+            raise ValueError("Evaluación ya pertenece a otro curso")
+        # el motor numpy ya guarda las calificaciones en su matriz
+        if self.compacto and self.tipo_motor == "dict" and not isinstance(evaluacion.calificaciones, CalificacionesCompactas):
+            columna = CalificacionesCompactas(self)
+            for id_estudiante, puntos in evaluacion.calificaciones.items():
+                columna[id_estudiante] = puntos
+            evaluacion.calificaciones = columna
+        self._evaluaciones[evaluacion.id] = evaluacion
+        evaluacion._curso = self
+        if self._motor is not None:
+            self._motor.agregar_evaluacion(evaluacion)
+        if evaluacion.calificaciones:
+            self._ranking = None
+            self._invalidar_expedientes(evaluacion)
+
+    def obtener_evaluacion(self, id_eval: int) -> Optional[Evaluacion]:
+        return self._evaluaciones.get(id_eval)
+
+    def _handle(self, id_estudiante: str) -> int:
+        handle = self._handles.get(id_estudiante)
+        if handle is None:
+            handle = len(self._ids)
+            self._handles[id_estudiante] = handle
+            self._ids.append(id_estudiante)
+        return handle
+
+    def _obtener_motor(self):
+        # un curso cargado desde una instantánea arma su motor al primer uso
+        if self._motor is None:
+            with _CANDADO_PEREZOSO:
+                if self._motor is None:
+                    motor = crear_motor(self.tipo_motor, self)
+                    for ev in self._evaluaciones.values():
+                        motor.agregar_evaluacion(ev)
+                    self._motor = motor
+        return self._motor
+
+    def _calificacion_registrada(self, evaluacion: Evaluacion, id_estudiante: str, anterior: Optional[float], puntos: float):
+        if self._motor is not None:
+            self._motor.calificacion_registrada(evaluacion, id_estudiante, anterior, puntos)
+            if self._ranking is not None:
+                self._reindexar(id_estudiante)
+        est = self._por_id.get(id_estudiante)
+        if est is not None:
+            est._invalidar_expediente(self.codigo)
+
+    def _peso_cambiado(self, evaluacion: Evaluacion, anterior: float):
+        if self._motor is not None:
+            self._motor.peso_cambiado(evaluacion, anterior)
+        self._ranking = None
+        self._invalidar_expedientes(evaluacion)
+
+    def _invalidar_expedientes(self, evaluacion: Evaluacion):
+        por_id = self._por_id
+        if not por_id:
+            return
+        for id_estudiante in evaluacion.calificaciones:
+            est = por_id.get(id_estudiante)
+            if est is not None:
+                est._invalidar_expediente(self.codigo)
+
+    def _obtener_ranking(self) -> List[Tuple[float, str]]:
+        ranking = self._ranking
+        if ranking is None:
+            with _CANDADO_PEREZOSO:
+                if self._ranking is None:
+                    ids = list(self._por_id)
+                    promedios = self._obtener_motor().promedios(ids)
+                    self._en_ranking = {i: p for i, p in zip(ids, promedios) if p is not None}
+                    self._ranking = sorted((p, i) for i, p in self._en_ranking.items())
+                ranking = self._ranking
+        return ranking
+
+    def _reindexar(self, id_estudiante: str):
+        anterior = self._en_ranking.pop(id_estudiante, None)
+        if anterior is not None:
+            del self._ranking[bisect_left(self._ranking, (anterior, id_estudiante))]
+        if id_estudiante in self._por_id:
+            nuevo = self._motor.promedio(id_estudiante)
+            if nuevo is not None:
+                insort(self._ranking, (nuevo, id_estudiante))
+                self._en_ranking[id_estudiante] = nuevo
+
+    def _filas_ranking(self, entradas) -> List[Dict]:
+        return [{'id': i, 'nombre': self._por_id[i].nombre, 'promedio': round(p, 2)} for p, i in entradas]
+
+    def top_k(self, k: int) -> List[Dict]:
+        ranking = self._obtener_ranking()
+        return self._filas_ranking(reversed(ranking[max(len(ranking) - k, 0):]))
+
+    def bottom_k(self, k: int) -> List[Dict]:
+        return self._filas_ranking(self._obtener_ranking()[:max(k, 0)])
+
+    def percentil(self, p: float) -> Optional[float]:
+        ranking = self._obtener_ranking()
+        if not ranking:
+            return None
+        if not 0 <= p <= 100:
+            raise ValueError("Percentil fuera de rango")
+        posicion = min(max(ceil(p / 100.0 * len(ranking)) - 1, 0), len(ranking) - 1)
+        return ranking[posicion][0]
+
+    def rango_percentil(self, desde: float, hasta: float) -> List[Dict]:
+        if not 0 <= desde <= hasta <= 100:
+            raise ValueError("Percentil fuera de rango")
+        ranking = self._obtener_ranking()
+        n = len(ranking)
+        return self._filas_ranking(ranking[floor(desde / 100.0 * n):ceil(hasta / 100.0 * n)])
+
+    def rango_promedio(self, minimo: float, maximo: float) -> List[Dict]:
+        ranking = self._obtener_ranking()
+        inicio = bisect_left(ranking, minimo, key=lambda e: e[0])
+        fin = bisect_right(ranking, maximo, key=lambda e: e[0])
+        return self._filas_ranking(ranking[inicio:fin])
+
+    def obtener_promedio_estudiante(self, id_estudiante: str) -> Optional[float]:
+        return self._obtener_motor().promedio(id_estudiante)
+
+    def reporte_promedio_bajo(self, umbral_porcentaje: float) -> List[Dict]:
+        estudiantes = list(self._estudiantes.values())
+        promedios = self._obtener_motor().promedios([est.id for est in estudiantes])
+        resultado = []
+        for est, prom in zip(estudiantes, promedios):
+            if prom is None:
+                continue
+            if prom < umbral_porcentaje:
+                resultado.append({'id': est.id, 'nombre': est.nombre, 'promedio': round(prom, 2)})
+        return resultado
+
+    def listar_estudiantes(self) -> List[str]:
+        return [e.nombre for e in self._estudiantes.values()]
+
+    def estadisticas(self) -> List[Dict]:
+        return [ev.estadisticas() for ev in self._evaluaciones.values()]
+
+    def simular(self, escenarios: List, umbral_porcentaje: Optional[float] = None, motor: Optional[str] = None) -> List[Dict]:
+        from .escenarios import simular
+        return simular(self, escenarios, umbral_porcentaje, motor)
+
+    def _obtener_nombres(self) -> List[Tuple[str, str]]:
+        nombres = self._nombres
+        if nombres is None:
+            with _CANDADO_PEREZOSO:
+                if self._nombres is None:
+                    self._nombres = sorted((_clave_nombre(e.nombre), e.id) for e in self._por_id.values())
+                nombres = self._nombres
+        return nombres
+
+    def iterar_estudiantes(self, prefijo: str = "", cursor: Optional[Tuple[str, str]] = None) -> Iterator[Estudiante]:
+        return (est for _, est in _recorrer_nombres(self._obtener_nombres(), self._por_id, prefijo, cursor))
+
+    def pagina_estudiantes(self, prefijo: str = "", cursor: Optional[Tuple[str, str]] = None, limite: int = 50) -> Dict:
+        return _paginar(_recorrer_nombres(self._obtener_nombres(), self._por_id, prefijo, cursor), limite)
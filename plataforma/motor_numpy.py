@@ -0,0 +1,105 @@
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+class ColumnaCalificaciones(MutableMapping):
+    def __init__(self, motor: 'MotorMatriz', columna: int):
+        self._motor = motor
+        self._columna = columna
+
+    def __getitem__(self, id_estudiante: str) -> float:
+        fila = self._motor._filas.get(id_estudiante)
+        if fila is None:
+            raise KeyError(id_estudiante)
+        valor = self._motor.matriz[fila, self._columna]
+        if np.isnan(valor):
+            raise KeyError(id_estudiante)
+        return float(valor)
+
+    def __setitem__(self, id_estudiante: str, puntos: float):
+        fila = self._motor._fila(id_estudiante)
+        self._motor.matriz[fila, self._columna] = puntos
+
+    def __delitem__(self, id_estudiante: str):
+        fila = self._motor._filas.get(id_estudiante)
+        if fila is None or np.isnan(self._motor.matriz[fila, self._columna]):
+            raise KeyError(id_estudiante)
+        self._motor.matriz[fila, self._columna] = np.nan
+
+    def __iter__(self) -> Iterator[str]:
+        n = len(self._motor._ids)
+        filas = np.flatnonzero(~np.isnan(self._motor.matriz[:n, self._columna]))
+        return (self._motor._ids[f] for f in filas)
+
+    def __len__(self) -> int:
+        n = len(self._motor._ids)
+        return int(np.count_nonzero(~np.isnan(self._motor.matriz[:n, self._columna])))
+
+class MotorMatriz:
+    def __init__(self, curso, capacidad_filas: int = 64, capacidad_columnas: int = 8):
+        self.curso = curso
+        self.matriz = np.full((capacidad_filas, capacidad_columnas), np.nan)
+        self.max_puntos = np.ones(capacidad_columnas)
+        self.pesos = np.zeros(capacidad_columnas)
+        self._filas: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._columnas: Dict[int, int] = {}
+
+    def _fila(self, id_estudiante: str) -> int:
+        fila = self._filas.get(id_estudiante)
+        if fila is None:
+            fila = len(self._ids)
+            if fila == self.matriz.shape[0]:
+                extra = np.full(self.matriz.shape, np.nan)
+                self.matriz = np.vstack([self.matriz, extra])
+            self._filas[id_estudiante] = fila
+            self._ids.append(id_estudiante)
+        return fila
+
+    def agregar_evaluacion(self, evaluacion):
+        columna = len(self._columnas)
+        if columna == self.matriz.shape[1]:
+            extra = np.full(self.matriz.shape, np.nan)
+            self.matriz = np.hstack([self.matriz, extra])
+            self.max_puntos = np.concatenate([self.max_puntos, np.ones(columna)])
+            self.pesos = np.concatenate([self.pesos, np.zeros(columna)])
+        self._columnas[evaluacion.id] = columna
+        self.max_puntos[columna] = evaluacion.max_puntos
+        self.pesos[columna] = evaluacion.peso
+        vista = ColumnaCalificaciones(self, columna)
+        for id_estudiante, puntos in evaluacion.calificaciones.items():
+            vista[id_estudiante] = puntos
+        evaluacion.calificaciones = vista
+
+    def calificacion_registrada(self, evaluacion, id_estudiante: str, anterior: Optional[float], puntos: float):
+        # la vista de la columna ya escribió el valor en la matriz
+        pass
+
+    def peso_cambiado(self, evaluacion, anterior: float):
+        self.pesos[self._columnas[evaluacion.id]] = evaluacion.peso
+
+    def _sumas(self, filas: np.ndarray):
+        m = len(self._columnas)
+        puntos = self.matriz[filas, :m]
+        calificado = ~np.isnan(puntos)
+        pct = np.where(calificado, puntos, 0.0) / self.max_puntos[:m] * 100.0
+        pesos = self.pesos[:m]
+        return pct @ pesos, calificado @ pesos
+
+    def promedio(self, id_estudiante: str) -> Optional[float]:
+        fila = self._filas.get(id_estudiante)
+        if fila is None:
+            return None
+        suma_ponderada, suma_pesos = self._sumas(np.array([fila]))
+        if suma_pesos[0] == 0:
+            return None
+        return float(suma_ponderada[0] / suma_pesos[0])
+
+    def promedios(self, ids_estudiantes: List[str]) -> List[Optional[float]]:
+        filas = np.array([self._filas.get(i, -1) for i in ids_estudiantes], dtype=np.intp)
+        presentes = filas >= 0
+        suma_ponderada, suma_pesos = self._sumas(filas[presentes])
+        promedios = np.full(len(ids_estudiantes), np.nan)
+        promedios[presentes] = np.divide(suma_ponderada, suma_pesos, out=np.full_like(suma_ponderada, np.nan), where=suma_pesos != 0)
+        return [None if p != p else p for p in promedios.tolist()]
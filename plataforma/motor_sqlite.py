@@ -0,0 +1,309 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .modelo import Curso, Estudiante, Evaluacion, Examen, Profesor, Tarea, Usuario
+from .nucleo import _normalizar_correo
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    id TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    correo TEXT NOT NULL,
+    correo_norm TEXT NOT NULL,
+    carnet TEXT,
+    departamento TEXT
+);
+CREATE TABLE IF NOT EXISTS cursos (
+    codigo TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    profesor_id TEXT NOT NULL REFERENCES usuarios(id),
+    creditos REAL NOT NULL DEFAULT 1.0
+);
+CREATE TABLE IF NOT EXISTS inscripciones (
+    orden INTEGER PRIMARY KEY,
+    curso TEXT NOT NULL REFERENCES cursos(codigo),
+    estudiante TEXT NOT NULL REFERENCES usuarios(id),
+    carnet TEXT NOT NULL,
+    UNIQUE (curso, carnet)
+);
+CREATE TABLE IF NOT EXISTS evaluaciones (
+    id INTEGER PRIMARY KEY,
+    curso TEXT NOT NULL REFERENCES cursos(codigo),
+    tipo TEXT NOT NULL,
+    titulo TEXT NOT NULL,
+    max_puntos REAL NOT NULL,
+    peso REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS calificaciones (
+    curso TEXT NOT NULL,
+    evaluacion INTEGER NOT NULL REFERENCES evaluaciones(id),
+    estudiante TEXT NOT NULL,
+    puntos REAL NOT NULL,
+    PRIMARY KEY (curso, evaluacion, estudiante)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_evaluaciones_curso ON evaluaciones (curso, id);
+CREATE INDEX IF NOT EXISTS ix_calificaciones_estudiante ON calificaciones (curso, estudiante, evaluacion);
+CREATE INDEX IF NOT EXISTS ix_cursos_profesor ON cursos (profesor_id);
+CREATE INDEX IF NOT EXISTS ix_usuarios_tipo ON usuarios (tipo);
+CREATE INDEX IF NOT EXISTS ix_usuarios_carnet ON usuarios (carnet);
+CREATE INDEX IF NOT EXISTS ix_usuarios_correo ON usuarios (correo_norm);
+INSERT OR IGNORE INTO meta (clave, valor) VALUES ('next_eval_id', 1);
+"""
+
+SQL_PROMEDIO = """
+SELECT SUM(c.puntos / e.max_puntos * 100.0 * e.peso), SUM(e.peso)
+FROM calificaciones c JOIN evaluaciones e ON e.id = c.evaluacion
+WHERE c.curso = ? AND c.estudiante = ?
+"""
+
+SQL_REPORTE = """
+SELECT i.estudiante, u.nombre, SUM(c.puntos / e.max_puntos * 100.0 * e.peso) / SUM(e.peso) AS promedio
+FROM inscripciones i
+JOIN usuarios u ON u.id = i.estudiante
+JOIN calificaciones c ON c.curso = i.curso AND c.estudiante = i.estudiante
+JOIN evaluaciones e ON e.id = c.evaluacion
+WHERE i.curso = ?
+GROUP BY i.orden
+HAVING SUM(e.peso) != 0 AND promedio < ?
+ORDER BY i.orden
+"""
+
+CLASES_EVALUACION = {"examen": Examen, "tarea": Tarea}
+
+def _fila(registro) -> Optional[Tuple[str, float]]:
+    # None si la fila no es un par (id, puntos) utilizable
+    try:
+        estudiante_id, puntos = registro
+        hash(estudiante_id)
+    except (TypeError, ValueError):
+        return None
+    return estudiante_id, puntos
+
+class PlataformaSQLite:
+    def __init__(self, ruta: str, lectores: int = 4):
+        if ruta == ":memory:":
+            raise ValueError("El motor SQLite requiere un archivo para compartir conexiones")
+        self.ruta = ruta
+        self._escritor = self._conectar()
+        self._escritor.executescript(ESQUEMA)
+        self._candado_escritura = threading.Lock()
+        self._migrar()
+        self._lectores: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(lectores):
+            self._lectores.put(self._conectar())
+
+    def _migrar(self):
+        # bases creadas antes de correo_norm: el correo se comparaba con lower()
+        # de SQLite, que solo pasa a minúsculas ASCII; se normaliza como Plataforma
+        columnas = [fila[1] for fila in self._escritor.execute("PRAGMA table_info(usuarios)")]
+        if "correo_norm" in columnas:
+            return
+        with self._escritura() as db:
+            db.execute("ALTER TABLE usuarios ADD COLUMN correo_norm TEXT NOT NULL DEFAULT ''")
+            db.executemany("UPDATE usuarios SET correo_norm = ? WHERE id = ?",
+                           [(_normalizar_correo(correo), idu) for idu, correo in db.execute("SELECT id, correo FROM usuarios").fetchall()])
+            db.execute("DROP INDEX IF EXISTS ix_usuarios_correo")
+            db.execute("CREATE INDEX ix_usuarios_correo ON usuarios (correo_norm)")
+
+    def _conectar(self) -> sqlite3.Connection:
+        conexion = sqlite3.connect(self.ruta, check_same_thread=False, isolation_level=None, cached_statements=256)
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")
+        conexion.execute("PRAGMA foreign_keys=ON")
+        return conexion
+
+    @contextmanager
+    def _escritura(self):
+        with self._candado_escritura:
+            self._escritor.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._escritor
+            except BaseException:
+                self._escritor.execute("ROLLBACK")
+                raise
+            self._escritor.execute("COMMIT")
+
+    @contextmanager
+    def _lectura(self):
+        conexion = self._lectores.get()
+        try:
+            yield conexion
+        finally:
+            self._lectores.put(conexion)
+
+    def cerrar(self):
+        with self._candado_escritura:
+            self._escritor.close()
+        while not self._lectores.empty():
+            self._lectores.get().close()
+
+    def _curso_existe(self, db: sqlite3.Connection, codigo_curso: str) -> bool:
+        return db.execute("SELECT 1 FROM cursos WHERE codigo = ?", (codigo_curso,)).fetchone() is not None
+
+    def _tipo_usuario(self, db: sqlite3.Connection, id_usuario: str) -> Optional[str]:
+        fila = db.execute("SELECT tipo FROM usuarios WHERE id = ?", (id_usuario,)).fetchone()
+        return None if fila is None else fila[0]
+
+    def registrar_usuario(self, usuario: Usuario):
+        if isinstance(usuario, Estudiante):
+            fila = (usuario.id, "estudiante", usuario.nombre, usuario.email, usuario.carnet, None)
+        elif isinstance(usuario, Profesor):
+            fila = (usuario.id, "profesor", usuario.nombre, usuario.email, None, usuario.departamento)
+        else:
+            fila = (usuario.id, "usuario", usuario.nombre, usuario.email, None, None)
+        correo = _normalizar_correo(usuario.email)
+        with self._escritura() as db:
+            if self._tipo_usuario(db, usuario.id) is not None:
+                raise ValueError("Usuario ya registrado")
+            if fila[4] and db.execute("SELECT 1 FROM usuarios WHERE carnet = ?", (fila[4],)).fetchone():
+                raise ValueError("Carnet ya registrado")
+            if correo and db.execute("SELECT 1 FROM usuarios WHERE correo_norm = ?", (correo,)).fetchone():
+                raise ValueError("Correo ya registrado")
+            db.execute("INSERT INTO usuarios (id, tipo, nombre, correo, correo_norm, carnet, departamento) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       fila[:4] + (correo,) + fila[4:])
+
+    def crear_curso(self, nombre: str, codigo: str, profesor_id: str, creditos: float = 1.0) -> Curso:
+        with self._escritura() as db:
+            if self._curso_existe(db, codigo):
+                raise ValueError("Código de curso ya existente")
+            fila = db.execute("SELECT nombre, correo, departamento FROM usuarios WHERE id = ? AND tipo = 'profesor'", (profesor_id,)).fetchone()
+            if fila is None:
+                raise ValueError("Profesor inválido o no encontrado")
+            curso = Curso(nombre, codigo, Profesor(profesor_id, *fila), creditos=creditos)
+            db.execute("INSERT INTO cursos (codigo, nombre, profesor_id, creditos) VALUES (?, ?, ?, ?)", (codigo, nombre, profesor_id, curso.creditos))
+        return curso
+
+    def inscribir_estudiante(self, codigo_curso: str, estudiante_id: str):
+        with self._escritura() as db:
+            if not self._curso_existe(db, codigo_curso):
+                raise ValueError("Curso no encontrado")
+            fila = db.execute("SELECT carnet FROM usuarios WHERE id = ? AND tipo = 'estudiante'", (estudiante_id,)).fetchone()
+            if fila is None:
+                raise ValueError("Usuario no es estudiante o no encontrado")
+            try:
+                db.execute("INSERT INTO inscripciones (curso, estudiante, carnet) VALUES (?, ?, ?)", (codigo_curso, estudiante_id, fila[0]))
+            except sqlite3.IntegrityError:
+                raise ValueError("Estudiante ya inscrito en el curso")
+
+    def crear_evaluacion(self, codigo_curso: str, tipo: str, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs) -> Evaluacion:
+        with self._escritura() as db:
+            if not self._curso_existe(db, codigo_curso):
+                raise ValueError("Curso no encontrado")
+            (id_eval,) = db.execute("UPDATE meta SET valor = valor + 1 WHERE clave = 'next_eval_id' RETURNING valor - 1").fetchone()
+        # como en Plataforma, un ID se consume aunque la evaluación sea inválida
+        ev = CLASES_EVALUACION.get(tipo.lower(), Evaluacion)(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        with self._escritura() as db:
+            db.execute("INSERT INTO evaluaciones (id, curso, tipo, titulo, max_puntos, peso) VALUES (?, ?, ?, ?, ?, ?)",
+                       (id_eval, codigo_curso, getattr(ev, "tipo", "evaluacion"), titulo, ev.max_puntos, ev.peso))
+        return ev
+
+    def _buscar_evaluacion(self, db: sqlite3.Connection, codigo_curso: str, id_eval: int) -> float:
+        fila = db.execute("SELECT max_puntos FROM evaluaciones WHERE id = ? AND curso = ?", (id_eval, codigo_curso)).fetchone()
+        if fila is None:
+            if not self._curso_existe(db, codigo_curso):
+                raise ValueError("Curso no encontrado")
+            raise ValueError("Evaluación no encontrada en el curso")
+        return fila[0]
+
+    def registrar_calificacion(self, codigo_curso: str, id_eval: int, estudiante_id: str, puntos: float):
+        with self._escritura() as db:
+            max_puntos = self._buscar_evaluacion(db, codigo_curso, id_eval)
+            if self._tipo_usuario(db, estudiante_id) != "estudiante":
+                raise ValueError("Usuario no es estudiante o no existe")
+            puntos = float(puntos)
+            if puntos < 0 or puntos > max_puntos:
+                raise ValueError("Puntos fuera de rango")
+            db.execute("INSERT OR REPLACE INTO calificaciones (curso, evaluacion, estudiante, puntos) VALUES (?, ?, ?, ?)",
+                       (codigo_curso, id_eval, estudiante_id, puntos))
+
+    def registrar_calificaciones_lote(self, codigo_curso: str, id_eval: int, filas: Iterable[Tuple[str, float]]) -> List[Dict]:
+        with self._escritura() as db:
+            max_puntos = self._buscar_evaluacion(db, codigo_curso, id_eval)
+            filas = [_fila(registro) for registro in filas]
+            ids = {f[0] for f in filas if f is not None and isinstance(f[0], str)}
+            estudiantes = set()
+            lista = list(ids)
+            for i in range(0, len(lista), 500):
+                parte = lista[i:i + 500]
+                marcas = ",".join("?" * len(parte))
+                estudiantes.update(r[0] for r in db.execute(f"SELECT id FROM usuarios WHERE tipo = 'estudiante' AND id IN ({marcas})", parte))
+            validas = []
+            errores: List[Dict] = []
+            for fila, registro in enumerate(filas):
+                if registro is None:
+                    errores.append({'fila': fila, 'id': None, 'error': "Fila inválida"})
+                    continue
+                estudiante_id, puntos = registro
+                if estudiante_id not in estudiantes:
+                    errores.append({'fila': fila, 'id': estudiante_id, 'error': "Usuario no es estudiante o no existe"})
+                    continue
+                try:
+                    puntos = float(puntos)
+                except (TypeError, ValueError):
+                    errores.append({'fila': fila, 'id': estudiante_id, 'error': "Puntos no numéricos"})
+                    continue
+                if not 0 <= puntos <= max_puntos:
+                    errores.append({'fila': fila, 'id': estudiante_id, 'error': "Puntos fuera de rango"})
+                    continue
+                validas.append((codigo_curso, id_eval, estudiante_id, puntos))
+            if errores:
+                return errores
+            db.executemany("INSERT OR REPLACE INTO calificaciones (curso, evaluacion, estudiante, puntos) VALUES (?, ?, ?, ?)", validas)
+        return []
+
+    def obtener_promedio_estudiante_en_curso(self, codigo_curso: str, estudiante_id: str) -> Optional[float]:
+        with self._lectura() as db:
+            if not self._curso_existe(db, codigo_curso):
+                raise ValueError("Curso no encontrado")
+            suma_ponderada, suma_pesos = db.execute(SQL_PROMEDIO, (codigo_curso, estudiante_id)).fetchone()
+        if not suma_pesos:
+            return None
+        return suma_ponderada / suma_pesos
+
+    def reporte_estudiantes_promedio_bajo(self, codigo_curso: str, umbral_porcentaje: float) -> List[Dict]:
+        with self._lectura() as db:
+            if not self._curso_existe(db, codigo_curso):
+                raise ValueError("Curso no encontrado")
+            filas = db.execute(SQL_REPORTE, (codigo_curso, umbral_porcentaje)).fetchall()
+        return [{'id': idu, 'nombre': nombre, 'promedio': round(prom, 2)} for idu, nombre, prom in filas]
+
+    def listar_profesores(self) -> List[Profesor]:
+        with self._lectura() as db:
+            filas = db.execute("SELECT id, nombre, correo, departamento FROM usuarios WHERE tipo = 'profesor' ORDER BY rowid").fetchall()
+        return [Profesor(*fila) for fila in filas]
+
+    def listar_cursos(self) -> List[Curso]:
+        with self._lectura() as db:
+            filas = db.execute("""
+                SELECT c.nombre, c.codigo, c.creditos, u.id, u.nombre, u.correo, u.departamento
+                FROM cursos c JOIN usuarios u ON u.id = c.profesor_id ORDER BY c.rowid
+            """).fetchall()
+        return [Curso(nombre, codigo, Profesor(*profesor), creditos=creditos) for nombre, codigo, creditos, *profesor in filas]
+
+    def buscar_por_carnet(self, carnet: str) -> Optional[Estudiante]:
+        with self._lectura() as db:
+            fila = db.execute("SELECT id, nombre, correo, carnet FROM usuarios WHERE carnet = ? AND tipo = 'estudiante'", (carnet,)).fetchone()
+        return None if fila is None else Estudiante(*fila)
+
+    def buscar_por_correo(self, correo: str) -> Optional[Usuario]:
+        correo = _normalizar_correo(correo)
+        if not correo:
+            return None
+        with self._lectura() as db:
+            fila = db.execute("SELECT tipo, id, nombre, correo, carnet, departamento FROM usuarios WHERE correo_norm = ?", (correo,)).fetchone()
+        if fila is None:
+            return None
+        tipo, idu, nombre, correo, carnet, departamento = fila
+        if tipo == "estudiante":
+            return Estudiante(idu, nombre, correo, carnet)
+        if tipo == "profesor":
+            return Profesor(idu, nombre, correo, departamento)
+        return Usuario(idu, nombre, correo)
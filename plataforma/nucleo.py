@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+from bisect import insort
+
+from .modelo import (SIN_CANDADO, Curso, Estudiante, Evaluacion, Examen, Profesor, Tarea, Usuario, _clave_nombre, _paginar,
+                     _recorrer_lista, _recorrer_nombres)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def _normalizar_correo(correo: str) -> str:
+    return correo.strip().lower()
+
+def _armar_expediente(est: Estudiante, filas: Iterable[Tuple[str, str, float, Optional[float]]]) -> Dict:
+    # filas: (código, nombre, créditos, promedio sin redondear) por curso
+    cursos = []
+    suma_ponderada = 0.0
+    suma_creditos = 0.0
+    for codigo, nombre, creditos, prom in filas:
+        cursos.append({'codigo': codigo, 'nombre': nombre, 'creditos': creditos, 'promedio': None if prom is None else round(prom, 2)})
+        if prom is not None:
+            suma_ponderada += prom * creditos
+            suma_creditos += creditos
+    return {
+        'id': est.id,
+        'nombre': est.nombre,
+        'cursos': cursos,
+        'promedio_general': round(suma_ponderada / suma_creditos, 2) if suma_creditos else None,
+    }
+
+class Plataforma:
+    def __init__(self, concurrente: bool = False, compacto: bool = False, instrumentar: bool = False):
+        self.usuarios: Dict[str, Usuario] = {}
+        # registros por rol e índices únicos, mantenidos por registrar_usuario
+        self.profesores: Dict[str, Profesor] = {}
+        self.estudiantes: Dict[str, Estudiante] = {}
+        self._por_carnet: Dict[str, Estudiante] = {}
+        self._por_correo: Dict[str, Usuario] = {}
+        # índices secundarios para listados paginados; las listas solo crecen
+        # y el índice de nombres de estudiantes se arma con la primera búsqueda
+        self._lista_profesores: List[Profesor] = []
+        self._profesores_por_departamento: Dict[str, List[Profesor]] = {}
+        self._lista_cursos: List[Curso] = []
+        self._cursos_por_profesor: Dict[str, List[Curso]] = {}
+        self._cursos_por_departamento: Dict[str, List[Curso]] = {}
+        self._nombres_estudiantes: Optional[List[Tuple[str, str]]] = None
+        self.cursos: Dict[str, Curso] = {}
+        self._evaluaciones: Dict[int, Tuple[Curso, Evaluacion]] = {}
+        self.next_eval_id = 1
+        self._wal = None
+        self.concurrente = False
+        self.compacto = compacto
+        self._candado_registro = self._candado_ids = SIN_CANDADO
+        self._metricas = None
+        # tupla inmutable: los publicadores la leen sin candado
+        self._suscripciones: Tuple = ()
+        if concurrente:
+            self.activar_concurrencia()
+        if instrumentar:
+            self.activar_instrumentacion()
+
+    def activar_concurrencia(self):
+        import threading
+        from .concurrencia import CandadoLectoresEscritor
+        self._candado_registro = threading.Lock()
+        self._candado_ids = threading.Lock()
+        for curso in self.cursos.values():
+            curso._candado = CandadoLectoresEscritor()
+        if self._metricas is not None:
+            self._metricas.activar_concurrencia()
+        self.concurrente = True
+
+    def activar_instrumentacion(self):
+        if self._metricas is not None:
+            return
+        from .metricas import Metricas
+        metricas = Metricas(self.concurrente)
+        metricas.instrumentar(self)
+        self._metricas = metricas
+
+    def metricas(self) -> Dict:
+        from .metricas import tamanos
+        return {
+            'operaciones': self._metricas.resumen() if self._metricas is not None else {},
+            'tamanos': tamanos(self),
+        }
+
+    def metricas_prometheus(self) -> str:
+        from .metricas import prometheus
+        return prometheus(self.metricas())
+
+    def _asignar_id_eval(self) -> int:
+        with self._candado_ids:
+            id_eval = self.next_eval_id
+            self.next_eval_id += 1
+        return id_eval
+
+    def suscribir(self, cursos: Optional[Iterable[str]] = None, estudiantes: Optional[Iterable[str]] = None,
+                  tipos: Optional[Iterable[str]] = None, capacidad: int = 1024, politica: str = "descartar", espera: float = 1.0):
+        from .suscripciones import Suscripcion
+        sub = Suscripcion(cursos, estudiantes, tipos, capacidad=capacidad, politica=politica, espera=espera)
+        with self._candado_registro:
+            sub._plataforma = self
+            self._suscripciones = self._suscripciones + (sub,)
+        return sub
+
+    def _quitar_suscripcion(self, sub):
+        with self._candado_registro:
+            self._suscripciones = tuple(s for s in self._suscripciones if s is not sub)
+
+    def _publicar(self, curso: Curso, cambios: List[tuple]):
+        # cambios: (tipo, estudiante_id, id_eval, puntos, anterior); se llama
+        # dentro del candado de escritura del curso, así cada suscriptor recibe
+        # los eventos de un curso en el mismo orden en que se aplicaron. La
+        # espera de "bloquear" se cuenta desde aquí para toda la llamada: el
+        # candado no queda tomado más de `espera` por muchos eventos que haya
+        from time import monotonic
+        from .suscripciones import Evento
+        inicio = monotonic()
+        eventos, destinos = [], []
+        for tipo, estudiante_id, id_eval, puntos, anterior in cambios:
+            evento = Evento(tipo, curso.codigo, estudiante_id, id_eval, puntos, anterior)
+            interesados = [sub for sub in self._suscripciones if sub.acepta(evento)]
+            if interesados:
+                eventos.append(evento)
+                destinos.append(interesados)
+        if not eventos:
+            return
+        # el promedio actualizado va en el evento; se calcula en una sola pasada
+        ids = [e.estudiante for e in eventos if e.tipo == "calificacion"]
+        if ids:
+            promedios = iter(curso._obtener_motor().promedios(ids))
+            eventos = [e._replace(promedio=next(promedios)) if e.tipo == "calificacion" else e for e in eventos]
+        for evento, interesados in zip(eventos, destinos):
+            for sub in interesados:
+                sub._encolar(evento, inicio)
+
+    def _registrar(self, registro: tuple):
+        self._wal.agregar(registro)
+        if self._wal.debe_compactar():
+            if self.concurrente:
+                from .wal import compactar_en_segundo_plano
+                compactar_en_segundo_plano(self)
+            else:
+                self.compactar(solo_si_hace_falta=True)
+
+    def registrar_usuario(self, usuario: Usuario):
+        es_estudiante = isinstance(usuario, Estudiante)
+        correo = _normalizar_correo(usuario.email)
+        with self._candado_registro:
+            if usuario.id in self.usuarios:
+                raise ValueError("Usuario ya registrado")
+            if es_estudiante and usuario.carnet and usuario.carnet in self._por_carnet:
+                raise ValueError("Carnet ya registrado")
+            if correo and correo in self._por_correo:
+                raise ValueError("Correo ya registrado")
+            self.usuarios[usuario.id] = usuario
+            if es_estudiante:
+                self.estudiantes[usuario.id] = usuario
+                if usuario.carnet:
+                    self._por_carnet[usuario.carnet] = usuario
+                if self._nombres_estudiantes is not None:
+                    insort(self._nombres_estudiantes, (_clave_nombre(usuario.nombre), usuario.id))
+            elif isinstance(usuario, Profesor):
+                self.profesores[usuario.id] = usuario
+                self._lista_profesores.append(usuario)
+                self._profesores_por_departamento.setdefault(usuario.departamento, []).append(usuario)
+            if correo:
+                self._por_correo[correo] = usuario
+            if self._wal is not None:
+                self._registrar(self._wal.registro_usuario(usuario))
+
+    def crear_curso(self, nombre: str, codigo: str, profesor_id: str, motor: str = "dict", creditos: float = 1.0) -> Curso:
+        with self._candado_registro:
+            if codigo in self.cursos:
+                raise ValueError("Código de curso ya existente")
+            profesor = self.profesores.get(profesor_id)
+            if profesor is None:
+                raise ValueError("Profesor inválido o no encontrado")
+            curso = Curso(nombre, codigo, profesor, motor=motor, creditos=creditos, compacto=self.compacto)
+            if self.concurrente:
+                from .concurrencia import CandadoLectoresEscritor
+                curso._candado = CandadoLectoresEscritor()
+            self.cursos[codigo] = curso
+            self._lista_cursos.append(curso)
+            self._cursos_por_profesor.setdefault(profesor.id, []).append(curso)
+            self._cursos_por_departamento.setdefault(profesor.departamento, []).append(curso)
+            if self._wal is not None:
+                self._registrar(("c", nombre, codigo, profesor_id, motor, curso.creditos))
+        return curso
+
+    def inscribir_estudiante(self, codigo_curso: str, estudiante_id: str):
+        curso = self.cursos.get(codigo_curso)
+        estudiante = self.estudiantes.get(estudiante_id)
+        if curso is None:
+            raise ValueError("Curso no encontrado")
+        if estudiante is None:
+            raise ValueError("Usuario no es estudiante o no encontrado")
+        with curso._candado.escritura():
+            curso.inscribir(estudiante)
+            if self._wal is not None:
+                self._registrar(("i", codigo_curso, estudiante_id))
+            if self._suscripciones:
+                self._publicar(curso, [("inscripcion", estudiante_id, None, None, None)])
+
+    def crear_evaluacion(self, codigo_curso: str, tipo: str, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs) -> Evaluacion:
+        curso = self.cursos.get(codigo_curso)
+        if curso is None:
+            raise ValueError("Curso no encontrado")
+        id_eval = self._asignar_id_eval()
+        if tipo.lower() == "examen":
+            ev = Examen(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        elif tipo.lower() == "tarea":
+            ev = Tarea(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        else:
+            ev = Evaluacion(id_eval, titulo, max_puntos, peso=peso, **kwargs)
+        with curso._candado.escritura():
+            curso.agregar_evaluacion(ev)
+            self._evaluaciones[id_eval] = (curso, ev)
+            if self._wal is not None:
+                self._registrar(("e", codigo_curso, tipo, titulo, ev.max_puntos, ev.peso, id_eval))
+            if self._suscripciones:
+                self._publicar(curso, [("evaluacion", None, id_eval, None, None)])
+        return ev
+
+    def _buscar_evaluacion(self, codigo_curso: str, id_eval: int) -> Evaluacion:
+        curso, ev = self._evaluaciones.get(id_eval, (None, None))
+        if curso is None or curso.codigo != codigo_curso:
+            if codigo_curso not in self.cursos:
+                raise ValueError("Curso no encontrado")
+            raise ValueError("Evaluación no encontrada en el curso")
+        return ev
+
+    def registrar_calificacion(self, codigo_curso: str, id_eval: int, estudiante_id: str, puntos: float):
+        ev = self._buscar_evaluacion(codigo_curso, id_eval)
+        est = self.estudiantes.get(estudiante_id)
+        if est is None:
+            raise ValueError("Usuario no es estudiante o no existe")
+        # los ids que llegan de CSV, WAL o del servicio son objetos nuevos; usar
+        # el del estudiante registrado evita guardar una copia por calificación
+        estudiante_id = est.id
+        with ev._curso._candado.escritura():
+            publicar = bool(self._suscripciones)
+            if publicar:
+                anterior = ev.calificaciones.get(estudiante_id)
+            ev.registrar_calificacion(estudiante_id, puntos)
+            if self._wal is not None:
+                self._registrar(("g", codigo_curso, id_eval, estudiante_id, ev.calificaciones[estudiante_id]))
+            if publicar:
+                nuevo = ev.calificaciones[estudiante_id]
+                if nuevo != anterior:
+                    self._publicar(ev._curso, [("calificacion", estudiante_id, id_eval, nuevo, anterior)])
+
+    def registrar_calificaciones_lote(self, codigo_curso: str, id_eval: int, filas: Iterable[Tuple[str, float]]) -> List[Dict]:
+        ev = self._buscar_evaluacion(codigo_curso, id_eval)
+        estudiantes = self.estudiantes
+        max_puntos = ev.max_puntos
+        validas: List[Tuple[str, float]] = []
+        errores: List[Dict] = []
+        for fila, registro in enumerate(filas):
+            try:
+                estudiante_id, puntos = registro
+                est = estudiantes.get(estudiante_id)
+            except (TypeError, ValueError):
+                errores.append({'fila': fila, 'id': None, 'error': "Fila inválida"})
+                continue
+            if est is None:
+                errores.append({'fila': fila, 'id': estudiante_id, 'error': "Usuario no es estudiante o no existe"})
+                continue
+            try:
+                puntos = float(puntos)
+            except (TypeError, ValueError):
+                errores.append({'fila': fila, 'id': estudiante_id, 'error': "Puntos no numéricos"})
+                continue
+            if not 0 <= puntos <= max_puntos:
+                errores.append({'fila': fila, 'id': estudiante_id, 'error': "Puntos fuera de rango"})
+                continue
+            validas.append((est.id, puntos))
+        if errores:
+            return errores
+        with ev._curso._candado.escritura():
+            publicar = bool(self._suscripciones)
+            if publicar:
+                # el valor previo de cada fila, contando las repetidas dentro del lote
+                previos = {}
+                for estudiante_id, _ in validas:
+                    if estudiante_id not in previos:
+                        previos[estudiante_id] = ev.calificaciones.get(estudiante_id)
+            for estudiante_id, puntos in validas:
+                ev.registrar_calificacion(estudiante_id, puntos)
+            if self._wal is not None:
+                self._registrar(("l", codigo_curso, id_eval, validas))
+            if publicar:
+                cambios = [("calificacion", e, id_eval, ev.calificaciones[e], anterior) for e, anterior in previos.items()
+                           if ev.calificaciones[e] != anterior]
+                if cambios:
+                    self._publicar(ev._curso, cambios)
+        return []
+
+    def obtener_promedio_estudiante_en_curso(self, codigo_curso: str, estudiante_id: str) -> Optional[float]:
+        curso = self.cursos.get(codigo_curso)
+        if curso is None:
+            raise ValueError("Curso no encontrado")
+        with curso._candado.lectura():
+            return curso.obtener_promedio_estudiante(estudiante_id)
+
+    def reporte_estudiantes_promedio_bajo(self, codigo_curso: str, umbral_porcentaje: float) -> List[Dict]:
+        curso = self.cursos.get(codigo_curso)
+        if curso is None:
+            raise ValueError("Curso no encontrado")
+        with curso._candado.lectura():
+            return curso.reporte_promedio_bajo(umbral_porcentaje)
+
+    def _curso_para_lectura(self, codigo_curso: str) -> Curso:
+        curso = self.cursos.get(codigo_curso)
+        if curso is None:
+            raise ValueError("Curso no encontrado")
+        return curso
+
+    def top_k(self, codigo_curso: str, k: int) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.top_k(k)
+
+    def bottom_k(self, codigo_curso: str, k: int) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.bottom_k(k)
+
+    def percentil(self, codigo_curso: str, p: float) -> Optional[float]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.percentil(p)
+
+    def rango_percentil(self, codigo_curso: str, desde: float, hasta: float) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.rango_percentil(desde, hasta)
+
+    def rango_promedio(self, codigo_curso: str, minimo: float, maximo: float) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.rango_promedio(minimo, maximo)
+
+    def estadisticas_curso(self, codigo_curso: str) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.estadisticas()
+
+    def simular_escenarios(self, codigo_curso: str, escenarios: List, umbral_porcentaje: Optional[float] = None) -> List[Dict]:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.simular(escenarios, umbral_porcentaje)
+
+    def obtener_expediente(self, estudiante_id: str) -> Dict:
+        est = self.estudiantes.get(estudiante_id)
+        if est is None:
+            raise ValueError("Usuario no es estudiante o no existe")
+        expediente = est._expediente
+        if expediente is not None:
+            return expediente
+        version = est._version_expediente
+        expediente = _armar_expediente(est, self._filas_expediente(est))
+        est._guardar_expediente(expediente, version)
+        return expediente
+
+    def _filas_expediente(self, est: Estudiante) -> List[Tuple[str, str, float, Optional[float]]]:
+        filas = []
+        for curso in list(est._cursos.values()):
+            # el promedio se calcula y guarda bajo el candado del curso para no
+            # dejar en caché un valor que una escritura concurrente ya invalidó
+            with curso._candado.lectura():
+                if curso.codigo in est._promedios:
+                    prom = est._promedios[curso.codigo]
+                else:
+                    prom = est._promedios[curso.codigo] = curso.obtener_promedio_estudiante(est.id)
+            filas.append((curso.codigo, curso.nombre, curso.creditos, prom))
+        return filas
+
+    def reporte_global_promedio_bajo(self, umbral_porcentaje: float, procesos: Optional[int] = None) -> Dict[str, List[Dict]]:
+        from .reportes_paralelos import reporte_global_promedio_bajo
+        return reporte_global_promedio_bajo(self, umbral_porcentaje, procesos)
+
+    def guardar(self, ruta: str):
+        from .instantanea import guardar
+        guardar(self, ruta)
+
+    @classmethod
+    def cargar(cls, ruta: str, **opciones) -> 'Plataforma':
+        from .instantanea import cargar
+        return cargar(ruta, cls, **opciones)
+
+    @classmethod
+    def recuperar(cls, ruta_instantanea: str, ruta_log: str, **opciones) -> 'Plataforma':
+        from .wal import recuperar
+        return recuperar(ruta_instantanea, ruta_log, cls, **opciones)
+
+    def compactar(self, solo_si_hace_falta: bool = False):
+        if self._wal is None:
+            raise ValueError("La plataforma no tiene bitácora de escritura")
+        from .wal import compactar
+        compactar(self, solo_si_hace_falta)
+
+    def cerrar(self):
+        if self._wal is not None:
+            self._wal.cerrar()
+            self._wal = None
+
+    def listar_profesores(self) -> List[Profesor]:
+        return list(self.profesores.values())
+
+    def listar_cursos(self) -> List[Curso]:
+        return list(self.cursos.values())
+
+    def _recorrer_profesores(self, departamento: Optional[str], cursor: Optional[int]):
+        lista = self._lista_profesores if departamento is None else self._profesores_por_departamento.get(departamento, [])
+        return _recorrer_lista(lista, cursor)
+
+    def _recorrer_cursos(self, profesor_id: Optional[str], departamento: Optional[str], cursor: Optional[int]):
+        if profesor_id is not None:
+            lista = self._cursos_por_profesor.get(profesor_id, [])
+            profesor = self.profesores.get(profesor_id)
+            if departamento is not None and (profesor is None or profesor.departamento != departamento):
+                lista = []
+        elif departamento is not None:
+            lista = self._cursos_por_departamento.get(departamento, [])
+        else:
+            lista = self._lista_cursos
+        return _recorrer_lista(lista, cursor)
+
+    def _obtener_nombres_estudiantes(self) -> List[Tuple[str, str]]:
+        with self._candado_registro:
+            if self._nombres_estudiantes is None:
+                self._nombres_estudiantes = sorted((_clave_nombre(e.nombre), e.id) for e in self.estudiantes.values())
+            return self._nombres_estudiantes
+
+    def iterar_profesores(self, departamento: Optional[str] = None, cursor: Optional[int] = None) -> Iterator[Profesor]:
+        return (p for _, p in self._recorrer_profesores(departamento, cursor))
+
+    def pagina_profesores(self, departamento: Optional[str] = None, cursor: Optional[int] = None, limite: int = 50) -> Dict:
+        return _paginar(self._recorrer_profesores(departamento, cursor), limite)
+
+    def iterar_cursos(self, profesor_id: Optional[str] = None, departamento: Optional[str] = None,
+                      cursor: Optional[int] = None) -> Iterator[Curso]:
+        return (c for _, c in self._recorrer_cursos(profesor_id, departamento, cursor))
+
+    def pagina_cursos(self, profesor_id: Optional[str] = None, departamento: Optional[str] = None,
+                      cursor: Optional[int] = None, limite: int = 50) -> Dict:
+        return _paginar(self._recorrer_cursos(profesor_id, departamento, cursor), limite)
+
+    def iterar_estudiantes(self, prefijo: str = "", cursor: Optional[Tuple[str, str]] = None) -> Iterator[Estudiante]:
+        return (e for _, e in _recorrer_nombres(self._obtener_nombres_estudiantes(), self.estudiantes, prefijo, cursor))
+
+    def pagina_estudiantes(self, prefijo: str = "", cursor: Optional[Tuple[str, str]] = None, limite: int = 50) -> Dict:
+        indice = self._obtener_nombres_estudiantes()
+        with self._candado_registro:
+            return _paginar(_recorrer_nombres(indice, self.estudiantes, prefijo, cursor), limite)
+
+    def pagina_estudiantes_curso(self, codigo_curso: str, prefijo: str = "", cursor: Optional[Tuple[str, str]] = None,
+                                 limite: int = 50) -> Dict:
+        curso = self._curso_para_lectura(codigo_curso)
+        with curso._candado.lectura():
+            return curso.pagina_estudiantes(prefijo, cursor, limite)
+
+    def buscar_por_carnet(self, carnet: str) -> Optional[Estudiante]:
+        return self._por_carnet.get(carnet)
+
+    def buscar_por_correo(self, correo: str) -> Optional[Usuario]:
+        return self._por_correo.get(_normalizar_correo(correo))
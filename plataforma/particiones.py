@@ -0,0 +1,260 @@
+import os
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .modelo import SIN_CANDADO, Curso, Estudiante, Evaluacion, Profesor, Usuario
+from .nucleo import Plataforma, _armar_expediente
+
+# Despliegue particionado: los cursos se reparten entre varias Plataforma
+# independientes (una por periodo, o por hash del código) y un enrutador
+# decide a cuál va cada operación. Los usuarios se registran una sola vez en
+# el enrutador; cada partición recibe su propia copia de los profesores y
+# estudiantes que usa, así una partición no retiene objetos de otra.
+# Los periodos viejos se congelan en una instantánea de solo lectura y se
+# vuelven a abrir (mapeados en memoria) cuando se consultan, con a lo sumo
+# `max_abiertas` abiertas a la vez. Como sus notas ya no cambian, al congelar
+# se guarda aparte el promedio de cada estudiante en cada curso: el expediente
+# no necesita abrir periodos viejos.
+MODOS = ("periodo", "hash")
+
+def _copia(usuario: Usuario) -> Usuario:
+    if isinstance(usuario, Estudiante):
+        return Estudiante(usuario.id, usuario.nombre, usuario.email, usuario.carnet)
+    if isinstance(usuario, Profesor):
+        return Profesor(usuario.id, usuario.nombre, usuario.email, usuario.departamento)
+    return Usuario(usuario.id, usuario.nombre, usuario.email)
+
+class PlataformaParticionada:
+    def __init__(self, por: str = "periodo", periodo_actual: str = "actual", particiones: int = 8,
+                 directorio: Optional[str] = None, max_abiertas: int = 4, **opciones):
+        if por not in MODOS:
+            raise ValueError("Modo de partición desconocido")
+        if por == "hash" and particiones <= 0:
+            raise ValueError("La cantidad de particiones debe ser > 0")
+        self.por = por
+        self.periodo_actual = periodo_actual
+        self.n_particiones = particiones
+        self.directorio = directorio
+        self.max_abiertas = max_abiertas
+        self._opciones = opciones
+        # identidad compartida: un solo registro de usuarios con sus índices únicos
+        self._identidad = Plataforma(concurrente=opciones.get("concurrente", False))
+        self.usuarios = self._identidad.usuarios
+        self.profesores = self._identidad.profesores
+        self.estudiantes = self._identidad.estudiantes
+        self._activas: Dict[str, Plataforma] = {}
+        # por partición activa: las escrituras lo toman en lectura desde que la
+        # buscan hasta que terminan, y congelar en exclusiva para esperarlas
+        self._candados_particion: Dict[str, object] = {}
+        # particiones ya sacadas de _activas que todavía se están guardando
+        self._congelando: Dict[str, Plataforma] = {}
+        self._congeladas: Dict[str, str] = {}
+        # por partición congelada: estudiante -> ((código, nombre, créditos, promedio), ...)
+        self._expedientes_congelados: Dict[str, Dict[str, Tuple]] = {}
+        # particiones congeladas abiertas, de la menos a la más usada
+        self._abiertas: OrderedDict = OrderedDict()
+        self._ubicacion: Dict[str, str] = {}
+        self._particiones_estudiante: Dict[str, List[str]] = {}
+        self.next_eval_id = 1
+        self._candado = self._candado_ids = SIN_CANDADO
+        if opciones.get("concurrente"):
+            import threading
+            self._candado = threading.Lock()
+            self._candado_ids = threading.Lock()
+
+    def _asignar_id_eval(self) -> int:
+        # los ids de evaluación son únicos entre todas las particiones
+        with self._candado_ids:
+            id_eval = self.next_eval_id
+            self.next_eval_id += 1
+        return id_eval
+
+    def _clave(self, codigo: str, periodo: Optional[str]) -> str:
+        if self.por == "hash":
+            return f"h{zlib.crc32(codigo.encode('utf-8')) % self.n_particiones}"
+        return periodo if periodo is not None else self.periodo_actual
+
+    def _crear_particion(self, clave: str) -> Plataforma:
+        pl = Plataforma(**self._opciones)
+        pl._asignar_id_eval = self._asignar_id_eval
+        if self._opciones.get("concurrente"):
+            from .concurrencia import CandadoLectoresEscritor
+            self._candados_particion[clave] = CandadoLectoresEscritor()
+        else:
+            self._candados_particion[clave] = SIN_CANDADO
+        self._activas[clave] = pl
+        return pl
+
+    def particion(self, clave: str) -> Plataforma:
+        pl = self._activas.get(clave)
+        if pl is not None:
+            return pl
+        with self._candado:
+            pl = self._congelando.get(clave)
+            if pl is not None:
+                return pl
+            pl = self._abiertas.get(clave)
+            if pl is not None:
+                self._abiertas.move_to_end(clave)
+                return pl
+            ruta = self._congeladas.get(clave)
+            if ruta is None:
+                raise ValueError("Partición no encontrada")
+            pl = Plataforma.cargar(ruta, **self._opciones)
+            self._abiertas[clave] = pl
+            while len(self._abiertas) > self.max_abiertas:
+                self._abiertas.popitem(last=False)
+        return pl
+
+    def _particion_de_curso(self, codigo_curso: str) -> Plataforma:
+        clave = self._ubicacion.get(codigo_curso)
+        if clave is None:
+            raise ValueError("Curso no encontrado")
+        return self.particion(clave)
+
+    def _escribir(self, codigo_curso: str, operacion, *args):
+        # operacion(clave, partición, *args) corre con el candado de la partición
+        # en lectura; se vuelve a mirar _activas con él tomado porque congelar
+        # pudo sacarla entre la búsqueda y la escritura
+        clave = self._ubicacion.get(codigo_curso)
+        if clave is None:
+            raise ValueError("Curso no encontrado")
+        with self._candados_particion[clave].lectura():
+            pl = self._activas.get(clave)
+            if pl is None:
+                raise ValueError("Periodo congelado: solo lectura")
+            return operacion(clave, pl, *args)
+
+    def _asegurar_usuario(self, pl: Plataforma, usuario: Usuario):
+        # se llama con el candado del enrutador tomado
+        if usuario.id not in pl.usuarios:
+            pl.registrar_usuario(_copia(usuario))
+
+    def abrir_periodo(self, periodo: str):
+        if self.por != "periodo":
+            raise ValueError("La plataforma no está particionada por periodo")
+        self.periodo_actual = periodo
+
+    def congelar(self, clave: str):
+        if self.directorio is None:
+            raise ValueError("Se requiere un directorio para congelar particiones")
+        if self.por == "periodo" and clave == self.periodo_actual:
+            raise ValueError("No se puede congelar el periodo actual")
+        ruta = os.path.join(self.directorio, f"{clave}.pltf")
+        with self._candado:
+            # fuera de _activas las escrituras nuevas fallan; mientras se guarda
+            # las consultas siguen usando la copia viva
+            pl = self._activas.pop(clave, None)
+            if pl is None:
+                raise ValueError("Partición no encontrada o ya congelada")
+            self._congelando[clave] = pl
+        try:
+            # las escrituras que ya tenían la partición terminan antes de
+            # guardar; se espera sin el candado del enrutador, que inscribir usa
+            with self._candados_particion[clave].escritura():
+                pass
+            pl.guardar(ruta)
+        except Exception:
+            with self._candado:
+                del self._congelando[clave]
+                self._activas[clave] = pl
+            raise
+        expedientes = {}
+        for est in pl.estudiantes.values():
+            if est._cursos:
+                expedientes[est.id] = tuple((c.codigo, c.nombre, c.creditos, c.obtener_promedio_estudiante(est.id))
+                                            for c in est._cursos.values())
+        with self._candado:
+            # se descarta la copia viva: la próxima consulta abre la instantánea
+            self._expedientes_congelados[clave] = expedientes
+            self._congeladas[clave] = ruta
+            del self._congelando[clave]
+
+    def estado(self) -> Dict[str, List[str]]:
+        return {'activas': list(self._activas), 'congeladas': list(self._congeladas), 'abiertas': list(self._abiertas)}
+
+    def registrar_usuario(self, usuario: Usuario):
+        self._identidad.registrar_usuario(usuario)
+
+    def crear_curso(self, nombre: str, codigo: str, profesor_id: str, motor: str = "dict", creditos: float = 1.0,
+                    periodo: Optional[str] = None) -> Curso:
+        profesor = self.profesores.get(profesor_id)
+        if profesor is None:
+            raise ValueError("Profesor inválido o no encontrado")
+        clave = self._clave(codigo, periodo)
+        with self._candado:
+            if codigo in self._ubicacion:
+                raise ValueError("Código de curso ya existente")
+            if clave in self._congeladas or clave in self._congelando:
+                raise ValueError("Periodo congelado: solo lectura")
+            pl = self._activas.get(clave)
+            if pl is None:
+                pl = self._crear_particion(clave)
+            self._asegurar_usuario(pl, profesor)
+            curso = pl.crear_curso(nombre, codigo, profesor_id, motor=motor, creditos=creditos)
+            self._ubicacion[codigo] = clave
+        return curso
+
+    def _inscribir(self, clave: str, pl: Plataforma, codigo_curso: str, estudiante_id: str):
+        estudiante = self.estudiantes.get(estudiante_id)
+        if estudiante is None:
+            raise ValueError("Usuario no es estudiante o no encontrado")
+        with self._candado:
+            self._asegurar_usuario(pl, estudiante)
+            claves = self._particiones_estudiante.setdefault(estudiante_id, [])
+            if clave not in claves:
+                claves.append(clave)
+        pl.inscribir_estudiante(codigo_curso, estudiante_id)
+
+    def inscribir_estudiante(self, codigo_curso: str, estudiante_id: str):
+        self._escribir(codigo_curso, self._inscribir, codigo_curso, estudiante_id)
+
+    def crear_evaluacion(self, codigo_curso: str, tipo: str, titulo: str, max_puntos: float, peso: float = 1.0, **kwargs) -> Evaluacion:
+        return self._escribir(codigo_curso, lambda _, pl: pl.crear_evaluacion(codigo_curso, tipo, titulo, max_puntos, peso=peso, **kwargs))
+
+    def registrar_calificacion(self, codigo_curso: str, id_eval: int, estudiante_id: str, puntos: float):
+        self._escribir(codigo_curso, lambda _, pl: pl.registrar_calificacion(codigo_curso, id_eval, estudiante_id, puntos))
+
+    def registrar_calificaciones_lote(self, codigo_curso: str, id_eval: int, filas: Iterable[Tuple[str, float]]) -> List[Dict]:
+        return self._escribir(codigo_curso, lambda _, pl: pl.registrar_calificaciones_lote(codigo_curso, id_eval, filas))
+
+    def obtener_promedio_estudiante_en_curso(self, codigo_curso: str, estudiante_id: str) -> Optional[float]:
+        return self._particion_de_curso(codigo_curso).obtener_promedio_estudiante_en_curso(codigo_curso, estudiante_id)
+
+    def reporte_estudiantes_promedio_bajo(self, codigo_curso: str, umbral_porcentaje: float) -> List[Dict]:
+        return self._particion_de_curso(codigo_curso).reporte_estudiantes_promedio_bajo(codigo_curso, umbral_porcentaje)
+
+    def estadisticas_curso(self, codigo_curso: str) -> List[Dict]:
+        return self._particion_de_curso(codigo_curso).estadisticas_curso(codigo_curso)
+
+    def obtener_expediente(self, estudiante_id: str) -> Dict:
+        est = self.estudiantes.get(estudiante_id)
+        if est is None:
+            raise ValueError("Usuario no es estudiante o no existe")
+        # solo se visitan las particiones donde el estudiante tiene cursos; las
+        # activas responden con la caché de promedios de su copia del estudiante
+        filas = []
+        for clave in list(self._particiones_estudiante.get(estudiante_id, ())):
+            congelado = self._expedientes_congelados.get(clave)
+            if congelado is not None:
+                filas.extend(congelado.get(estudiante_id, ()))
+                continue
+            pl = self.particion(clave)
+            filas.extend(pl._filas_expediente(pl.estudiantes[estudiante_id]))
+        return _armar_expediente(est, filas)
+
+    def reporte_global_promedio_bajo(self, umbral_porcentaje: float, procesos: Optional[int] = None) -> Dict[str, List[Dict]]:
+        resultado = {}
+        for clave in list(self._activas) + list(self._congelando) + list(self._congeladas):
+            resultado.update(self.particion(clave).reporte_global_promedio_bajo(umbral_porcentaje, procesos))
+        return resultado
+
+    def listar_profesores(self) -> List[Profesor]:
+        return self._identidad.listar_profesores()
+
+    def buscar_por_carnet(self, carnet: str) -> Optional[Estudiante]:
+        return self._identidad.buscar_por_carnet(carnet)
+
+    def buscar_por_correo(self, correo: str) -> Optional[Usuario]:
+        return self._identidad.buscar_por_correo(correo)
@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+# Los procesos hijos se crean con fork y heredan la plataforma por
+# copia-en-escritura; a cada uno solo se le envían códigos de curso y
+# devuelve tuplas (id, nombre, promedio), nunca el grafo de objetos.
+_PLATAFORMA = None
+
+def _reportar(codigos: List[str], umbral: float) -> List[Tuple[str, List[Tuple[str, str, float]]]]:
+    cursos = _PLATAFORMA.cursos
+    resultado = []
+    for codigo in codigos:
+        filas = cursos[codigo].reporte_promedio_bajo(umbral)
+        resultado.append((codigo, [(r['id'], r['nombre'], r['promedio']) for r in filas]))
+    return resultado
+
+def _particionar(pl, procesos: int) -> List[List[str]]:
+    # reparte por cantidad de estudiantes, de mayor a menor, en varios bloques
+    # por proceso para que ninguno quede con todos los cursos grandes
+    n_bloques = procesos * 4
+    bloques: List[List[str]] = [[] for _ in range(n_bloques)]
+    cargas = [0] * n_bloques
+    cursos = sorted(pl.cursos.values(), key=lambda c: len(c._estudiantes), reverse=True)
+    for curso in cursos:
+        i = cargas.index(min(cargas))
+        bloques[i].append(curso.codigo)
+        cargas[i] += len(curso._estudiantes) + 1
+    return [b for b in bloques if b]
+
+def reporte_global_promedio_bajo(pl, umbral_porcentaje: float, procesos: Optional[int] = None) -> Dict[str, List[Dict]]:
+    global _PLATAFORMA
+    procesos = procesos or os.cpu_count() or 1
+    # con concurrencia otro hilo puede tener tomado un candado al momento del
+    # fork y los hijos lo heredarían así; el camino serial lee con candados
+    if procesos == 1 or len(pl.cursos) < 2 or pl.concurrente or "fork" not in multiprocessing.get_all_start_methods():
+        return {codigo: pl.reporte_estudiantes_promedio_bajo(codigo, umbral_porcentaje) for codigo in list(pl.cursos)}
+    _PLATAFORMA = pl
+    try:
+        contexto = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto) as ejecutor:
+            partes = list(ejecutor.map(_reportar, _particionar(pl, procesos), repeat(umbral_porcentaje)))
+    finally:
+        _PLATAFORMA = None
+    por_codigo = {}
+    for parte in partes:
+        for codigo, filas in parte:
+            por_codigo[codigo] = [{'id': i, 'nombre': n, 'promedio': p} for i, n, p in filas]
+    return {codigo: por_codigo[codigo] for codigo in pl.cursos}
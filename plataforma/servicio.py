@@ -0,0 +1,206 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from .escenarios import Escenario
+from .modelo import Curso, Estudiante, Evaluacion, Profesor
+from .nucleo import Plataforma
+from .suscripciones import Suscripcion
+
+# Protocolo: una solicitud JSON por línea, {"id": ..., "op": ..., "args": {...}}.
+# Las respuestas salen en el mismo orden, {"id": ..., "ok": true, "resultado": ...}
+# o {"id": ..., "ok": false, "error": "..."}; el cliente puede enviar varias
+# solicitudes sin esperar respuesta (pipelining).
+
+def _curso(c: Curso) -> Dict:
+    return {'codigo': c.codigo, 'nombre': c.nombre, 'profesor': c.profesor.id, 'creditos': c.creditos}
+
+def _profesor(p: Profesor) -> Dict:
+    return {'id': p.id, 'nombre': p.nombre, 'correo': p.email, 'departamento': p.departamento}
+
+def _estudiante(e: Estudiante) -> Dict:
+    return {'id': e.id, 'nombre': e.nombre, 'correo': e.email, 'carnet': e.carnet}
+
+def _pagina(pagina: Dict, serializar) -> Dict:
+    return {'elementos': [serializar(x) for x in pagina['elementos']], 'siguiente': pagina['siguiente']}
+
+def _evaluacion(ev: Evaluacion) -> Dict:
+    return {'id': ev.id, 'titulo': ev.titulo, 'tipo': getattr(ev, "tipo", "evaluacion"), 'max_puntos': ev.max_puntos, 'peso': ev.peso}
+
+class Servicio:
+    # operaciones que recorren cursos completos; se ejecutan fuera del bucle de eventos
+    PESADAS = {"reporte_promedio_bajo", "listar_profesores", "listar_cursos", "metricas", "metricas_prometheus", "simular"}
+    # escrituras que toman el candado de un curso: pueden esperar a un lote o
+    # a un reporte de ese curso, así que tampoco corren en el bucle
+    ESCRITURAS = {"inscribir_estudiante", "crear_evaluacion", "registrar_calificacion", "registrar_calificaciones_lote"}
+    # corrutinas: esperas largas que se resuelven en el bucle sin ocupar un hilo
+    ASINCRONAS = {"eventos"}
+
+    def __init__(self, pl: Plataforma, hilos: int = 4):
+        if not pl.concurrente:
+            raise ValueError("El servicio requiere una Plataforma(concurrente=True)")
+        self.pl = pl
+        self.ejecutor = ThreadPoolExecutor(max_workers=hilos)
+        self.suscripciones: Dict[int, Suscripcion] = {}
+        self._avisos: Dict[int, asyncio.Event] = {}
+        self._siguiente_suscripcion = 0
+        self.operaciones = {
+            "registrar_profesor": lambda a: self.pl.registrar_usuario(Profesor(a["id"], a["nombre"], a["correo"], a["departamento"])),
+            "registrar_estudiante": lambda a: self.pl.registrar_usuario(Estudiante(a["id"], a["nombre"], a["correo"], a["carnet"])),
+            "crear_curso": lambda a: _curso(self.pl.crear_curso(a["nombre"], a["codigo"], a["profesor_id"], creditos=a.get("creditos", 1.0))),
+            "inscribir_estudiante": lambda a: self.pl.inscribir_estudiante(a["codigo_curso"], a["estudiante_id"]),
+            "crear_evaluacion": lambda a: _evaluacion(self.pl.crear_evaluacion(a["codigo_curso"], a["tipo"], a["titulo"], a["max_puntos"], peso=a.get("peso", 1.0))),
+            "registrar_calificacion": lambda a: self.pl.registrar_calificacion(a["codigo_curso"], a["id_eval"], a["estudiante_id"], a["puntos"]),
+            "registrar_calificaciones_lote": lambda a: self.pl.registrar_calificaciones_lote(a["codigo_curso"], a["id_eval"], a["filas"]),
+            "promedio": lambda a: self.pl.obtener_promedio_estudiante_en_curso(a["codigo_curso"], a["estudiante_id"]),
+            "expediente": lambda a: self.pl.obtener_expediente(a["estudiante_id"]),
+            "estadisticas": lambda a: self.pl.estadisticas_curso(a["codigo_curso"]),
+            "simular": lambda a: self.pl.simular_escenarios(a["codigo_curso"], [Escenario(**e) for e in a["escenarios"]], a.get("umbral")),
+            "reporte_promedio_bajo": lambda a: self.pl.reporte_estudiantes_promedio_bajo(a["codigo_curso"], a["umbral"]),
+            "listar_profesores": lambda a: [_profesor(p) for p in self.pl.listar_profesores()],
+            "listar_cursos": lambda a: [_curso(c) for c in self.pl.listar_cursos()],
+            "pagina_profesores": lambda a: _pagina(self.pl.pagina_profesores(a.get("departamento"), a.get("cursor"), a.get("limite", 50)), _profesor),
+            "pagina_cursos": lambda a: _pagina(self.pl.pagina_cursos(a.get("profesor_id"), a.get("departamento"), a.get("cursor"),
+                                                                     a.get("limite", 50)), _curso),
+            "pagina_estudiantes": lambda a: _pagina(self.pl.pagina_estudiantes(a.get("prefijo", ""), a.get("cursor"), a.get("limite", 50)), _estudiante),
+            "pagina_estudiantes_curso": lambda a: _pagina(self.pl.pagina_estudiantes_curso(a["codigo_curso"], a.get("prefijo", ""), a.get("cursor"),
+                                                                                           a.get("limite", 50)), _estudiante),
+            "metricas": lambda a: self.pl.metricas(),
+            "metricas_prometheus": lambda a: self.pl.metricas_prometheus(),
+            "suscribir": self._suscribir,
+            "eventos": self._eventos,
+            "cancelar_suscripcion": lambda a: self._suscripcion(a["suscripcion"], quitar=True).cancelar(),
+        }
+
+    def _suscribir(self, a: Dict) -> int:
+        # los eventos se publican en el hilo que escribe, con el candado del
+        # curso tomado, que un cliente lento no debe frenar: solo la política "descartar"
+        sub = self.pl.suscribir(a.get("cursos"), a.get("estudiantes"), a.get("tipos"), capacidad=a.get("capacidad", 1024))
+        bucle = asyncio.get_running_loop()
+        aviso = asyncio.Event()
+
+        def avisar():
+            try:
+                bucle.call_soon_threadsafe(aviso.set)
+            except RuntimeError:
+                pass  # el bucle ya se cerró
+        sub._avisar = avisar
+        self._siguiente_suscripcion += 1
+        self.suscripciones[self._siguiente_suscripcion] = sub
+        self._avisos[self._siguiente_suscripcion] = aviso
+        return self._siguiente_suscripcion
+
+    def _suscripcion(self, id_suscripcion: int, quitar: bool = False) -> Suscripcion:
+        if quitar:
+            sub = self.suscripciones.pop(id_suscripcion, None)
+            self._avisos.pop(id_suscripcion, None)
+        else:
+            sub = self.suscripciones.get(id_suscripcion)
+        if sub is None:
+            raise ValueError("Suscripción no encontrada")
+        return sub
+
+    async def _eventos(self, a: Dict) -> List[Dict]:
+        # espera larga (hasta 30 s): se espera el aviso en el bucle para no
+        # dejar sin hilos del ejecutor a las escrituras y los reportes
+        sub = self._suscripcion(a["suscripcion"])
+        aviso = self._avisos[a["suscripcion"]]
+        maximo = a.get("maximo", 100)
+        bucle = asyncio.get_running_loop()
+        limite = bucle.time() + min(a.get("espera", 0), 30.0)
+        while True:
+            aviso.clear()
+            lote = sub.recibir(maximo, 0)
+            restante = limite - bucle.time()
+            if lote or restante <= 0 or not sub.activa:
+                return [e._asdict() for e in lote]
+            try:
+                await asyncio.wait_for(aviso.wait(), restante)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _ejecutar(self, solicitud: Dict) -> Dict:
+        if not isinstance(solicitud, dict):
+            return {'id': None, 'ok': False, 'error': "La solicitud debe ser un objeto JSON"}
+        respuesta = {'id': solicitud.get("id")}
+        operacion = self.operaciones.get(solicitud.get("op"))
+        try:
+            if operacion is None:
+                raise ValueError("Operación desconocida")
+            args = solicitud.get("args")
+            if args is None:
+                args = {}
+            elif not isinstance(args, dict):
+                raise ValueError("Los argumentos deben ser un objeto JSON")
+            if solicitud["op"] in self.ASINCRONAS:
+                resultado = await operacion(args)
+            elif solicitud["op"] in self.PESADAS or solicitud["op"] in self.ESCRITURAS:
+                resultado = await asyncio.get_running_loop().run_in_executor(self.ejecutor, operacion, args)
+            else:
+                resultado = operacion(args)
+        except (ValueError, KeyError, TypeError) as e:
+            respuesta['ok'] = False
+            respuesta['error'] = str(e) if isinstance(e, ValueError) else f"Solicitud inválida: {e!r}"
+            return respuesta
+        respuesta['ok'] = True
+        respuesta['resultado'] = resultado
+        return respuesta
+
+    async def atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        # suscripciones creadas por esta conexión: se cancelan al cerrarse
+        propias = set()
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    solicitud = json.loads(linea)
+                except ValueError:
+                    respuesta = {'id': None, 'ok': False, 'error': "JSON inválido"}
+                else:
+                    respuesta = await self._ejecutar(solicitud)
+                    if respuesta['ok'] and solicitud.get("op") == "suscribir":
+                        propias.add(respuesta['resultado'])
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for id_suscripcion in propias:
+                sub = self.suscripciones.pop(id_suscripcion, None)
+                self._avisos.pop(id_suscripcion, None)
+                if sub is not None:
+                    sub.cancelar()
+            escritor.close()
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.atender, host, puerto, limit=1 << 22)
+
+async def _principal(args):
+    pl = Plataforma.cargar(args.instantanea) if args.instantanea else Plataforma()
+    pl.activar_concurrencia()
+    if args.metricas:
+        pl.activar_instrumentacion()
+    servicio = Servicio(pl, hilos=args.hilos)
+    servidor = await servicio.iniciar(args.host, args.puerto)
+    print(f"Escuchando en {args.host}:{args.puerto}", flush=True)
+    async with servidor:
+        await servidor.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio asyncio de la plataforma")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--hilos", type=int, default=4)
+    parser.add_argument("--instantanea", help="instantánea a cargar al iniciar")
+    parser.add_argument("--metricas", action="store_true", help="instrumenta las operaciones de la plataforma")
+    try:
+        asyncio.run(_principal(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+TIPOS = ("calificacion", "inscripcion", "evaluacion")
+POLITICAS = ("descartar", "bloquear")
+
+class Evento(NamedTuple):
+    # tipo: "calificacion", "inscripcion", "evaluacion" o "desborde" (se
+    # perdieron eventos por falta de espacio y el suscriptor debe releer)
+    tipo: str
+    curso: Optional[str]
+    estudiante: Optional[str] = None
+    id_eval: Optional[int] = None
+    puntos: Optional[float] = None
+    anterior: Optional[float] = None
+    promedio: Optional[float] = None
+
+def _clave(evento: Evento) -> tuple:
+    # eventos con la misma clave se fusionan mientras esperan en la cola
+    if evento.tipo == "calificacion":
+        return (evento.tipo, evento.curso, evento.id_eval, evento.estudiante)
+    return (evento.tipo, evento.curso, evento.id_eval, evento.estudiante, id(evento))
+
+class Suscripcion:
+    # Cola acotada de eventos para un suscriptor. Varias calificaciones del
+    # mismo estudiante en la misma evaluación se fusionan en un solo evento
+    # (con el primer valor anterior y el último nuevo), y si el resultado no
+    # cambia nada se descarta. La capacidad cuenta eventos pendientes; al
+    # llenarse, "descartar" deja un evento de desborde y "bloquear" frena al
+    # publicador hasta `espera` segundos por publicación antes de desbordar.
+    def __init__(self, cursos: Optional[Iterable[str]] = None, estudiantes: Optional[Iterable[str]] = None,
+                 tipos: Optional[Iterable[str]] = None, capacidad: int = 1024, politica: str = "descartar", espera: float = 1.0):
+        if capacidad <= 0:
+            raise ValueError("La capacidad debe ser > 0")
+        if politica not in POLITICAS:
+            raise ValueError("Política de suscripción desconocida")
+        self.cursos = None if cursos is None else frozenset(cursos)
+        self.estudiantes = None if estudiantes is None else frozenset(estudiantes)
+        self.tipos = None if tipos is None else frozenset(tipos)
+        if self.tipos is not None and not self.tipos <= set(TIPOS):
+            raise ValueError("Tipo de evento desconocido")
+        self.capacidad = capacidad
+        self.politica = politica
+        self.espera = espera
+        self.perdidos = 0
+        self.activa = True
+        self._pendientes: Dict[tuple, Evento] = {}
+        self._desborde = False
+        self._condicion = threading.Condition(threading.Lock())
+        self._plataforma = None
+        # se llama, sin argumentos y con el candado tomado, cada vez que hay
+        # algo nuevo que recibir; para quien no espera en un hilo (el servicio)
+        self._avisar = None
+
+    def acepta(self, evento: Evento) -> bool:
+        if self.tipos is not None and evento.tipo not in self.tipos:
+            return False
+        if self.cursos is not None and evento.curso not in self.cursos:
+            return False
+        # los eventos sin estudiante (evaluación creada) no pasan un filtro por estudiante
+        return self.estudiantes is None or evento.estudiante in self.estudiantes
+
+    def _encolar(self, evento: Evento, inicio: Optional[float] = None):
+        clave = _clave(evento)
+        with self._condicion:
+            if not self.activa:
+                return
+            previo = self._pendientes.pop(clave, None)
+            if previo is not None:
+                evento = evento._replace(anterior=previo.anterior)
+                if evento.anterior == evento.puntos:
+                    self._condicion.notify_all()
+                    return
+            elif len(self._pendientes) >= self.capacidad:
+                if self.politica == "bloquear":
+                    limite = (time.monotonic() if inicio is None else inicio) + self.espera
+                    while len(self._pendientes) >= self.capacidad and self.activa:
+                        restante = limite - time.monotonic()
+                        if restante <= 0 or not self._condicion.wait(restante):
+                            break
+                if len(self._pendientes) >= self.capacidad:
+                    self.perdidos += 1
+                    self._desborde = True
+                    self._condicion.notify_all()
+                    if self._avisar is not None:
+                        self._avisar()
+                    return
+            self._pendientes[clave] = evento
+            self._condicion.notify_all()
+            if self._avisar is not None:
+                self._avisar()
+
+    def recibir(self, maximo: Optional[int] = None, espera: Optional[float] = None) -> List[Evento]:
+        # devuelve un lote con los eventos pendientes (hasta `maximo`); si no
+        # hay ninguno espera hasta `espera` segundos (None = sin límite)
+        with self._condicion:
+            if not self._pendientes and not self._desborde and self.activa:
+                self._condicion.wait_for(lambda: self._pendientes or self._desborde or not self.activa, espera)
+            lote: List[Evento] = []
+            if self._desborde:
+                lote.append(Evento("desborde", None))
+                self._desborde = False
+            claves = list(self._pendientes)
+            if maximo is not None:
+                claves = claves[:max(maximo - len(lote), 0)]
+            for clave in claves:
+                lote.append(self._pendientes.pop(clave))
+            if lote:
+                self._condicion.notify_all()
+            return lote
+
+    def __len__(self) -> int:
+        return len(self._pendientes)
+
+    def cancelar(self):
+        with self._condicion:
+            self.activa = False
+            self._pendientes.clear()
+            self._condicion.notify_all()
+            if self._avisar is not None:
+                self._avisar()
+        if self._plataforma is not None:
+            self._plataforma._quitar_suscripcion(self)
+            self._plataforma = None
@@ -0,0 +1,204 @@
+import marshal
+import os
+import struct
+import threading
+import zlib
+from typing import Iterator, Optional
+
+from .modelo import Estudiante, Profesor, Usuario
+from .nucleo import Plataforma
+
+# Cada registro: longitud u32, crc32 u32 y la tupla serializada con marshal.
+ENCABEZADO = struct.Struct("<II")
+MODOS = ("siempre", "grupo", "intervalo")
+
+class RegistroEscritura:
+    def __init__(self, ruta: str, modo: str = "grupo", tamano_grupo: int = 256, intervalo: float = 0.05,
+                 ruta_instantanea: Optional[str] = None, compactar_cada: int = 0):
+        if modo not in MODOS:
+            raise ValueError("Modo de durabilidad inválido")
+        self.ruta = ruta
+        # al compactar, el log se aparta aquí y se descarta cuando la instantánea ya lo cubre
+        self.ruta_anterior = ruta + ".anterior"
+        self.modo = modo
+        self.tamano_grupo = tamano_grupo
+        self.intervalo = intervalo
+        self.ruta_instantanea = ruta_instantanea
+        self.compactar_cada = compactar_cada
+        self.registros = 0
+        self._pendientes = 0
+        self._candado = threading.Lock()
+        self._candado_compactacion = threading.Lock()
+        self._hilo_compactacion = None
+        self._archivo = open(ruta, "ab", buffering=1 << 16)
+        self._hilo = None
+        self._detener = threading.Event()
+        if modo == "intervalo":
+            self._hilo = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+            self._hilo.start()
+
+    def agregar(self, registro: tuple):
+        datos = marshal.dumps(registro)
+        with self._candado:
+            self._archivo.write(ENCABEZADO.pack(len(datos), zlib.crc32(datos)))
+            self._archivo.write(datos)
+            self.registros += 1
+            self._pendientes += 1
+            if self.modo == "siempre" or (self.modo == "grupo" and self._pendientes >= self.tamano_grupo):
+                self._sincronizar()
+
+    @staticmethod
+    def registro_usuario(usuario: Usuario) -> tuple:
+        if isinstance(usuario, Estudiante):
+            return ("u", "estudiante", usuario.id, usuario.nombre, usuario.email, usuario.carnet)
+        if isinstance(usuario, Profesor):
+            return ("u", "profesor", usuario.id, usuario.nombre, usuario.email, usuario.departamento)
+        return ("u", "usuario", usuario.id, usuario.nombre, usuario.email, "")
+
+    def _sincronizar(self):
+        if self._pendientes:
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._pendientes = 0
+
+    def sincronizar(self):
+        with self._candado:
+            self._sincronizar()
+
+    def _sincronizar_periodicamente(self):
+        while not self._detener.wait(self.intervalo):
+            self.sincronizar()
+
+    def debe_compactar(self) -> bool:
+        return bool(self.ruta_instantanea) and 0 < self.compactar_cada <= self.registros
+
+    def apartar(self):
+        # los registros que lleguen desde aquí van a un log nuevo; si quedó uno
+        # apartado de una compactación fallida, el actual se le agrega al final
+        with self._candado:
+            self._sincronizar()
+            self._archivo.close()
+            if os.path.exists(self.ruta_anterior):
+                with open(self.ruta_anterior, "ab") as anterior, open(self.ruta, "rb") as actual:
+                    anterior.write(actual.read())
+                    anterior.flush()
+                    os.fsync(anterior.fileno())
+                os.remove(self.ruta)
+            else:
+                os.replace(self.ruta, self.ruta_anterior)
+            self._archivo = open(self.ruta, "ab", buffering=1 << 16)
+            self.registros = 0
+
+    def descartar_anterior(self):
+        os.remove(self.ruta_anterior)
+
+    def cerrar(self):
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        with self._candado:
+            hilo = self._hilo_compactacion
+        if hilo is not None:
+            hilo.join()
+        self.sincronizar()
+        self._archivo.close()
+
+def leer_registros(ruta: str) -> Iterator[tuple]:
+    if not os.path.exists(ruta):
+        return
+    with open(ruta, "r+b") as f:
+        valido = 0
+        while True:
+            cabecera = f.read(ENCABEZADO.size)
+            if len(cabecera) < ENCABEZADO.size:
+                break
+            largo, crc = ENCABEZADO.unpack(cabecera)
+            datos = f.read(largo)
+            if len(datos) < largo or zlib.crc32(datos) != crc:
+                break
+            valido = f.tell()
+            yield marshal.loads(datos)
+        # descarta una cola incompleta dejada por una caída a mitad de escritura
+        if f.seek(0, os.SEEK_END) != valido:
+            f.truncate(valido)
+
+def aplicar(pl: Plataforma, registro: tuple):
+    # La repetición es idempotente: un registro ya reflejado en la instantánea
+    # (por ejemplo tras una caída durante la compactación) se omite.
+    tipo = registro[0]
+    if tipo == "u":
+        _, clase, idu, nombre, correo, extra = registro
+        if idu in pl.usuarios:
+            return
+        if clase == "estudiante":
+            pl.registrar_usuario(Estudiante(idu, nombre, correo, extra))
+        elif clase == "profesor":
+            pl.registrar_usuario(Profesor(idu, nombre, correo, extra))
+        else:
+            pl.registrar_usuario(Usuario(idu, nombre, correo))
+    elif tipo == "c":
+        _, nombre, codigo, profesor_id, motor, *resto = registro
+        if codigo not in pl.cursos:
+            pl.crear_curso(nombre, codigo, profesor_id, motor=motor, creditos=resto[0] if resto else 1.0)
+    elif tipo == "i":
+        _, codigo, estudiante_id = registro
+        if not pl.cursos[codigo].esta_inscrito(pl.usuarios[estudiante_id].carnet):
+            pl.inscribir_estudiante(codigo, estudiante_id)
+    elif tipo == "e":
+        _, codigo, clase, titulo, max_puntos, peso, id_eval = registro
+        if id_eval not in pl._evaluaciones:
+            siguiente = max(pl.next_eval_id, id_eval + 1)
+            pl.next_eval_id = id_eval
+            pl.crear_evaluacion(codigo, clase, titulo, max_puntos, peso=peso)
+            pl.next_eval_id = siguiente
+    elif tipo == "g":
+        _, codigo, id_eval, estudiante_id, puntos = registro
+        pl.registrar_calificacion(codigo, id_eval, estudiante_id, puntos)
+    elif tipo == "l":
+        _, codigo, id_eval, filas = registro
+        pl.registrar_calificaciones_lote(codigo, id_eval, filas)
+    else:
+        raise ValueError(f"Registro de bitácora desconocido: {tipo!r}")
+
+def recuperar(ruta_instantanea: str, ruta_log: str, cls=Plataforma, **opciones) -> Plataforma:
+    if os.path.exists(ruta_instantanea):
+        pl = cls.cargar(ruta_instantanea)
+    else:
+        pl = cls()
+    # un log apartado es anterior al actual: se repite primero
+    for ruta in (ruta_log + ".anterior", ruta_log):
+        for registro in leer_registros(ruta):
+            aplicar(pl, registro)
+    pl._wal = RegistroEscritura(ruta_log, ruta_instantanea=ruta_instantanea, **opciones)
+    return pl
+
+def compactar(pl: Plataforma, solo_si_hace_falta: bool = False):
+    # El log se aparta antes de guardar: lo que se escriba mientras tanto queda
+    # en el log nuevo y la repetición idempotente cubre lo que la instantánea
+    # ya refleje. Nada se trunca, así que ninguna escritura se pierde.
+    wal = pl._wal
+    with wal._candado_compactacion:
+        if solo_si_hace_falta and not wal.debe_compactar():
+            return
+        wal.apartar()
+        pl.guardar(wal.ruta_instantanea)
+        wal.descartar_anterior()
+
+def compactar_en_segundo_plano(pl: Plataforma):
+    # Con concurrencia quien registra tiene tomado el candado de un curso y
+    # guardar necesita leerlos todos: la compactación corre en su propio hilo,
+    # uno a la vez.
+    wal = pl._wal
+    with wal._candado:
+        if wal._hilo_compactacion is not None:
+            return
+        wal._hilo_compactacion = hilo = threading.Thread(target=_compactar_pendiente, args=(pl, wal), daemon=True)
+    hilo.start()
+
+def _compactar_pendiente(pl: Plataforma, wal: RegistroEscritura):
+    try:
+        if wal.debe_compactar():
+            pl.compactar(solo_si_hace_falta=True)
+    finally:
+        with wal._candado:
+            wal._hilo_compactacion = None
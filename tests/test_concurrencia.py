@@ -0,0 +1,154 @@
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+from plataforma.particiones import PlataformaParticionada
+
+# Versiones reducidas de benchmarks/estres_concurrencia.py y de las carreras
+# ya corregidas; cada una debe fallar con el código anterior a su arreglo
+
+ESTUDIANTES = 60
+
+def _poblar(pl, cursos):
+    pl.registrar_usuario(Profesor("p", "Profesor", "p@uni.edu", "Dep"))
+    for e in range(ESTUDIANTES):
+        pl.registrar_usuario(Estudiante(f"e{e}", f"Estudiante {e}", f"e{e}@uni.edu", f"C{e}"))
+    for codigo in cursos:
+        pl.crear_curso(codigo, codigo, "p")
+
+def _hilos(objetivo, cantidad):
+    hilos = [threading.Thread(target=objetivo, args=(i,)) for i in range(cantidad)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+def test_estres_sin_perdidas_ni_ids_repetidos():
+    pl = Plataforma(concurrente=True)
+    cursos = [f"CUR{c}" for c in range(4)]
+    _poblar(pl, cursos)
+    creados = []
+    candado = threading.Lock()
+
+    def crear(indice):
+        propios = []
+        for codigo in cursos:
+            for e in range(indice, ESTUDIANTES, 4):
+                pl.inscribir_estudiante(codigo, f"e{e}")
+            for _ in range(3):
+                propios.append((codigo, pl.crear_evaluacion(codigo, "examen", "Eval", 100, peso=1 + indice % 3).id))
+        with candado:
+            creados.extend(propios)
+
+    _hilos(crear, 4)
+    ids = [i for _, i in creados]
+    assert len(ids) == len(set(ids)) and pl.next_eval_id == len(ids) + 1
+    assert all(len(pl.cursos[c].estudiantes) == ESTUDIANTES for c in cursos)
+
+    rnd = random.Random(7)
+    tareas = [(codigo, id_eval, f"e{e}") for codigo, id_eval in creados for e in range(ESTUDIANTES)]
+    rnd.shuffle(tareas)
+    esperado = {(id_eval, est): float(rnd.randrange(101)) for _, id_eval, est in tareas}
+    detener = threading.Event()
+
+    def escribir(indice):
+        for codigo, id_eval, est in tareas[indice::6]:
+            pl.registrar_calificacion(codigo, id_eval, est, esperado[(id_eval, est)])
+
+    def leer():
+        while not detener.is_set():
+            codigo = rnd.choice(cursos)
+            pl.obtener_promedio_estudiante_en_curso(codigo, f"e{rnd.randrange(ESTUDIANTES)}")
+            pl.reporte_estudiantes_promedio_bajo(codigo, 50)
+
+    lectores = [threading.Thread(target=leer) for _ in range(2)]
+    for h in lectores:
+        h.start()
+    _hilos(escribir, 6)
+    detener.set()
+    for h in lectores:
+        h.join()
+
+    for codigo, id_eval in creados:
+        ev = pl.cursos[codigo].obtener_evaluacion(id_eval)
+        assert {e: ev.calificaciones.get(e) for _, i, e in tareas if i == id_eval} == \
+            {e: p for (i, e), p in esperado.items() if i == id_eval}
+    for codigo in cursos:
+        curso = pl.cursos[codigo]
+        suma_pesos = sum(ev.peso for ev in curso.evaluaciones)
+        for e in range(ESTUDIANTES):
+            directo = sum(ev.obtener_porcentaje(f"e{e}") * ev.peso for ev in curso.evaluaciones) / suma_pesos
+            assert abs(curso.obtener_promedio_estudiante(f"e{e}") - directo) < 1e-9
+
+def test_wal_con_compactacion_concurrente_se_recupera_completo(tmp_path):
+    instantanea, log = str(tmp_path / "plataforma.bin"), str(tmp_path / "plataforma.wal")
+    pl = Plataforma.recuperar(instantanea, log, compactar_cada=300)
+    pl.activar_concurrencia()
+    cursos = [f"CUR{c}" for c in range(4)]
+    _poblar(pl, cursos)
+    for codigo in cursos:
+        for e in range(ESTUDIANTES):
+            pl.inscribir_estudiante(codigo, f"e{e}")
+    evaluaciones = {c: [pl.crear_evaluacion(c, "examen", "Eval", 10).id for _ in range(3)] for c in cursos}
+
+    def escribir(semilla):
+        rnd = random.Random(semilla)
+        for k in range(1500):
+            codigo = rnd.choice(cursos)
+            id_eval = rnd.choice(evaluaciones[codigo])
+            if k % 50 == 0:
+                pl.registrar_calificaciones_lote(codigo, id_eval, [(f"e{rnd.randrange(ESTUDIANTES)}", rnd.uniform(0, 10)) for _ in range(10)])
+            else:
+                pl.registrar_calificacion(codigo, id_eval, f"e{rnd.randrange(ESTUDIANTES)}", rnd.uniform(0, 10))
+
+    _hilos(escribir, 6)
+    esperado = {ev.id: dict(ev.calificaciones) for c in cursos for ev in pl.cursos[c].evaluaciones}
+    pl.cerrar()
+    recuperada = Plataforma.recuperar(instantanea, log)
+    try:
+        assert {ev.id: dict(ev.calificaciones) for c in cursos for ev in recuperada.cursos[c].evaluaciones} == esperado
+    finally:
+        recuperada.cerrar()
+
+def test_congelar_no_pierde_escrituras_en_curso(tmp_path, monkeypatch):
+    # una pausa tras resolver la partición abre la ventana en la que congelar
+    # podía guardar el periodo antes de que la escritura llegara a aplicarse
+    buscar = Plataforma._buscar_evaluacion
+
+    def lento(self, *args):
+        time.sleep(0.0005)
+        return buscar(self, *args)
+
+    monkeypatch.setattr(Plataforma, "_buscar_evaluacion", lento)
+    pp = PlataformaParticionada(directorio=str(tmp_path), concurrente=True, periodo_actual="A")
+    _poblar(pp, [])
+    pp.crear_curso("C", "A0", "p")
+    for e in range(ESTUDIANTES):
+        pp.inscribir_estudiante("A0", f"e{e}")
+    evaluaciones = [pp.crear_evaluacion("A0", "tarea", "t", 10).id for _ in range(4)]
+    pp.abrir_periodo("B")
+    exitos = []
+
+    def escribir(indice):
+        for e in range(ESTUDIANTES):
+            try:
+                pp.registrar_calificacion("A0", evaluaciones[indice], f"e{e}", 5)
+            except ValueError:
+                return
+            exitos.append((evaluaciones[indice], f"e{e}"))
+
+    hilos = [threading.Thread(target=escribir, args=(i,)) for i in range(4)]
+    for h in hilos:
+        h.start()
+    time.sleep(0.005)
+    pp.congelar("A")
+    for h in hilos:
+        h.join()
+    curso = pp.particion("A").cursos["A0"]
+    assert exitos
+    assert [x for x in exitos if x[1] not in curso.obtener_evaluacion(x[0]).calificaciones] == []
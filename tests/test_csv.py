@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor, Usuario
+from plataforma import csv_plataforma
+
+def _poblar() -> Plataforma:
+    pl = Plataforma()
+    pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+    pl.registrar_usuario(Usuario("u1", "Invitado", "invitado@uni.edu"))
+    for i in range(3):
+        pl.registrar_usuario(Estudiante(f"e{i}", f"Estudiante, {i}", f"e{i}@uni.edu", f"C{i}"))
+    pl.crear_curso("Cálculo", "MAT1", "p1", creditos=4)
+    pl.crear_curso("Álgebra", "MAT2", "p1")
+    for i in range(3):
+        pl.inscribir_estudiante("MAT1", f"e{i}")
+    pl.inscribir_estudiante("MAT2", "e1")
+    parcial = pl.crear_evaluacion("MAT1", "examen", "Parcial", 100, peso=2)
+    tarea = pl.crear_evaluacion("MAT1", "tarea", "Tarea", 10)
+    pl.crear_evaluacion("MAT2", "otro", "Quiz", 5, peso=0.5)
+    pl.registrar_calificaciones_lote("MAT1", parcial.id, [("e0", 80.5), ("e1", 33), ("e2", 100)])
+    pl.registrar_calificacion("MAT1", tarea.id, "e1", 7.25)
+    return pl
+
+def test_exportar_e_importar_conserva_todo(tmp_path):
+    origen = _poblar()
+    conteos = csv_plataforma.exportar_plataforma(origen, str(tmp_path))
+    assert conteos["usuarios.csv"] == 5
+    destino = Plataforma()
+    assert csv_plataforma.importar_plataforma(destino, str(tmp_path)) == []
+    # también los usuarios que no son profesores ni estudiantes
+    assert {(u.id, type(u), u.nombre, u.email) for u in destino.usuarios.values()} == \
+        {(u.id, type(u), u.nombre, u.email) for u in origen.usuarios.values()}
+    assert [(c.codigo, c.nombre, c.profesor.id, c.creditos) for c in destino.listar_cursos()] == \
+        [(c.codigo, c.nombre, c.profesor.id, c.creditos) for c in origen.listar_cursos()]
+    for codigo, curso in origen.cursos.items():
+        copia = destino.cursos[codigo]
+        assert [e.id for e in copia.estudiantes] == [e.id for e in curso.estudiantes]
+        assert [(type(ev), ev.titulo, ev.max_puntos, ev.peso, dict(ev.calificaciones)) for ev in copia.evaluaciones] == \
+            [(type(ev), ev.titulo, ev.max_puntos, ev.peso, dict(ev.calificaciones)) for ev in curso.evaluaciones]
+        for est in curso.estudiantes:
+            assert destino.obtener_promedio_estudiante_en_curso(codigo, est.id) == origen.obtener_promedio_estudiante_en_curso(codigo, est.id)
+
+def test_filas_mal_formadas_se_informan_sin_abortar(tmp_path):
+    csv_plataforma.exportar_plataforma(_poblar(), str(tmp_path))
+    with open(tmp_path / "usuarios.csv", "a", encoding="utf-8") as f:
+        f.write("estudiante,x,X,x@uni.edu,C9\nalumno,y,Y,y@uni.edu,C8,\nestudiante,z,Z,z@uni.edu,C7,\n")
+    destino = Plataforma()
+    errores = csv_plataforma.importar_plataforma(destino, str(tmp_path))
+    assert [(e['archivo'], e['id'], e['error']) for e in errores] == [
+        ("usuarios.csv", "x", "Fila inválida: cantidad de columnas incorrecta"),
+        ("usuarios.csv", "y", "Tipo de usuario desconocido"),
+    ]
+    assert "z" in destino.estudiantes and "x" not in destino.usuarios
@@ -0,0 +1,92 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Curso, Estudiante, Evaluacion, Examen, Plataforma, Profesor, Tarea, Usuario
+
+def test_vistas_de_curso_son_de_solo_lectura():
+    curso = Curso("Cálculo", "MAT1", Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+    est = Estudiante("e0", "Estudiante 0", "e0@uni.edu", "C0")
+    curso.inscribir(est)
+    curso.agregar_evaluacion(Tarea(1, "Tarea", 10))
+    # antes eran copias en lista: agregar a ellas no hacía nada sin avisar
+    for vista in (curso.estudiantes, curso.evaluaciones, est.cursos_inscritos):
+        assert isinstance(vista, tuple)
+        with pytest.raises(AttributeError):
+            vista.append(None)
+    assert [e.id for e in curso.estudiantes] == ["e0"]
+    assert [c.codigo for c in est.cursos_inscritos] == ["MAT1"]
+
+def _promedio_directo(curso, id_estudiante):
+    suma_ponderada = suma_pesos = 0.0
+    for ev in curso.evaluaciones:
+        pct = ev.obtener_porcentaje(id_estudiante)
+        if pct is not None:
+            suma_ponderada += pct * ev.peso
+            suma_pesos += ev.peso
+    return suma_ponderada / suma_pesos if suma_pesos else None
+
+def _plataforma_con_curso():
+    pl = Plataforma()
+    pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+    for i in range(3):
+        pl.registrar_usuario(Estudiante(f"e{i}", f"Estudiante {i}", f"e{i}@uni.edu", f"C{i}"))
+        if i == 0:
+            pl.crear_curso("Cálculo", "MAT1", "p1")
+        pl.inscribir_estudiante("MAT1", f"e{i}")
+    return pl
+
+def test_promedio_no_depende_del_historial_de_ediciones():
+    import random
+    rnd = random.Random(11)
+    for _ in range(200):
+        pl = _plataforma_con_curso()
+        a = pl.crear_evaluacion("MAT1", "tarea", "A", 30, peso=0.3)
+        b = pl.crear_evaluacion("MAT1", "tarea", "B", 10, peso=0.7)
+        for _ in range(rnd.randrange(1, 5)):
+            pl.registrar_calificacion("MAT1", a.id, "e0", rnd.uniform(0, 30))
+            pl.registrar_calificacion("MAT1", b.id, "e0", rnd.uniform(0, 10))
+        pl.registrar_calificacion("MAT1", a.id, "e0", 18)
+        pl.registrar_calificacion("MAT1", b.id, "e0", 6)
+        # exactamente el valor del cálculo directo: en el umbral no aparece
+        assert pl.obtener_promedio_estudiante_en_curso("MAT1", "e0") == _promedio_directo(pl.cursos["MAT1"], "e0")
+        assert pl.reporte_estudiantes_promedio_bajo("MAT1", 60) == []
+
+def test_promedio_igual_al_calculo_directo_en_cualquier_orden():
+    import random
+    rnd = random.Random(5)
+    pl = _plataforma_con_curso()
+    evaluaciones = [pl.crear_evaluacion("MAT1", "tarea", f"T{k}", rnd.choice((7, 10, 30)), peso=rnd.choice((0.1, 0.3, 0.7, 2)))
+                    for k in range(6)]
+    curso = pl.cursos["MAT1"]
+    for _ in range(500):
+        ev = rnd.choice(evaluaciones)
+        id_estudiante = f"e{rnd.randrange(3)}"
+        if rnd.random() < 0.1:
+            ev.peso = rnd.choice((0.2, 0.5, 1.5))
+        else:
+            pl.registrar_calificacion("MAT1", ev.id, id_estudiante, rnd.uniform(0, ev.max_puntos))
+        assert pl.obtener_promedio_estudiante_en_curso("MAT1", id_estudiante) == _promedio_directo(curso, id_estudiante)
+
+def test_modelo_admite_atributos_propios_e_ids_no_textuales():
+    # el modo compacto solo cambia las columnas de calificaciones: el modelo
+    # sigue siendo de objetos comunes, en cualquier modo
+    examen = Examen(1, "Parcial", 100)
+    examen.tipo = "final"
+    assert examen.tipo == "final" and Tarea(2, "T", 10).tipo == "tarea"
+    for objeto in (Usuario("u1", "Invitado", "i@uni.edu"), Evaluacion(3, "Quiz", 5), examen,
+                   Curso("Cálculo", "MAT1", Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))):
+        objeto.nota = "extra"
+        assert objeto.nota == "extra"
+    for compacto in (False, True):
+        pl = Plataforma(compacto=compacto)
+        pl.registrar_usuario(Profesor(1, "Ana", "ana@uni.edu", "Matemática"))
+        pl.registrar_usuario(Estudiante(10, "Eva", "eva@uni.edu", "C10"))
+        pl.crear_curso("Cálculo", 7, 1)
+        pl.inscribir_estudiante(7, 10)
+        ev = pl.crear_evaluacion(7, "examen", "Parcial", 100)
+        pl.registrar_calificacion(7, ev.id, 10, 80)
+        assert pl.obtener_promedio_estudiante_en_curso(7, 10) == 80.0
@@ -0,0 +1,161 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Examen, Plataforma, Profesor, Tarea, Usuario
+from plataforma.motor_sqlite import PlataformaSQLite
+
+# Las mismas operaciones y los mismos errores contra los dos motores
+
+@pytest.fixture(params=["memoria", "sqlite"])
+def pl(request, tmp_path):
+    if request.param == "memoria":
+        yield Plataforma()
+        return
+    motor = PlataformaSQLite(str(tmp_path / "plataforma.db"))
+    yield motor
+    motor.cerrar()
+
+@pytest.fixture
+def poblada(pl):
+    pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+    pl.registrar_usuario(Profesor("p2", "Luis", "luis@uni.edu", "Física"))
+    for i in range(4):
+        pl.registrar_usuario(Estudiante(f"e{i}", f"Estudiante {i}", f"e{i}@uni.edu", f"C{i}"))
+    pl.registrar_usuario(Usuario("u1", "Invitado", "invitado@uni.edu"))
+    pl.crear_curso("Cálculo", "MAT1", "p1")
+    pl.crear_curso("Mecánica", "FIS1", "p2", creditos=4)
+    for i in range(3):
+        pl.inscribir_estudiante("MAT1", f"e{i}")
+    return pl
+
+def error(funcion, *args, **kwargs) -> str:
+    with pytest.raises(ValueError) as info:
+        funcion(*args, **kwargs)
+    return str(info.value)
+
+def test_registro_usuarios_duplicados(poblada):
+    assert error(poblada.registrar_usuario, Estudiante("e0", "Otro", "otro@uni.edu", "C99")) == "Usuario ya registrado"
+    assert error(poblada.registrar_usuario, Estudiante("e9", "Otro", "otro@uni.edu", "C1")) == "Carnet ya registrado"
+    assert error(poblada.registrar_usuario, Profesor("p9", "Otro", "  ANA@uni.edu ", "X")) == "Correo ya registrado"
+    poblada.registrar_usuario(Estudiante("e9", "Nuevo", "nuevo@uni.edu", "C9"))
+    assert poblada.buscar_por_carnet("C9").id == "e9"
+
+def test_correo_unicode(poblada):
+    poblada.registrar_usuario(Profesor("p3", "Ángel", "Ángel.Núñez@uni.edu", "Química"))
+    assert error(poblada.registrar_usuario, Estudiante("e9", "Otro", " ángel.núñez@UNI.edu", "C9")) == "Correo ya registrado"
+    assert poblada.buscar_por_correo("ÁNGEL.NÚÑEZ@uni.edu").id == "p3"
+    assert poblada.buscar_por_correo("") is None
+
+def test_busquedas(poblada):
+    assert poblada.buscar_por_carnet("C2").id == "e2"
+    assert poblada.buscar_por_carnet("C77") is None
+    encontrado = poblada.buscar_por_correo(" LUIS@uni.edu")
+    assert isinstance(encontrado, Profesor) and encontrado.id == "p2"
+    assert isinstance(poblada.buscar_por_correo("invitado@uni.edu"), Usuario)
+    assert poblada.buscar_por_correo("nadie@uni.edu") is None
+
+def test_listados_en_orden_de_registro(poblada):
+    assert [p.id for p in poblada.listar_profesores()] == ["p1", "p2"]
+    cursos = poblada.listar_cursos()
+    assert [(c.codigo, c.profesor.id, c.creditos) for c in cursos] == [("MAT1", "p1", 1.0), ("FIS1", "p2", 4.0)]
+
+def test_errores_de_cursos(poblada):
+    assert error(poblada.crear_curso, "Otro", "MAT1", "p1") == "Código de curso ya existente"
+    assert error(poblada.crear_curso, "Otro", "X1", "p9") == "Profesor inválido o no encontrado"
+    assert error(poblada.crear_curso, "Otro", "X1", "e0") == "Profesor inválido o no encontrado"
+    assert error(poblada.crear_curso, "Otro", "X1", "p1", creditos=-1) == "creditos debe ser >= 0"
+
+def test_errores_de_inscripcion(poblada):
+    assert error(poblada.inscribir_estudiante, "X1", "e0") == "Curso no encontrado"
+    assert error(poblada.inscribir_estudiante, "MAT1", "p1") == "Usuario no es estudiante o no encontrado"
+    assert error(poblada.inscribir_estudiante, "MAT1", "zz") == "Usuario no es estudiante o no encontrado"
+    assert error(poblada.inscribir_estudiante, "MAT1", "e0") == "Estudiante ya inscrito en el curso"
+
+def test_evaluaciones(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "Examen", "Parcial", 100, peso=2)
+    tarea = poblada.crear_evaluacion("MAT1", "tarea", "Tarea 1", 10)
+    assert isinstance(examen, Examen) and isinstance(tarea, Tarea)
+    assert (examen.id, tarea.id) == (1, 2)
+    assert error(poblada.crear_evaluacion, "X1", "tarea", "T", 10) == "Curso no encontrado"
+    assert error(poblada.crear_evaluacion, "MAT1", "tarea", "T", 0) == "max_puntos debe ser > 0"
+    # el ID de la evaluación inválida queda consumido en ambos motores
+    assert poblada.crear_evaluacion("FIS1", "otro", "Lab", 20).id == 4
+
+def test_calificaciones_y_promedios(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "examen", "Parcial", 100, peso=2)
+    tarea = poblada.crear_evaluacion("MAT1", "tarea", "Tarea", 10)
+    poblada.registrar_calificacion("MAT1", examen.id, "e0", 80)
+    poblada.registrar_calificacion("MAT1", tarea.id, "e0", 5)
+    poblada.registrar_calificacion("MAT1", examen.id, "e1", 30)
+    poblada.registrar_calificacion("MAT1", examen.id, "e1", 40)
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e0") == pytest.approx((80 * 2 + 50) / 3)
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e1") == pytest.approx(40)
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e2") is None
+    assert error(poblada.obtener_promedio_estudiante_en_curso, "X1", "e0") == "Curso no encontrado"
+
+def test_errores_de_calificacion(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "examen", "Parcial", 100)
+    lab = poblada.crear_evaluacion("FIS1", "tarea", "Lab", 10)
+    assert error(poblada.registrar_calificacion, "X1", examen.id, "e0", 50) == "Curso no encontrado"
+    assert error(poblada.registrar_calificacion, "MAT1", lab.id, "e0", 5) == "Evaluación no encontrada en el curso"
+    assert error(poblada.registrar_calificacion, "MAT1", 99, "e0", 5) == "Evaluación no encontrada en el curso"
+    assert error(poblada.registrar_calificacion, "MAT1", examen.id, "p1", 50) == "Usuario no es estudiante o no existe"
+    assert error(poblada.registrar_calificacion, "MAT1", examen.id, "e0", 101) == "Puntos fuera de rango"
+    assert error(poblada.registrar_calificacion, "MAT1", examen.id, "e0", -1) == "Puntos fuera de rango"
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e0") is None
+
+def test_lote_valido(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "examen", "Parcial", 100)
+    assert poblada.registrar_calificaciones_lote("MAT1", examen.id, [("e0", 90), ("e1", "45.5"), ("e0", 70)]) == []
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e0") == pytest.approx(70)
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e1") == pytest.approx(45.5)
+
+def test_lote_con_errores_no_aplica_nada(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "examen", "Parcial", 100)
+    filas = [("e0", 90), ("zz", 10), ("e1", "x"), ("e2", 150), ("e3",), None, ("e1", 20)]
+    assert poblada.registrar_calificaciones_lote("MAT1", examen.id, filas) == [
+        {'fila': 1, 'id': "zz", 'error': "Usuario no es estudiante o no existe"},
+        {'fila': 2, 'id': "e1", 'error': "Puntos no numéricos"},
+        {'fila': 3, 'id': "e2", 'error': "Puntos fuera de rango"},
+        {'fila': 4, 'id': None, 'error': "Fila inválida"},
+        {'fila': 5, 'id': None, 'error': "Fila inválida"},
+    ]
+    assert poblada.obtener_promedio_estudiante_en_curso("MAT1", "e0") is None
+    assert error(poblada.registrar_calificaciones_lote, "MAT1", 99, [("e0", 1)]) == "Evaluación no encontrada en el curso"
+    assert error(poblada.registrar_calificaciones_lote, "X1", examen.id, [("e0", 1)]) == "Curso no encontrado"
+
+def test_reporte_promedio_bajo(poblada):
+    examen = poblada.crear_evaluacion("MAT1", "examen", "Parcial", 100)
+    poblada.registrar_calificaciones_lote("MAT1", examen.id, [("e0", 90), ("e1", 40), ("e2", 59.994)])
+    assert poblada.reporte_estudiantes_promedio_bajo("MAT1", 60) == [
+        {'id': "e1", 'nombre': "Estudiante 1", 'promedio': 40.0},
+        {'id': "e2", 'nombre': "Estudiante 2", 'promedio': 59.99},
+    ]
+    assert poblada.reporte_estudiantes_promedio_bajo("FIS1", 60) == []
+    assert error(poblada.reporte_estudiantes_promedio_bajo, "X1", 60) == "Curso no encontrado"
+
+def test_migracion_correo_norm(tmp_path):
+    # una base creada antes de correo_norm se migra al abrirla
+    import sqlite3
+    ruta = str(tmp_path / "vieja.db")
+    db = sqlite3.connect(ruta)
+    db.executescript("""
+        CREATE TABLE usuarios (id TEXT PRIMARY KEY, tipo TEXT NOT NULL, nombre TEXT NOT NULL, correo TEXT NOT NULL,
+                               carnet TEXT, departamento TEXT);
+        CREATE INDEX ix_usuarios_correo ON usuarios (lower(trim(correo)));
+        INSERT INTO usuarios VALUES ('p1', 'profesor', 'Ángel', ' Ángel@uni.edu', NULL, 'Química');
+    """)
+    db.close()
+    motor = PlataformaSQLite(ruta)
+    try:
+        assert motor.buscar_por_correo("ángel@UNI.edu").id == "p1"
+        assert error(motor.registrar_usuario, Estudiante("e1", "Otro", "ÁNGEL@uni.edu", "C1")) == "Correo ya registrado"
+    finally:
+        motor.cerrar()
+    motor = PlataformaSQLite(ruta)
+    assert motor.buscar_por_correo("Ángel@uni.edu").id == "p1"
+    motor.cerrar()
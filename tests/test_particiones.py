@@ -0,0 +1,35 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Curso, Estudiante, Plataforma, Profesor
+from plataforma.particiones import PlataformaParticionada
+
+def test_expediente_usa_la_cache_de_las_particiones_activas(tmp_path, monkeypatch):
+    pp = PlataformaParticionada(directorio=str(tmp_path), periodo_actual="A")
+    plana = Plataforma()
+    for pl in (pp, plana):
+        pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+        pl.registrar_usuario(Estudiante("e1", "Eva", "eva@uni.edu", "C1"))
+    for periodo, codigo, creditos, puntos in (("A", "MAT1", 4, 81.237), ("B", "MAT2", 3, 55.5), ("C", "MAT3", 2, 92)):
+        if periodo != "A":
+            pp.abrir_periodo(periodo)
+        for pl in (pp, plana):
+            pl.crear_curso(codigo, codigo, "p1", creditos=creditos)
+            pl.inscribir_estudiante(codigo, "e1")
+            pl.registrar_calificacion(codigo, pl.crear_evaluacion(codigo, "examen", "Parcial", 100).id, "e1", puntos)
+    pp.congelar("A")
+    assert pp.obtener_expediente("e1") == plana.obtener_expediente("e1")
+
+    calculados = []
+    promedio = Curso.obtener_promedio_estudiante
+    monkeypatch.setattr(Curso, "obtener_promedio_estudiante", lambda self, i: calculados.append(self.codigo) or promedio(self, i))
+    pp.obtener_expediente("e1")
+    assert calculados == []
+    # una escritura invalida solo el curso tocado
+    for pl in (pp, plana):
+        pl.registrar_calificacion("MAT2", pl.crear_evaluacion("MAT2", "tarea", "T", 10).id, "e1", 3)
+    calculados.clear()
+    assert pp.obtener_expediente("e1") == plana.obtener_expediente("e1")
+    assert calculados.count("MAT2") == 2 and "MAT3" not in calculados
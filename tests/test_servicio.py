@@ -0,0 +1,99 @@
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plataforma import Estudiante, Plataforma, Profesor
+from plataforma.servicio import Servicio
+
+def _conversar(solicitudes):
+    # envía todas las líneas de una vez (pipelining) y lee una respuesta por línea
+    async def conversar():
+        pl = Plataforma(concurrente=True)
+        pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+        pl.registrar_usuario(Estudiante("e1", "Eva", "eva@uni.edu", "C1"))
+        pl.crear_curso("Cálculo", "MAT1", "p1")
+        servicio = Servicio(pl)
+        servidor = await servicio.iniciar(puerto=0)
+        puerto = servidor.sockets[0].getsockname()[1]
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        try:
+            escritor.write(b"".join(linea if isinstance(linea, bytes) else json.dumps(linea).encode() + b"\n"
+                                    for linea in solicitudes))
+            await escritor.drain()
+            return [json.loads(await asyncio.wait_for(lector.readline(), 5)) for _ in solicitudes]
+        finally:
+            escritor.close()
+            servidor.close()
+            await servidor.wait_closed()
+            servicio.ejecutor.shutdown()
+    return asyncio.run(conversar())
+
+def test_solicitudes_mal_formadas_no_cortan_la_conexion():
+    respuestas = _conversar([
+        {"id": 1, "op": "promedio", "args": "x"},
+        {"id": 2, "op": "inscribir_estudiante", "args": ["MAT1", "e1"]},
+        [1, 2],
+        b"{no es json\n",
+        {"id": 3, "op": "nada"},
+        {"id": 4, "op": "promedio", "args": {"codigo_curso": "MAT1"}},
+        {"id": 5, "op": "inscribir_estudiante", "args": {"codigo_curso": "MAT1", "estudiante_id": "e1"}},
+        {"id": 6, "op": "listar_cursos"},
+    ])
+    assert [(r['id'], r['ok'], r.get('error')) for r in respuestas[:5]] == [
+        (1, False, "Los argumentos deben ser un objeto JSON"),
+        (2, False, "Los argumentos deben ser un objeto JSON"),
+        (None, False, "La solicitud debe ser un objeto JSON"),
+        (None, False, "JSON inválido"),
+        (3, False, "Operación desconocida"),
+    ]
+    assert respuestas[5]['id'] == 4 and not respuestas[5]['ok'] and respuestas[5]['error'].startswith("Solicitud inválida")
+    assert respuestas[6] == {'id': 5, 'ok': True, 'resultado': None}
+    assert respuestas[7]['resultado'] == [{'codigo': "MAT1", 'nombre': "Cálculo", 'profesor': "p1", 'creditos': 1.0}]
+
+def test_esperas_de_eventos_no_ocupan_el_ejecutor():
+    # más esperas largas que hilos tiene el ejecutor: antes la escritura
+    # quedaba en cola detrás de ellas hasta que vencían
+    async def probar():
+        pl = Plataforma(concurrente=True)
+        pl.registrar_usuario(Profesor("p1", "Ana", "ana@uni.edu", "Matemática"))
+        pl.registrar_usuario(Estudiante("e1", "Eva", "eva@uni.edu", "C1"))
+        pl.crear_curso("Cálculo", "MAT1", "p1")
+        pl.inscribir_estudiante("MAT1", "e1")
+        id_eval = pl.crear_evaluacion("MAT1", "examen", "Parcial", 100).id
+        servicio = Servicio(pl, hilos=2)
+        servidor = await servicio.iniciar(puerto=0)
+        puerto = servidor.sockets[0].getsockname()[1]
+        conexiones = [await asyncio.open_connection("127.0.0.1", puerto) for _ in range(5)]
+
+        async def pedir(conexion, op, **args):
+            lector, escritor = conexion
+            escritor.write(json.dumps({"op": op, "args": args}).encode() + b"\n")
+            await escritor.drain()
+            return json.loads(await lector.readline())
+
+        try:
+            suscripciones = [(await pedir(c, "suscribir", cursos=["MAT1"]))['resultado'] for c in conexiones[:4]]
+            esperas = [asyncio.ensure_future(pedir(c, "eventos", suscripcion=s, espera=5))
+                       for c, s in zip(conexiones, suscripciones)]
+            await asyncio.sleep(0.1)
+            inicio = time.monotonic()
+            assert (await pedir(conexiones[4], "registrar_calificacion", codigo_curso="MAT1", id_eval=id_eval,
+                                estudiante_id="e1", puntos=70))['ok']
+            assert time.monotonic() - inicio < 1
+            for respuesta in await asyncio.wait_for(asyncio.gather(*esperas), 2):
+                assert [(e['tipo'], e['puntos'], e['promedio']) for e in respuesta['resultado']] == [("calificacion", 70.0, 70.0)]
+            # sin eventos, la espera vence y devuelve un lote vacío
+            inicio = time.monotonic()
+            assert (await pedir(conexiones[0], "eventos", suscripcion=suscripciones[0], espera=0.2))['resultado'] == []
+            assert 0.15 < time.monotonic() - inicio < 1
+        finally:
+            for _, escritor in conexiones:
+                escritor.close()
+            servidor.close()
+            await servidor.wait_closed()
+            servicio.ejecutor.shutdown()
+    asyncio.run(probar())